@@ -0,0 +1,361 @@
+"""
+Activity log writer for Helix backend.
+
+ACTIVITY_LOG_MODE selects how services.log_activity() stores entries:
+
+    sync     — INSERT in the caller's transaction (default; use in tests)
+    buffered — write-behind: the entry is queued in process once the
+               caller's transaction commits and inserted with bulk_create()
+               by ActivityWriter, off the latency path of the mutation
+
+The buffered queue is flushed when it reaches ACTIVITY_LOG_BATCH_SIZE,
+every ACTIVITY_LOG_FLUSH_INTERVAL seconds by a background thread, when
+each HTTP request finishes (request_finished, after the response has been
+sent) and at interpreter exit.
+
+The log stays complete:
+
+    - Queued entries are also appended to a spool file of this process
+      in ACTIVITY_LOG_SPOOL_DIR. Each flush starts a new file and deletes
+      the old ones once their entries are inserted. Spools left behind
+      by a process that died are replayed by the next writer to start;
+      RequestActivity.log_id keeps an entry from being inserted twice.
+    - A flush that fails is put back and retried, never dropped. While
+      the last flush failed, or once ACTIVITY_LOG_MAX_PENDING entries
+      are queued, record() falls back to inserting in the caller's
+      transaction, so an outage cannot grow the queue without bound.
+
+The spool is written without fsync: it survives the process dying, not
+the machine.
+
+Entries keep the time of the action (RequestActivity.timestamp is set
+when they are queued) but take their change feed position (change_seq)
+when they are inserted, so feed clients get them however late the flush.
+"""
+
+import atexit
+import json
+import logging
+import os
+import socket
+import threading
+import uuid
+from functools import partial
+from pathlib import Path
+
+from django.conf import settings
+from django.db import DatabaseError, close_old_connections, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from core.models import ChangeSequence, Request, RequestActivity, User
+
+logger = logging.getLogger(__name__)
+
+
+class ActivitySpool:
+    """
+    Append-only JSON-lines files of the entries one process has queued.
+
+    Files are locked (flock) for as long as the process holds them open,
+    so an unlocked spool in the directory belongs to a process that is
+    gone and can be replayed.
+    """
+
+    fields = ("log_id", "request_id", "action", "detail", "performed_by_id", "timestamp")
+
+    def __init__(self, directory):
+        self.directory = Path(directory)
+        self._file = None
+        self._retired = []
+
+    def append(self, activities):
+        if self._file is None:
+            self._file = self._open(
+                self.directory / f"{socket.gethostname()}-{os.getpid()}-{uuid.uuid4().hex}.jsonl"
+            )
+        for activity in activities:
+            self._file.write(json.dumps(self._encode(activity)) + "\n")
+        self._file.flush()
+
+    def rotate(self):
+        """Start a new file; the current one is kept until release()."""
+        if self._file is not None:
+            self._retired.append(self._file)
+            self._file = None
+
+    def release(self):
+        """Delete the files rotated out so far, once their entries are inserted."""
+        for spool in self._retired:
+            os.unlink(spool.name)
+            spool.close()
+        self._retired = []
+
+    def orphans(self):
+        """Yield (file, activities) for each spool of a process that is gone."""
+        import fcntl
+
+        if not self.directory.is_dir():
+            return
+        own = {spool.name for spool in [self._file, *self._retired] if spool is not None}
+        for path in sorted(self.directory.glob("*.jsonl")):
+            if str(path) in own:
+                continue
+            try:
+                spool = open(path, "r+", encoding="utf-8")
+            except FileNotFoundError:
+                continue
+            try:
+                fcntl.flock(spool, fcntl.LOCK_EX | fcntl.LOCK_NB)
+            except BlockingIOError:
+                spool.close()
+                continue
+            yield spool, [self._decode(json.loads(line)) for line in spool if line.strip()]
+
+    def _open(self, path):
+        import fcntl
+
+        self.directory.mkdir(parents=True, exist_ok=True)
+        spool = open(path, "a+", encoding="utf-8")
+        fcntl.flock(spool, fcntl.LOCK_EX)
+        return spool
+
+    def _encode(self, activity):
+        entry = {field: getattr(activity, field) for field in self.fields}
+        entry["log_id"] = str(activity.log_id)
+        entry["timestamp"] = activity.timestamp.isoformat()
+        return entry
+
+    def _decode(self, entry):
+        entry["log_id"] = uuid.UUID(entry["log_id"])
+        entry["timestamp"] = parse_datetime(entry["timestamp"])
+        return RequestActivity(**entry)
+
+
+class ActivityWriter:
+    """Thread-safe write-behind queue of RequestActivity instances."""
+
+    def __init__(self, spool, batch_size=100, flush_interval=1.0, max_pending=10000):
+        self.spool = spool
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.max_pending = max_pending
+        self._failing = False
+        self._replayed = False
+        self._pending = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+        self.queued = 0
+        self.written = 0
+        self.dropped = 0
+        self.replayed = 0
+        self.sync_fallbacks = 0
+        self.flushes = 0
+        self.failures = 0
+
+    def accepting(self):
+        """
+        Whether a new entry may be queued: False while flushes fail or the
+        queue is full, and the caller must insert it itself.
+        """
+        with self._lock:
+            accepting = not self._failing and len(self._pending) < self.max_pending
+            if not accepting:
+                self.sync_fallbacks += 1
+            return accepting
+
+    def add(self, activity):
+        """Queue (and spool) an unsaved activity; a full batch wakes the flusher."""
+        with self._lock:
+            try:
+                self.spool.append([activity])
+            except OSError as e:
+                # Still queued; stop buffering until a flush goes through
+                self._failing = True
+                logger.error(f"[ACTIVITY] Could not spool activity {activity.log_id}: {e}")
+            self._pending.append(activity)
+            self.queued += 1
+            full = len(self._pending) >= self.batch_size
+        self.start()
+        if full:
+            self._wakeup.set()
+
+    def flush(self):
+        """Insert everything queued so far. Returns the number of rows written."""
+        # One flush at a time, so a batch that failed is retried in order
+        with self._flush_lock:
+            with self._lock:
+                batch, self._pending = self._pending, []
+                self.spool.rotate()
+            if not batch:
+                return 0
+
+            try:
+                written = self._insert(batch)
+            except DatabaseError as e:
+                with self._lock:
+                    self._pending[:0] = batch
+                    self._failing = True
+                    self.failures += 1
+                logger.error(
+                    f"[ACTIVITY] Flush of {len(batch)} activities failed, will retry: {e}"
+                )
+                return 0
+
+            with self._lock:
+                self.spool.release()
+                self._failing = False
+                self.written += written
+                self.flushes += 1
+            return written
+
+    def replay(self):
+        """
+        Insert the spools left by processes that died before flushing.
+        Returns False if one could not be written (it is kept for later).
+        """
+        for spool, batch in self.spool.orphans():
+            try:
+                written = self._insert(batch)
+            except DatabaseError as e:
+                logger.error(f"[ACTIVITY] Replay of {spool.name} failed, will retry: {e}")
+                spool.close()
+                return False
+            os.unlink(spool.name)
+            spool.close()
+            with self._lock:
+                self.replayed += written
+            logger.info(f"[ACTIVITY] Replayed {written} activities from {spool.name}")
+        return True
+
+    def _insert(self, batch):
+        # Positioned in the change feed when inserted, not queued
+        with ChangeSequence.batch():
+            batch = self._drop_orphans(batch)
+            # Entries already inserted before a crash are skipped by log_id
+            RequestActivity.objects.bulk_create(
+                batch, batch_size=self.batch_size, ignore_conflicts=True
+            )
+            ChangeSequence.track_rows(
+                RequestActivity,
+                RequestActivity.objects.filter(
+                    log_id__in=[activity.log_id for activity in batch]
+                ).values_list("pk", flat=True),
+            )
+        return len(batch)
+
+    def _drop_orphans(self, batch):
+        """
+        Drop entries whose request was deleted while they were queued (the
+        cascade would have removed them) and null out deleted performers.
+        """
+        request_ids = {activity.request_id for activity in batch}
+        live_requests = set(
+            Request.objects.filter(pk__in=request_ids).values_list("pk", flat=True)
+        )
+        user_ids = {activity.performed_by_id for activity in batch} - {None}
+        live_users = set(User.objects.filter(pk__in=user_ids).values_list("pk", flat=True))
+
+        kept = []
+        for activity in batch:
+            if activity.request_id not in live_requests:
+                continue
+            if activity.performed_by_id not in live_users:
+                activity.performed_by = None
+            kept.append(activity)
+
+        if len(kept) < len(batch):
+            with self._lock:
+                self.dropped += len(batch) - len(kept)
+        return kept
+
+    @property
+    def pending(self):
+        with self._lock:
+            return len(self._pending)
+
+    def stats(self):
+        with self._lock:
+            return {
+                "mode": settings.ACTIVITY_LOG_MODE,
+                "pending": len(self._pending),
+                "failing": self._failing,
+                "queued": self.queued,
+                "written": self.written,
+                "dropped": self.dropped,
+                "replayed": self.replayed,
+                "sync_fallbacks": self.sync_fallbacks,
+                "flushes": self.flushes,
+                "failures": self.failures,
+            }
+
+    # ── Background flusher ───────────────────────────────────────
+
+    def start(self):
+        """Start the background flusher (which first replays orphaned spools)."""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        with self._lock:
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(
+                    target=self._run, name="activity-log-writer", daemon=True
+                )
+                self._thread.start()
+
+    def _run(self):
+        while True:
+            if not self._replayed:
+                close_old_connections()
+                self._replayed = self.replay()
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            if self.pending:
+                close_old_connections()
+                self.flush()
+
+    def close(self):
+        """Final flush at exit; whatever cannot be written stays in the spool."""
+        self.flush()
+        if self.pending:
+            logger.error(
+                f"[ACTIVITY] {self.pending} activities left in the spool for the next process"
+            )
+
+
+writer = ActivityWriter(
+    ActivitySpool(settings.ACTIVITY_LOG_SPOOL_DIR),
+    batch_size=settings.ACTIVITY_LOG_BATCH_SIZE,
+    flush_interval=settings.ACTIVITY_LOG_FLUSH_INTERVAL,
+    max_pending=settings.ACTIVITY_LOG_MAX_PENDING,
+)
+
+if settings.ACTIVITY_LOG_MODE == "buffered":
+    atexit.register(writer.close)
+
+
+def record(activity):
+    """
+    Store an unsaved RequestActivity according to ACTIVITY_LOG_MODE.
+
+    In buffered mode the entry is queued when the current transaction
+    commits (and never if it rolls back), or inserted in the transaction
+    while the writer cannot take it (see ActivityWriter.accepting()).
+    """
+    if settings.ACTIVITY_LOG_MODE != "buffered" or not writer.accepting():
+        activity.save()
+        return activity
+
+    activity.timestamp = timezone.now()
+    activity.log_id = uuid.uuid4()
+    transaction.on_commit(partial(writer.add, activity))
+    return activity
+
+
+def flush():
+    """Write queued activities now (no-op in sync mode)."""
+    if settings.ACTIVITY_LOG_MODE == "buffered":
+        writer.start()
+        return writer.flush()
+    return 0
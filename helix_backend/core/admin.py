@@ -2,9 +2,12 @@
 Django Admin Configuration for Helix Platform — Phase 2
 """
 
+from django import forms
 from django.contrib import admin
 
-from core.models import User, Request, RequestActivity
+from core import services
+from core.models import User, Request, RequestActivity, RequestCounter, RequestTombstone
+from core.workflow import workflow
 
 
 @admin.register(User)
@@ -21,8 +24,24 @@ class UserAdmin(admin.ModelAdmin):
     )
 
 
+class RequestAdminForm(forms.ModelForm):
+    """Status edits follow the workflow, as they do through the API."""
+
+    class Meta:
+        model = Request
+        fields = "__all__"
+
+    def clean_status(self):
+        new_status = self.cleaned_data["status"]
+        old_status = self.instance.status
+        if self.instance.pk and new_status != old_status:
+            workflow.validate(old_status, new_status, User.Role.ADMIN)
+        return new_status
+
+
 @admin.register(Request)
 class RequestAdmin(admin.ModelAdmin):
+    form = RequestAdminForm
     list_display = [
         "id", "title", "get_user_email", "status", "priority",
         "get_assigned_to", "created_at", "updated_at",
@@ -38,6 +57,10 @@ class RequestAdmin(admin.ModelAdmin):
         ("Timestamps", {"fields": ("created_at", "updated_at"), "classes": ("collapse",)}),
     )
 
+    def save_model(self, request, obj, form, change):
+        # Through the service layer, so the request counters follow the edit
+        services.save_request(obj)
+
     @admin.display(description="User Email", ordering="user__email")
     def get_user_email(self, obj):
         return obj.user.email
@@ -64,6 +87,27 @@ class RequestActivityAdmin(admin.ModelAdmin):
         return obj.performed_by.email if obj.performed_by else "—"
 
 
+@admin.register(RequestCounter)
+class RequestCounterAdmin(admin.ModelAdmin):
+    list_display = ["dimension", "value", "count", "updated_at"]
+    list_filter = ["dimension"]
+    readonly_fields = ["dimension", "value", "count", "updated_at"]
+    ordering = ["dimension", "value"]
+
+    def has_add_permission(self, request):
+        return False  # Maintained by core.services / rebuild_request_counters
+
+
+@admin.register(RequestTombstone)
+class RequestTombstoneAdmin(admin.ModelAdmin):
+    list_display = ["id", "request_id", "owner_id", "deleted_at"]
+    readonly_fields = ["request_id", "owner_id", "deleted_at"]
+    ordering = ["-deleted_at"]
+
+    def has_add_permission(self, request):
+        return False  # Written when requests are deleted; see prune_tombstones
+
+
 # ── Admin site branding ──────────────────────────────────────────
 admin.site.site_header = "Helix Platform Admin"
 admin.site.site_title = "Helix Admin"
@@ -5,3 +5,6 @@ class CoreConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'core'
     verbose_name = 'Helix Core'
+
+    def ready(self):
+        from core import checks, signals  # noqa: F401  (registers checks, connects signal handlers)
@@ -0,0 +1,246 @@
+"""
+Async versions of the hot read endpoints, for ASGI deployments.
+
+    GET /api/auth/me/
+    GET /api/requests/                          (POST and ?page=N: sync view)
+    GET /api/requests/<id>/activities/
+    GET /api/admin/requests/                    (?page=N: sync view)
+    GET /api/admin/requests/<id>/activities/
+
+core.urls routes these paths here when ASYNC_VIEWS is set. The DRF views
+in core.views still build the querysets, validators and responses, so
+filtering, ordering, cursors, ETags, the response cache and the JSON
+output are unchanged; only the I/O differs:
+
+    authentication — FirebaseAuthentication.aauthenticate(): answered
+                     from token_cache / user_cache on the event loop,
+                     signature checks and user sync in a worker thread
+    database       — afirst() for the validators, `async for` over
+                     the page queryset
+    response cache — cache.aget() / cache.aset()
+    replica reads  — stickiness checked with cache.aget()
+                     (core.db.routers.astart_replica_reads)
+
+Anything else (other methods, page-number mode, filters that validate
+against the database) runs the sync view in a thread, as Django does for
+every sync view under ASGI. Under WSGI these views work but gain nothing.
+"""
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.http import HttpResponse
+from django.utils.cache import get_conditional_response
+from rest_framework import authentication, exceptions, status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core import response_cache
+from core.authentication import FirebaseAuthentication
+from core.db import routers
+from core.models import ChangeSequence
+from core.serializers import RequestListSerializer
+from core.views import (
+    AdminRequestActivitiesView,
+    AdminRequestListView,
+    AuthMeView,
+    UserRequestActivitiesView,
+    UserRequestListCreateView,
+)
+
+
+class PreAuthenticated(authentication.BaseAuthentication):
+    """
+    Hands DRF the outcome of an authentication already done asynchronously,
+    so request.user, permission checks and 401 responses work as usual.
+    """
+
+    def __init__(self, result=None, error=None):
+        self.result = result
+        self.error = error
+
+    def authenticate(self, request):
+        if self.error is not None:
+            raise self.error
+        return self.result
+
+    def authenticate_header(self, request):
+        return FirebaseAuthentication().authenticate_header(request)
+
+
+class AsyncAPIView:
+    """
+    Runs the GET handler of `sync_view_class` as a coroutine.
+
+    Mirrors APIView.dispatch() on an instance of the sync view (content
+    negotiation, permissions, exception handling, finalize_response), with
+    authentication awaited beforehand and get() defined here.
+    """
+
+    sync_view_class = None
+
+    @classmethod
+    def as_view(cls):
+        sync_view = sync_to_async(cls.sync_view_class.as_view())
+
+        async def view(request, *args, **kwargs):
+            if request.method != "GET" or cls.use_sync_view(request):
+                return await sync_view(request, *args, **kwargs)
+            return await cls().dispatch(request, *args, **kwargs)
+
+        # Token authentication, like the DRF views
+        view.csrf_exempt = True
+        view.view_class = cls
+        return view
+
+    @classmethod
+    def use_sync_view(cls, request):
+        return False
+
+    async def dispatch(self, request, *args, **kwargs):
+        try:
+            authenticator = PreAuthenticated(await FirebaseAuthentication().aauthenticate(request))
+        except exceptions.AuthenticationFailed as e:
+            authenticator = PreAuthenticated(error=e)
+
+        view = self.view = self.sync_view_class()
+        view.setup(request, *args, **kwargs)
+        request = Request(
+            request,
+            parsers=view.get_parsers(),
+            authenticators=[authenticator],
+            negotiator=view.get_content_negotiator(),
+            parser_context=view.get_parser_context(request),
+        )
+        view.request = request
+        view.headers = view.default_response_headers
+
+        # The stickiness check of ReplicaReadMixin.initial() is a cache
+        # read: done below with cache.aget() instead of on the event loop
+        replica_reads = getattr(view, "replica_reads", False)
+        view.replica_reads = False
+        try:
+            view.initial(request, *args, **kwargs)
+            if replica_reads:
+                view.replica_token = await routers.astart_replica_reads(request.user)
+            response = await self.get(request, *args, **kwargs)
+        except Exception as exc:
+            response = view.handle_exception(exc)
+
+        response = view.finalize_response(request, response, *args, **kwargs)
+        if not isinstance(response, Response):
+            return response
+        # Rendered here: Django would render a deferred response in a thread
+        response.render()
+        return HttpResponse(
+            response.content, status=response.status_code, headers=response.headers
+        )
+
+    async def get(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+
+class AsyncAuthMeView(AsyncAPIView):
+    """GET /api/auth/me/ — AuthMeView.get() needs nothing but request.user."""
+
+    sync_view_class = AuthMeView
+
+    async def get(self, request, *args, **kwargs):
+        return self.view.get(request)
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  Lists
+# ═══════════════════════════════════════════════════════════════════
+
+
+class AsyncListView(AsyncAPIView):
+    """
+    ConditionalListMixin.list() with the async ORM: afirst() on the
+    ChangeSequence row for the ETag, then the keyset page read with `async for`.
+    """
+
+    # Filters whose validation queries the database (ModelChoiceFilter);
+    # filter_queryset() runs in a thread when one is present
+    sync_filter_params = ()
+
+    @classmethod
+    def use_sync_view(cls, request):
+        paginator_class = cls.sync_view_class.pagination_class
+        page_number_class = getattr(paginator_class, "page_number_class", None)
+        return page_number_class is not None and page_number_class.page_query_param in request.GET
+
+    async def get(self, request, *args, **kwargs):
+        view = self.view
+        if any(name in request.query_params for name in self.sync_filter_params):
+            queryset = await sync_to_async(view.filter_queryset)(view.get_queryset())
+        else:
+            queryset = view.filter_queryset(view.get_queryset())
+
+        version = await (
+            ChangeSequence.objects.using(queryset.db)
+            .filter(pk=1)
+            .values_list("value", "updated_at")
+            .afirst()
+        )
+        etag, last_modified = view.make_list_validators(version)
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            paginator = view.paginator
+            page = paginator.get_page_queryset(self.get_list_queryset(queryset), request, view)
+            rows = paginator.set_page([row async for row in page])
+            response = Response(paginator.get_paginated_data(self.serialize(rows)))
+        return view.set_validator_headers(response, etag, last_modified)
+
+    def get_list_queryset(self, queryset):
+        return queryset
+
+    def serialize(self, rows):
+        return self.view.get_serializer(rows, many=True).data
+
+
+class AsyncRequestListView(AsyncListView):
+    """RequestListMixin (values() rows) + ResponseCacheMixin."""
+
+    def get_list_queryset(self, queryset):
+        return queryset.values(*RequestListSerializer.values_fields)
+
+    def serialize(self, rows):
+        return RequestListSerializer(
+            rows, many=True, context=self.view.get_serializer_context()
+        ).data
+
+    async def get(self, request, *args, **kwargs):
+        if settings.RESPONSE_CACHE_TTL <= 0:
+            return await super().get(request, *args, **kwargs)
+
+        view = self.view
+        key = await response_cache.amake_key(request, view.get_response_cache_scope(request))
+        entry = await response_cache.aget_entry(key)
+        if entry is not None:
+            etag, last_modified, data = entry
+            response = get_conditional_response(request, etag=etag) or Response(data)
+            return view.set_validator_headers(response, etag, last_modified)
+
+        response = await super().get(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            await response_cache.astore_entry(
+                key, (response["ETag"], response.get("Last-Modified"), response.data)
+            )
+        return response
+
+
+class AsyncUserRequestListView(AsyncRequestListView):
+    sync_view_class = UserRequestListCreateView
+
+
+class AsyncAdminRequestListView(AsyncRequestListView):
+    sync_view_class = AdminRequestListView
+    sync_filter_params = ("assigned_to",)
+
+
+class AsyncUserRequestActivitiesView(AsyncListView):
+    sync_view_class = UserRequestActivitiesView
+
+
+class AsyncAdminRequestActivitiesView(AsyncListView):
+    sync_view_class = AdminRequestActivitiesView
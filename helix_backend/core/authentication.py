@@ -7,24 +7,382 @@ Verifies Firebase ID tokens sent as:
 On success, returns (User, decoded_token) so that:
     request.user  → core.models.User instance
     request.auth  → decoded Firebase token dict
+
+Verified tokens are kept in a bounded in-process LRU cache (token_cache)
+until their `exp` claim, so repeat requests with the same ID token skip
+the RSA signature check. The matching User is kept in user_cache, so a
+repeat request whose uid and email still match needs no database access.
+
+The identity backend is selected with IDENTITY_BACKEND:
+    firebase — Firebase ID tokens (default). Verification is pluggable
+               via AUTH_TOKEN_VERIFIER:
+                   firebase_sdk — firebase_admin.auth.verify_id_token()
+                   local        — RS256 verification against a local
+                                  SigningKeyStore (see core.keystore)
+    local    — tokens minted by core.identity.LocalIdentityProvider, for
+               load tests and benchmarks without Firebase
 """
 
+import copy
+import hashlib
 import logging
+import threading
+import time
+from collections import OrderedDict
 
+import jwt
+from asgiref.sync import sync_to_async
+from django.conf import settings
 from rest_framework import authentication, exceptions
-from firebase_admin import auth
 
+from core import firebase
+from core.identity import LocalIdentityProvider
+from core.keystore import SigningKeyStore
 from core.models import User
 
 logger = logging.getLogger(__name__)
 
 
+class ExpiringLRUCache:
+    """
+    Thread-safe, bounded LRU cache whose entries carry their own expiry time.
+
+    When the cache is full the least recently used entry is evicted.
+    A max_size of 0 disables caching.
+    """
+
+    def __init__(self, max_size=1024):
+        self.max_size = max_size
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key):
+        """Return the cached value, or None on miss/expiry."""
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= now:
+                self._discard(key)
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def set(self, key, value, expires_at):
+        """Store a value until the given epoch timestamp."""
+        if self.max_size <= 0 or expires_at <= time.time():
+            return
+        with self._lock:
+            self._entries[key] = (expires_at, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._discard(next(iter(self._entries)))
+                self.evictions += 1
+
+    def delete(self, key):
+        with self._lock:
+            self._discard(key)
+
+    def _discard(self, key):
+        """Remove an entry. Caller must hold the lock."""
+        self._entries.pop(key, None)
+
+    def clear(self):
+        """Drop all entries and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self):
+        """Return a snapshot of the cache size and hit/miss counters."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
+
+
+class VerifiedTokenCache(ExpiringLRUCache):
+    """
+    Cache of decoded ID tokens.
+
+    Entries are keyed by the SHA-256 digest of the raw token (the token
+    itself is never stored) and expire at the token's `exp` claim.
+    """
+
+    @staticmethod
+    def _key(token):
+        return hashlib.sha256(token.encode("utf-8")).digest()
+
+    def get(self, token):
+        """Return a copy of the cached decoded token, or None."""
+        decoded = super().get(self._key(token))
+        return dict(decoded) if decoded is not None else None
+
+    def set(self, token, decoded):
+        """Cache a decoded token until its `exp` claim. Tokens without exp are skipped."""
+        try:
+            expires_at = float(decoded["exp"])
+        except (KeyError, TypeError, ValueError):
+            return
+        super().set(self._key(token), dict(decoded), expires_at)
+
+
+class UserCache(ExpiringLRUCache):
+    """
+    uid → User cache for the authentication fast path.
+
+    Entries live for `ttl` seconds and are dropped by the User post_save /
+    post_delete signal handlers in core.signals, so a save in this process
+    is visible on the next request. Writes made by other processes (or via
+    QuerySet.update(), which sends no signals) are picked up once the TTL
+    runs out.
+    """
+
+    def __init__(self, max_size=1024, ttl=60):
+        super().__init__(max_size=max_size)
+        self.ttl = ttl
+        self._uid_by_pk = {}
+
+    def get(self, uid):
+        """Return a private copy of the cached User, or None."""
+        user = super().get(uid)
+        return copy.copy(user) if user is not None else None
+
+    def set(self, user):
+        super().set(user.uid, copy.copy(user), time.time() + self.ttl)
+        with self._lock:
+            if user.uid in self._entries:
+                self._uid_by_pk[user.pk] = user.uid
+
+    def invalidate(self, user):
+        """Drop any entry for this user, under its current or previous uid."""
+        with self._lock:
+            self._discard(self._uid_by_pk.get(user.pk))
+            self._discard(user.uid)
+
+    def _discard(self, key):
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._uid_by_pk.pop(entry[1].pk, None)
+
+    def clear(self):
+        super().clear()
+        with self._lock:
+            self._uid_by_pk.clear()
+
+
+token_cache = VerifiedTokenCache(
+    max_size=getattr(settings, "AUTH_TOKEN_CACHE_SIZE", 1024),
+)
+
+user_cache = UserCache(
+    max_size=getattr(settings, "AUTH_USER_CACHE_SIZE", 1024),
+    ttl=getattr(settings, "AUTH_USER_CACHE_TTL", 60),
+)
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  Token Verifiers
+# ═══════════════════════════════════════════════════════════════════
+
+
+class FirebaseSDKVerifier:
+    """
+    Verifies ID tokens with firebase_admin.auth.verify_id_token().
+
+    The SDK is imported and initialized on the first verification
+    (see core.firebase.get_auth), not at startup.
+    """
+
+    def verify(self, token):
+        """
+        Returns:
+            The decoded token dict.
+
+        Raises:
+            AuthenticationFailed on invalid/expired/revoked tokens.
+        """
+        auth = firebase.get_auth()
+        try:
+            return auth.verify_id_token(token)
+        except auth.InvalidIdTokenError:
+            logger.warning("Invalid Firebase ID token received")
+            raise exceptions.AuthenticationFailed("Invalid Firebase ID token.")
+        except auth.ExpiredIdTokenError:
+            logger.warning("Expired Firebase ID token received")
+            raise exceptions.AuthenticationFailed("Firebase token has expired.")
+        except auth.RevokedIdTokenError:
+            logger.warning("Revoked Firebase ID token received")
+            raise exceptions.AuthenticationFailed("Firebase token has been revoked.")
+        except Exception as e:
+            logger.error(f"Firebase token verification failed: {e}")
+            raise exceptions.AuthenticationFailed(
+                f"Token verification failed: {e}"
+            )
+
+    def warm_up(self):
+        firebase.get_auth()
+
+    def stats(self):
+        return {"verifier": "firebase_sdk"}
+
+
+class LocalJWTVerifier:
+    """
+    Verifies Firebase ID tokens locally (RS256) against a SigningKeyStore.
+
+    Applies the same checks as firebase_admin: signature by a known kid,
+    exp/iat, aud == project id, iss == securetoken issuer, non-empty sub.
+    The decoded dict gets a "uid" claim copied from "sub", like the SDK's.
+    """
+
+    algorithm = "RS256"
+
+    def __init__(self, key_store, project_id, leeway=0):
+        self.key_store = key_store
+        self.project_id = project_id
+        self.issuer = f"https://securetoken.google.com/{project_id}"
+        self.leeway = leeway
+
+    def verify(self, token):
+        try:
+            header = jwt.get_unverified_header(token)
+        except jwt.InvalidTokenError:
+            logger.warning("Malformed Firebase ID token received")
+            raise exceptions.AuthenticationFailed("Invalid Firebase ID token.")
+
+        if header.get("alg") != self.algorithm:
+            logger.warning(f"Firebase ID token with unexpected alg={header.get('alg')}")
+            raise exceptions.AuthenticationFailed("Invalid Firebase ID token.")
+
+        key = self.key_store.get_key(header.get("kid"))
+        if key is None:
+            logger.warning(f"Firebase ID token signed by unknown kid={header.get('kid')}")
+            raise exceptions.AuthenticationFailed("Invalid Firebase ID token.")
+
+        try:
+            decoded = jwt.decode(
+                token,
+                key,
+                algorithms=[self.algorithm],
+                audience=self.project_id,
+                issuer=self.issuer,
+                leeway=self.leeway,
+                options={"require": ["exp", "iat", "aud", "iss", "sub"]},
+            )
+        except jwt.ExpiredSignatureError:
+            logger.warning("Expired Firebase ID token received")
+            raise exceptions.AuthenticationFailed("Firebase token has expired.")
+        except jwt.InvalidTokenError as e:
+            logger.warning(f"Invalid Firebase ID token received: {e}")
+            raise exceptions.AuthenticationFailed("Invalid Firebase ID token.")
+
+        sub = decoded.get("sub")
+        if not isinstance(sub, str) or not sub or len(sub) > 128:
+            raise exceptions.AuthenticationFailed("Invalid Firebase ID token.")
+        if decoded.get("auth_time", 0) > time.time() + self.leeway:
+            raise exceptions.AuthenticationFailed("Invalid Firebase ID token.")
+
+        decoded["uid"] = sub
+        return decoded
+
+    def warm_up(self):
+        self.key_store.refresh()
+        self.key_store.start_background_refresh()
+
+    def stats(self):
+        return {"verifier": "local", "key_store": self.key_store.stats()}
+
+
+def build_token_verifier():
+    """Build the verifier selected by IDENTITY_BACKEND / AUTH_TOKEN_VERIFIER."""
+    backend = getattr(settings, "IDENTITY_BACKEND", "firebase")
+    if backend == "local":
+        return LocalIdentityProvider.from_settings()
+    if backend != "firebase":
+        raise ValueError(
+            f"Unknown IDENTITY_BACKEND '{backend}'. Expected 'firebase' or 'local'."
+        )
+
+    name = getattr(settings, "AUTH_TOKEN_VERIFIER", "firebase_sdk")
+    if name == "firebase_sdk":
+        return FirebaseSDKVerifier()
+    if name == "local":
+        key_store = SigningKeyStore(
+            source=settings.AUTH_SIGNING_KEYS_SOURCE,
+            url=settings.AUTH_SIGNING_KEYS_URL,
+            path=settings.AUTH_SIGNING_KEYS_FILE or None,
+            bundle=settings.AUTH_SIGNING_KEYS_BUNDLE,
+            fixture_dir=settings.AUTH_SIGNING_KEYS_FIXTURE_DIR or None,
+        )
+        return LocalJWTVerifier(
+            key_store=key_store,
+            project_id=settings.FIREBASE_PROJECT_ID,
+            leeway=settings.AUTH_TOKEN_LEEWAY,
+        )
+    raise ValueError(
+        f"Unknown AUTH_TOKEN_VERIFIER '{name}'. Expected 'firebase_sdk' or 'local'."
+    )
+
+
+_verifier = None
+_verifier_lock = threading.Lock()
+
+
+def get_token_verifier():
+    """Return the process-wide token verifier, building it on first use."""
+    global _verifier
+    if _verifier is None:
+        with _verifier_lock:
+            if _verifier is None:
+                _verifier = build_token_verifier()
+    return _verifier
+
+
+def warm_up():
+    """
+    Build the token verifier and load what it needs (Firebase SDK or
+    signing keys) ahead of the first request.
+
+    Called from the WSGI/ASGI entry points when AUTH_WARM_UP is set;
+    can also be called from a server hook such as gunicorn's post_fork.
+    """
+    verifier = get_token_verifier()
+    if hasattr(verifier, "warm_up"):
+        verifier.warm_up()
+    logger.info(f"[AUTH] Token verifier warmed up: {verifier.stats()}")
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  DRF Authentication Class
+# ═══════════════════════════════════════════════════════════════════
+
+
 class FirebaseAuthentication(authentication.BaseAuthentication):
     """
     DRF authentication class that:
     1. Extracts the Bearer token from the Authorization header
-    2. Verifies it with firebase_admin.auth.verify_id_token()
-    3. Gets or creates a User in the database
+    2. Verifies it with the configured token verifier
+       (skipped when the token is already in token_cache)
+    3. Resolves the User from user_cache, or gets/creates it in the
+       database on a miss
     4. Returns (user, decoded_token)
     """
 
@@ -38,43 +396,108 @@ class FirebaseAuthentication(authentication.BaseAuthentication):
         Raises:
             AuthenticationFailed on invalid/expired/revoked tokens.
         """
+        token = self.get_bearer_token(request)
+        if token is None:
+            return None  # Let permission classes handle unauthenticated requests
+        return self.authenticate_credentials(token)
+
+    async def aauthenticate(self, request):
+        """authenticate() for async views: never blocks the event loop."""
+        token = self.get_bearer_token(request)
+        if token is None:
+            return None
+        return await self.aauthenticate_credentials(token)
+
+    def get_bearer_token(self, request):
+        """Return the token from the Authorization header, or None if absent."""
         auth_header = request.META.get("HTTP_AUTHORIZATION")
         if not auth_header:
-            return None  # Let permission classes handle unauthenticated requests
+            return None
 
-        # ── Extract token ────────────────────────────────────────
         parts = auth_header.split()
         if len(parts) != 2 or parts[0].lower() != "bearer":
             raise exceptions.AuthenticationFailed(
                 "Invalid Authorization header. Expected: Bearer <token>"
             )
-        token = parts[1]
+        return parts[1]
 
-        # ── Verify with Firebase ─────────────────────────────────
-        try:
-            decoded_token = auth.verify_id_token(token)
-        except auth.InvalidIdTokenError:
-            logger.warning("Invalid Firebase ID token received")
-            raise exceptions.AuthenticationFailed("Invalid Firebase ID token.")
-        except auth.ExpiredIdTokenError:
-            logger.warning("Expired Firebase ID token received")
-            raise exceptions.AuthenticationFailed("Firebase token has expired.")
-        except auth.RevokedIdTokenError:
-            logger.warning("Revoked Firebase ID token received")
-            raise exceptions.AuthenticationFailed("Firebase token has been revoked.")
-        except Exception as e:
-            logger.error(f"Firebase token verification failed: {e}")
-            raise exceptions.AuthenticationFailed(
-                f"Token verification failed: {e}"
-            )
+    def authenticate_credentials(self, token):
+        """
+        Verify a raw token and resolve its User.
+
+        Also used by views that cannot receive an Authorization header
+        (the SSE event stream takes ?token=).
+
+        Returns:
+            (User, decoded_token)
 
+        Raises:
+            AuthenticationFailed on invalid/expired/revoked tokens.
+        """
+        # ── Verify with Firebase (or reuse a cached verification) ─
+        decoded_token = token_cache.get(token)
+        if decoded_token is None:
+            decoded_token = self.verify_token(token)
+            token_cache.set(token, decoded_token)
+
+        # ── Resolve User (cached fast path) ──────────────────────
+        uid, email = self.get_claims(decoded_token)
+        user = self.get_cached_user(uid, email)
+        if user is None:
+            user = self.get_or_sync_user(uid, email)
+            user_cache.set(user)
+
+        return self.check_user(user, uid), decoded_token
+
+    async def aauthenticate_credentials(self, token):
+        """
+        authenticate_credentials() for async views.
+
+        Cache hits are answered on the event loop; signature verification
+        and database access only run (in a worker thread) on a miss.
+        """
+        decoded_token = token_cache.get(token)
+        if decoded_token is None:
+            decoded_token = await sync_to_async(self.verify_token, thread_sensitive=False)(token)
+            token_cache.set(token, decoded_token)
+
+        uid, email = self.get_claims(decoded_token)
+        user = self.get_cached_user(uid, email)
+        if user is None:
+            user = await sync_to_async(self.get_or_sync_user)(uid, email)
+            user_cache.set(user)
+
+        return self.check_user(user, uid), decoded_token
+
+    def get_claims(self, decoded_token):
         uid = decoded_token.get("uid")
         if not uid:
             raise exceptions.AuthenticationFailed("Token does not contain a user ID.")
+        return uid, decoded_token.get("email", "")
+
+    def get_cached_user(self, uid, email):
+        """The cached User for uid, unless the token's email no longer matches."""
+        user = user_cache.get(uid)
+        if user is None or (email and user.email != email):
+            return None
+        return user
+
+    def check_user(self, user, uid):
+        if not user.is_active:
+            raise exceptions.AuthenticationFailed("User account is disabled.")
+
+        logger.info(
+            f"[AUTH] Authenticated: email={user.email}, uid={uid[:8]}…, role={user.role}"
+        )
+        return user
 
-        # ── Get or create User ───────────────────────────────────
-        email = decoded_token.get("email", "")
+    def get_or_sync_user(self, uid, email):
+        """
+        Get or create the User for a verified token.
 
+        Keeps the stored uid/email in sync with the token claims.
+        Only runs when user_cache has no matching entry.
+        """
         # Try email first (handles pre-created accounts with placeholder UIDs)
         user = None
         try:
@@ -106,14 +529,11 @@ class FirebaseAuthentication(authentication.BaseAuthentication):
             )
             logger.info(f"[AUTH] Created new user: {email}")
 
-        if not user.is_active:
-            raise exceptions.AuthenticationFailed("User account is disabled.")
-
-        logger.info(
-            f"[AUTH] Authenticated: email={user.email}, uid={uid[:8]}…, role={user.role}"
-        )
+        return user
 
-        return (user, decoded_token)
+    def verify_token(self, token):
+        """Verify an ID token with the configured verifier (see get_token_verifier)."""
+        return get_token_verifier().verify(token)
 
     def authenticate_header(self, request):
         """Return the scheme for WWW-Authenticate header on 401 responses."""
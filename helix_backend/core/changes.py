@@ -0,0 +1,167 @@
+"""
+Change feed for incremental client sync.
+
+A client keeps one opaque cursor and asks for everything that changed
+after it:
+
+    GET /api/requests/changes/                 → from the beginning
+    GET /api/requests/changes/?since=<cursor>  → changes after the cursor
+
+    {
+        "requests":   [...],   # created or updated requests (full rows)
+        "activities": [...],   # new activity log entries
+        "deleted":    [...],   # {"id": <request id>, "deleted_at": ...}
+        "cursor":     "<opaque>",
+        "has_more":   false
+    }
+
+Each stream is read in (change_seq, id) order through its own index and
+the cursor records the last position of each, so a sync costs
+O(changes), not O(data). Rows are full current state, so applying one
+twice is harmless.
+
+change_seq comes from ChangeSequence (core.models), which hands out
+values in commit order: a row becomes visible only after every row with
+a lower value, so the cursor never passes over a transaction that was
+slow to commit (a large import chunk, lock waits, buffered activity
+inserts). Cursors older than the tombstone retention period, or from
+before change sequences, are rejected with CursorExpired: the client
+must reload its lists and start again.
+"""
+
+import base64
+import binascii
+import json
+from datetime import datetime, timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+from rest_framework.fields import DateTimeField
+
+from core.models import ChangeSequence
+from core.serializers import ChangeFeedActivitySerializer, RequestListSerializer
+
+# Position after every row of a sequence value (ids are 64-bit at most)
+END_OF_SEQ = 2**63 - 1
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+class CursorExpired(Exception):
+    pass
+
+
+class ChangeFeed:
+    """
+    Reads the requests, activities and tombstones visible to one client.
+
+    Args:
+        requests:   Request queryset the client may see
+        activities: RequestActivity queryset the client may see
+        tombstones: RequestTombstone queryset the client may see
+        limit:      max rows per stream per call
+        retention_days: reject cursors older than this
+    """
+
+    streams = ("requests", "activities", "deleted")
+
+    def __init__(self, requests, activities, tombstones, limit, retention_days):
+        self.querysets = {
+            "requests": requests.values(
+                *RequestListSerializer.values_fields, "user_id", "change_seq"
+            ),
+            "activities": activities.select_related("performed_by"),
+            "deleted": tombstones.values(
+                "id", "request_id", "owner_id", "deleted_at", "change_seq"
+            ),
+        }
+        self.limit = limit
+        self.retention = timedelta(days=retention_days)
+
+    def read(self, cursor=None, context=None):
+        """
+        Serialized changes after `cursor` (see the module docstring);
+        `context` is passed to the request serializer.
+        """
+        rows, cursor, has_more = self.read_rows(cursor)
+        format_datetime = DateTimeField().to_representation
+        return {
+            "requests": RequestListSerializer(rows["requests"], many=True, context=context).data,
+            "activities": ChangeFeedActivitySerializer(rows["activities"], many=True).data,
+            "deleted": [
+                {"id": row["request_id"], "deleted_at": format_datetime(row["deleted_at"])}
+                for row in rows["deleted"]
+            ],
+            "cursor": cursor,
+            "has_more": has_more,
+        }
+
+    def read_rows(self, cursor=None):
+        """
+        Return ({stream: rows}, next_cursor, has_more) with unserialized
+        rows: values() dicts for requests (plus user_id) and tombstones,
+        RequestActivity instances for activities.
+        """
+        positions, issued_at = self.decode_cursor(cursor)
+        if issued_at is not None and issued_at < timezone.now() - self.retention:
+            raise CursorExpired("Cursor expired; reload and start a new sync.")
+
+        rows = {}
+        has_more = False
+        for stream in self.streams:
+            stream_rows = self.read_stream(stream, positions.get(stream))
+            if len(stream_rows) > self.limit:
+                has_more = True
+                stream_rows = stream_rows[: self.limit]
+            if stream_rows:
+                positions[stream] = self.position(stream_rows[-1])
+            rows[stream] = stream_rows
+
+        return rows, self.encode_cursor(positions, timezone.now()), has_more
+
+    def read_stream(self, stream, position):
+        queryset = self.querysets[stream]
+        if position is not None:
+            seq, pk = position
+            queryset = queryset.filter(Q(change_seq__gt=seq) | Q(change_seq=seq, id__gt=pk))
+        return list(queryset.order_by("change_seq", "id")[: self.limit + 1])
+
+    def position(self, row):
+        if isinstance(row, dict):
+            return row["change_seq"], row["id"]
+        return row.change_seq, row.pk
+
+    # ── Cursors ──────────────────────────────────────────────────
+
+    def cursor_at_current(self):
+        """A cursor that skips everything committed so far."""
+        seq = ChangeSequence.current()
+        return self.encode_cursor(
+            {stream: (seq, END_OF_SEQ) for stream in self.streams}, timezone.now()
+        )
+
+    def encode_cursor(self, positions, issued_at):
+        payload = {stream: [seq, pk] for stream, (seq, pk) in positions.items()}
+        payload["at"] = issued_at.isoformat()
+        encoded = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+        return base64.urlsafe_b64encode(encoded).decode("ascii")
+
+    def decode_cursor(self, cursor):
+        """Return ({stream: (change_seq, id)}, issued_at) — empty for no cursor."""
+        if not cursor:
+            return {}, None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+            raw = {stream: payload[stream] for stream in self.streams if stream in payload}
+            if any(isinstance(seq, str) for seq, _ in raw.values()):
+                # Timestamp positions, from before change sequences
+                raise CursorExpired("Cursor expired; reload and start a new sync.")
+            positions = {stream: (int(seq), int(pk)) for stream, (seq, pk) in raw.items()}
+            issued_at = datetime.fromisoformat(payload["at"])
+        except (binascii.Error, UnicodeError, ValueError, KeyError, TypeError, IndexError):
+            raise InvalidCursor("Invalid cursor.")
+        if timezone.is_naive(issued_at):
+            raise InvalidCursor("Invalid cursor.")
+        return positions, issued_at
@@ -0,0 +1,43 @@
+"""
+System checks for Helix backend.
+
+Registered in CoreConfig.ready().
+"""
+
+from django.conf import settings
+from django.core.checks import Error, Tags, register
+
+from core.db import routers
+
+LOCMEM_BACKEND = "django.core.cache.backends.locmem.LocMemCache"
+
+
+@register(Tags.caches)
+def check_shared_cache(app_configs, **kwargs):
+    """
+    The response cache's data version and the replica stickiness keys
+    must be seen by every worker process: a per-process (locmem) cache
+    would let workers that did not handle a write keep serving stale
+    lists, or read a user's own write back from the replica.
+    """
+    if settings.CACHES["default"]["BACKEND"] != LOCMEM_BACKEND:
+        return []
+
+    errors = []
+    if settings.RESPONSE_CACHE_TTL > 0:
+        errors.append(
+            Error(
+                "RESPONSE_CACHE_TTL > 0 needs a cache shared by all workers.",
+                hint="Set CACHE_BACKEND=file, or RESPONSE_CACHE_TTL=0 to disable the response cache.",
+                id="core.E001",
+            )
+        )
+    if routers.replica_configured() and settings.READ_REPLICA_STICKY_SECONDS > 0:
+        errors.append(
+            Error(
+                "READ_REPLICA_STICKY_SECONDS > 0 with a read replica needs a cache shared by all workers.",
+                hint="Set CACHE_BACKEND=file.",
+                id="core.E002",
+            )
+        )
+    return errors
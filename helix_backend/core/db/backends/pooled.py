@@ -0,0 +1,62 @@
+"""
+Shared part of the pooled database backends (see core.db.pool).
+
+A DATABASES entry using one of these engines reads its pool settings
+from a "POOL" dict (MAX_SIZE, TIMEOUT, MAX_IDLE, MAX_LIFETIME,
+HEALTH_CHECK_AFTER). Keep CONN_MAX_AGE at 0 with a pool: Django then
+"closes" the connection at the end of each request, which returns it to
+the pool for the next thread instead of tying it to this one.
+
+connection_created is still sent for every checkout, so handlers must
+be safe to run again on a connection they have already set up.
+"""
+
+from functools import partial
+
+from django.utils.asyncio import async_unsafe
+
+from core.db.pool import ConnectionPool, get_pool
+
+
+class PooledDatabaseWrapperMixin:
+    """Checks connections out of a ConnectionPool and hands them back on close."""
+
+    @property
+    def connection_pool(self):
+        # NAME is part of the key: test runs rename the database
+        return get_pool((self.alias, self.settings_dict["NAME"]), self.make_connection_pool)
+
+    def make_connection_pool(self):
+        options = {key.lower(): value for key, value in self.settings_dict.get("POOL", {}).items()}
+        return ConnectionPool(
+            name=self.alias, ping=self.ping_connection, reset=self.reset_connection, **options
+        )
+
+    def use_connection_pool(self):
+        return True
+
+    @staticmethod
+    def ping_connection(raw):
+        raise NotImplementedError
+
+    @staticmethod
+    def reset_connection(raw):
+        raise NotImplementedError
+
+    @async_unsafe
+    def get_new_connection(self, conn_params):
+        if not self.use_connection_pool():
+            return super().get_new_connection(conn_params)
+        return self.connection_pool.acquire(partial(super().get_new_connection, conn_params))
+
+    def _close(self):
+        if self.connection is None or not self.use_connection_pool():
+            return super()._close()
+        with self.wrap_database_errors:
+            self.connection_pool.release(
+                self.connection,
+                check=self.errors_occurred,
+                # Closed inside atomic(): Django keeps referring to it until
+                # the block exits, so it must not be handed to anyone else
+                discard=self.in_atomic_block,
+            )
@@ -0,0 +1,23 @@
+"""
+PostgreSQL backend with a connection pool (core.db.pool).
+
+    ENGINE: "core.db.backends.postgresql"
+"""
+
+from django.db.backends.postgresql import base
+
+from core.db.backends.pooled import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    @staticmethod
+    def ping_connection(raw):
+        with raw.cursor() as cursor:
+            cursor.execute("SELECT 1")
+
+    @staticmethod
+    def reset_connection(raw):
+        if raw.closed:
+            raise base.Database.InterfaceError("connection already closed")
+        # No-op outside a transaction
+        raw.rollback()
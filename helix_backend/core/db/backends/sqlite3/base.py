@@ -0,0 +1,26 @@
+"""
+SQLite backend with a connection pool (core.db.pool).
+
+    ENGINE: "core.db.backends.sqlite3"
+
+In-memory databases are not pooled: each of their connections is a
+separate database.
+"""
+
+from django.db.backends.sqlite3 import base
+
+from core.db.backends.pooled import PooledDatabaseWrapperMixin
+
+
+class DatabaseWrapper(PooledDatabaseWrapperMixin, base.DatabaseWrapper):
+    def use_connection_pool(self):
+        return not self.is_in_memory_db()
+
+    @staticmethod
+    def ping_connection(raw):
+        raw.execute("SELECT 1").close()
+
+    @staticmethod
+    def reset_connection(raw):
+        if raw.in_transaction:
+            raw.rollback()
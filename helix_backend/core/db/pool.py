@@ -0,0 +1,305 @@
+"""
+Database connection pool for Helix backend.
+
+Django opens a connection per thread and, with CONN_MAX_AGE=0, closes it
+at the end of every request. The backends in core.db.backends keep those
+connections instead: DatabaseWrapper.get_new_connection() checks one out
+of a per-database ConnectionPool and closing the wrapper hands it back.
+
+    size       — at most DATABASE_POOL_MAX_SIZE connections per process;
+                 a thread that finds none free waits up to
+                 DATABASE_POOL_TIMEOUT seconds, then gets PoolTimeout
+    idle       — free connections are reused most-recent first, waiting
+                 threads are served in arrival order; connections idle
+                 longer than DATABASE_POOL_MAX_IDLE seconds are closed
+    lifetime   — connections older than DATABASE_POOL_MAX_LIFETIME seconds
+                 are closed when they come back or are checked out
+    health     — a connection idle longer than
+                 DATABASE_POOL_HEALTH_CHECK_AFTER seconds is pinged before
+                 it is handed out; one whose last use raised a database
+                 error is pinged before it is kept
+    reset      — an open transaction is rolled back when a connection is
+                 returned, so no state leaks to its next user
+
+Pools are per process (a pool inherited across fork() is abandoned, not
+closed) and their statistics are reported by the admin metrics endpoint.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import deque
+
+from django.db.utils import OperationalError
+
+logger = logging.getLogger(__name__)
+
+
+class PoolTimeout(OperationalError):
+    """No connection became free within the pool timeout."""
+
+
+class PooledConnection:
+    __slots__ = ("raw", "created_at", "released_at")
+
+    def __init__(self, raw):
+        self.raw = raw
+        self.created_at = self.released_at = time.monotonic()
+
+
+class ConnectionPool:
+    """
+    Thread-safe pool of DB-API connections.
+
+    Args:
+        name:               label for logs and statistics
+        ping:               callable(raw) raising if the connection is dead
+        reset:              callable(raw) clearing per-use state (rollback)
+        max_size:           most connections open at once
+        timeout:            seconds to wait for a free connection
+        max_idle:           seconds a free connection is kept
+        max_lifetime:       seconds a connection is kept at all
+        health_check_after: idle seconds after which a connection is pinged
+    """
+
+    def __init__(
+        self,
+        name,
+        ping,
+        reset,
+        max_size=10,
+        timeout=5.0,
+        max_idle=300.0,
+        max_lifetime=1800.0,
+        health_check_after=30.0,
+    ):
+        self.name = name
+        self.ping = ping
+        self.reset = reset
+        self.max_size = max_size
+        self.timeout = timeout
+        self.max_idle = max_idle
+        self.max_lifetime = max_lifetime
+        self.health_check_after = health_check_after
+        self.pid = os.getpid()
+
+        self._idle = deque()
+        self._in_use = {}
+        self._pending = 0
+        self._waiters = deque()
+        self._cond = threading.Condition()
+
+        self.opened = 0
+        self.closed = 0
+        self.acquired = 0
+        self.waits = 0
+        self.wait_time = 0.0
+        self.max_wait = 0.0
+        self.timeouts = 0
+        self.health_check_failures = 0
+
+    # ── Checkout / return ────────────────────────────────────────
+
+    def acquire(self, connect):
+        """
+        Return a connection, reusing a free one or opening one with connect().
+
+        Raises:
+            PoolTimeout if max_size connections stay in use for `timeout` seconds.
+        """
+        started = time.monotonic()
+        waited = False
+        stale = []
+        ticket = object()
+        try:
+            with self._cond:
+                while True:
+                    # First come, first served: a thread that just released
+                    # a connection must not take it back ahead of waiters
+                    if not self._waiters or self._waiters[0] is ticket:
+                        conn = self._take_idle(stale)
+                        if conn is not None or len(self._in_use) + self._pending < self.max_size:
+                            # The slot is held while the connection is checked or opened
+                            self._pending += 1
+                            if waited:
+                                self._waiters.popleft()
+                                self._cond.notify_all()
+                            break
+                    if not waited:
+                        self._waiters.append(ticket)
+                        waited = True
+                    remaining = self.timeout - (time.monotonic() - started)
+                    if remaining <= 0:
+                        self._waiters.remove(ticket)
+                        self._cond.notify_all()
+                        self.timeouts += 1
+                        raise PoolTimeout(
+                            f"No database connection free in pool '{self.name}' "
+                            f"after {self.timeout}s ({self.max_size} in use)."
+                        )
+                    self._cond.wait(remaining)
+        finally:
+            for old in stale:
+                self._close(old.raw)
+
+        try:
+            if conn is not None and not self._check_idle(conn):
+                conn = None
+            if conn is None:
+                conn = PooledConnection(connect())
+                with self._cond:
+                    self.opened += 1
+        except BaseException:
+            with self._cond:
+                self._pending -= 1
+                self._cond.notify_all()
+            raise
+
+        elapsed = time.monotonic() - started
+        with self._cond:
+            self._pending -= 1
+            self._in_use[id(conn.raw)] = conn
+            self.acquired += 1
+            if waited:
+                self.waits += 1
+                self.wait_time += elapsed
+                self.max_wait = max(self.max_wait, elapsed)
+        return conn.raw
+
+    def release(self, raw, check=False, discard=False):
+        """
+        Return a connection to the pool, resetting it first.
+
+        Args:
+            raw:     the connection acquire() returned
+            check:   ping it before keeping it (its last use raised an error)
+            discard: close it instead of keeping it
+        """
+        with self._cond:
+            conn = self._in_use.get(id(raw))
+        if conn is None:
+            # Not ours (opened before the pool was replaced): just close it
+            self._close(raw)
+            return
+
+        keep = (
+            not discard
+            and os.getpid() == self.pid
+            and not self._expired(conn, time.monotonic())
+        )
+        error = None
+        if keep:
+            try:
+                self.reset(raw)
+                if check:
+                    self.ping(raw)
+            except Exception as e:
+                error = e
+                keep = False
+
+        # Still counted as in use until here, so the pool never exceeds max_size
+        with self._cond:
+            del self._in_use[id(raw)]
+            if error is not None:
+                self.health_check_failures += 1
+            if keep:
+                conn.released_at = time.monotonic()
+                self._idle.append(conn)
+            self._cond.notify_all()
+        if error is not None:
+            logger.warning(f"[DB] Dropping connection from pool '{self.name}': {error}")
+        if not keep:
+            self._close(raw)
+
+    def close_idle(self):
+        """Close every free connection."""
+        with self._cond:
+            idle, self._idle = list(self._idle), deque()
+        for conn in idle:
+            self._close(conn.raw)
+
+    # ── Statistics ───────────────────────────────────────────────
+
+    def stats(self):
+        with self._cond:
+            return {
+                "max_size": self.max_size,
+                "in_use": len(self._in_use),
+                "idle": len(self._idle),
+                "opened": self.opened,
+                "closed": self.closed,
+                "acquired": self.acquired,
+                "waits": self.waits,
+                "wait_time_total": round(self.wait_time, 4),
+                "wait_time_max": round(self.max_wait, 4),
+                "timeouts": self.timeouts,
+                "health_check_failures": self.health_check_failures,
+            }
+
+    # ── Internals ────────────────────────────────────────────────
+
+    def _take_idle(self, stale):
+        """
+        Pop the most recently used free connection still worth keeping,
+        moving expired ones to `stale` (lock held).
+        """
+        now = time.monotonic()
+        # Least recently used first: expired ones collect at the left
+        while self._idle and self._expired(self._idle[0], now):
+            stale.append(self._idle.popleft())
+        while self._idle:
+            conn = self._idle.pop()
+            if not self._expired(conn, now):
+                return conn
+            stale.append(conn)
+        return None
+
+    def _expired(self, conn, now):
+        return (
+            now - conn.created_at >= self.max_lifetime
+            or now - conn.released_at >= self.max_idle
+        )
+
+    def _check_idle(self, conn):
+        if time.monotonic() - conn.released_at < self.health_check_after:
+            return True
+        try:
+            self.ping(conn.raw)
+            return True
+        except Exception as e:
+            logger.warning(f"[DB] Health check failed in pool '{self.name}': {e}")
+            with self._cond:
+                self.health_check_failures += 1
+            self._close(conn.raw)
+            return False
+
+    def _close(self, raw):
+        try:
+            raw.close()
+        except Exception:
+            pass
+        with self._cond:
+            self.closed += 1
+
+
+_pools = {}
+_pools_lock = threading.Lock()
+
+
+def get_pool(key, factory):
+    """The pool for `key` in this process, created by factory() on first use."""
+    pool = _pools.get(key)
+    if pool is None or pool.pid != os.getpid():
+        with _pools_lock:
+            pool = _pools.get(key)
+            if pool is None or pool.pid != os.getpid():
+                pool = _pools[key] = factory()
+    return pool
+
+
+def pool_stats():
+    """{name: stats} for every pool of this process."""
+    pid = os.getpid()
+    return {pool.name: pool.stats() for pool in list(_pools.values()) if pool.pid == pid}
+
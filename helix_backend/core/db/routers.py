@@ -0,0 +1,111 @@
+"""
+Read-replica routing for Helix backend.
+
+When DATABASES has a "replica" alias (see the Read replica section of
+settings), ReplicaRouter sends reads made while replica reads are on to
+it and everything else to "default":
+
+    views      — ReplicaReadMixin (core.views) turns replica reads on for
+                 the GET handler of the list, activity and auth/me views,
+                 after authentication (user lookups and syncs stay on
+                 the primary); the async views (core.async_views) do the
+                 same with astart_replica_reads()
+    writes     — always "default", including saves of instances that
+                 were read from the replica
+    stickiness — services call stick_to_primary(actor) in their write
+                 transactions; once it commits, that user's reads stay on
+                 the primary for READ_REPLICA_STICKY_SECONDS so they see
+                 their own writes despite replication lag
+    atomic     — reads inside a transaction on "default" use "default"
+
+The flag is a context variable, so it follows the request through
+sync_to_async() in the async views and never leaks between threads or
+requests. Stickiness is recorded in the default cache, which must be
+shared by the worker processes (CACHE_BACKEND=file; system check
+core.E002).
+"""
+
+from contextvars import ContextVar
+from functools import partial
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS, connections, transaction
+
+REPLICA_ALIAS = "replica"
+STICKY_KEY_PREFIX = "helix:db-sticky:"
+
+_replica_reads = ContextVar("helix_replica_reads", default=False)
+
+
+def replica_configured():
+    return REPLICA_ALIAS in settings.DATABASES
+
+
+def stick_to_primary(user):
+    """
+    Keep `user`'s reads on the primary for READ_REPLICA_STICKY_SECONDS
+    once the current transaction commits.
+    """
+    if user is None or not replica_configured() or settings.READ_REPLICA_STICKY_SECONDS <= 0:
+        return
+    transaction.on_commit(
+        partial(cache.set, f"{STICKY_KEY_PREFIX}{user.pk}", 1, settings.READ_REPLICA_STICKY_SECONDS)
+    )
+
+
+def is_sticky(user):
+    return cache.get(f"{STICKY_KEY_PREFIX}{user.pk}") is not None
+
+
+async def ais_sticky(user):
+    return await cache.aget(f"{STICKY_KEY_PREFIX}{user.pk}") is not None
+
+
+def start_replica_reads(user):
+    """
+    Route reads in the current context to the replica, unless none is
+    configured or `user` wrote recently.
+
+    Returns:
+        A token for stop_replica_reads(), or None if reads stay on the primary.
+    """
+    if not replica_configured() or (user.is_authenticated and is_sticky(user)):
+        return None
+    return _replica_reads.set(True)
+
+
+async def astart_replica_reads(user):
+    """start_replica_reads() for async views: checks stickiness with cache.aget()."""
+    if not replica_configured() or (user.is_authenticated and await ais_sticky(user)):
+        return None
+    return _replica_reads.set(True)
+
+
+def stop_replica_reads(token):
+    if token is not None:
+        _replica_reads.reset(token)
+
+
+def reading_from_replica():
+    return _replica_reads.get()
+
+
+class ReplicaRouter:
+    """DATABASE_ROUTERS entry: replica for flagged reads, primary for the rest."""
+
+    def db_for_read(self, model, **hints):
+        if _replica_reads.get() and not connections[DEFAULT_DB_ALIAS].in_atomic_block:
+            return REPLICA_ALIAS
+        return DEFAULT_DB_ALIAS
+
+    def db_for_write(self, model, **hints):
+        return DEFAULT_DB_ALIAS
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # Both aliases hold the same data
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        # The replica gets its schema from the primary
+        return db != REPLICA_ALIAS
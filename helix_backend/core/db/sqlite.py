@@ -0,0 +1,107 @@
+"""
+SQLite tuning for single-node deployments.
+
+    apply_pragmas()   — SQLITE_PRAGMAS on a new connection, when
+                        SQLITE_TUNED is set (connected to
+                        connection_created in core.signals)
+    retry_on_locked() — re-run a write transaction that failed with
+                        "database is locked", with exponential backoff
+
+SQLite allows one writer at a time. With WAL, readers no longer block
+the writer or each other and busy_timeout makes a writer wait for the
+lock; what is left is a transaction that read first and cannot take the
+write lock without restarting (SQLite returns SQLITE_BUSY at once, since
+waiting could deadlock). Those surface as OperationalError("database is
+locked") and are what retry_on_locked() absorbs for the service layer.
+"""
+
+import logging
+import random
+import threading
+import time
+from functools import wraps
+
+from django.conf import settings
+from django.db import OperationalError, connection, models
+
+logger = logging.getLogger(__name__)
+
+LOCKED_MESSAGES = ("database is locked", "database table is locked")
+
+_lock = threading.Lock()
+_stats = {"retries": 0, "gave_up": 0}
+
+
+def apply_pragmas(connection):
+    """Apply SQLITE_PRAGMAS to a freshly opened (or pooled) SQLite connection."""
+    raw = connection.connection
+    for name, value in settings.SQLITE_PRAGMAS.items():
+        raw.execute(f"PRAGMA {name} = {value}").close()
+
+
+def is_locked_error(exc):
+    return isinstance(exc, OperationalError) and any(
+        message in str(exc) for message in LOCKED_MESSAGES
+    )
+
+
+def retry_on_locked(func):
+    """
+    Re-run `func` when it fails with "database is locked", up to
+    SQLITE_LOCK_RETRIES times, sleeping SQLITE_LOCK_BACKOFF * 2**attempt
+    seconds (with jitter) in between.
+
+    `func` must do its writes in its own transaction.atomic(): when called
+    inside an outer atomic block the error is raised as is, since that
+    transaction has to be rolled back as a whole. Model instances passed
+    as arguments are restored to their state before the call when it
+    fails this way, so a partial in-memory update is neither applied twice
+    nor left behind.
+    """
+
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        retries = settings.SQLITE_LOCK_RETRIES
+        if connection.vendor != "sqlite" or retries <= 0 or connection.in_atomic_block:
+            return func(*args, **kwargs)
+
+        instances = [
+            arg for arg in (*args, *kwargs.values()) if isinstance(arg, models.Model)
+        ]
+        snapshots = [_snapshot(instance) for instance in instances]
+        for attempt in range(retries + 1):
+            try:
+                return func(*args, **kwargs)
+            except OperationalError as e:
+                if not is_locked_error(e):
+                    raise
+                for instance, snapshot in zip(instances, snapshots):
+                    _restore(instance, snapshot)
+                if attempt == retries:
+                    with _lock:
+                        _stats["gave_up"] += 1
+                    logger.warning(f"[DB] {func.__name__}: database still locked after {retries} retries")
+                    raise
+            with _lock:
+                _stats["retries"] += 1
+            delay = settings.SQLITE_LOCK_BACKOFF * 2**attempt
+            time.sleep(delay * random.uniform(0.5, 1.5))
+
+    return wrapper
+
+
+def stats():
+    with _lock:
+        return {"tuned": settings.SQLITE_TUNED, **_stats}
+
+
+def _snapshot(instance):
+    return dict(instance.__dict__), dict(instance._state.fields_cache), instance._state.adding
+
+
+def _restore(instance, snapshot):
+    values, fields_cache, adding = snapshot
+    instance.__dict__.clear()
+    instance.__dict__.update(values)
+    instance._state.fields_cache = dict(fields_cache)
+    instance._state.adding = adding
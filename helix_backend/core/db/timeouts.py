@@ -0,0 +1,42 @@
+"""
+Per-statement time limits for Helix backend.
+
+statement_timeout(using, seconds) cuts off the queries run inside it:
+
+    postgresql — SET LOCAL statement_timeout, in a transaction of its own
+    sqlite     — a progress handler that interrupts the statement once
+                 the deadline has passed
+
+Queries that run over fail with OperationalError (Postgres: "canceling
+statement due to statement timeout", SQLite: "interrupted"). Other
+vendors run without a limit.
+"""
+
+import time
+from contextlib import contextmanager
+
+from django.db import connections, transaction
+
+# SQLite virtual machine instructions between deadline checks
+SQLITE_CHECK_EVERY = 10000
+
+
+@contextmanager
+def statement_timeout(using, seconds):
+    connection = connections[using]
+    if connection.vendor == "postgresql":
+        with transaction.atomic(using=using):
+            with connection.cursor() as cursor:
+                cursor.execute(f"SET LOCAL statement_timeout = {max(int(seconds * 1000), 1)}")
+            yield
+    elif connection.vendor == "sqlite":
+        connection.ensure_connection()
+        raw = connection.connection
+        deadline = time.monotonic() + seconds
+        raw.set_progress_handler(lambda: time.monotonic() > deadline, SQLITE_CHECK_EVERY)
+        try:
+            yield
+        finally:
+            raw.set_progress_handler(None, 0)
+    else:
+        yield
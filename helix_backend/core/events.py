@@ -0,0 +1,225 @@
+"""
+Live request events for the SSE stream (GET /api/events/).
+
+EventBus           — in-process pub/sub: the service layer publishes after
+                     commit, each connected SSE client reads its own
+                     bounded asyncio queue.
+ChangeFeedPoller   — multi-process fallback (EVENT_STREAM_BACKEND=poll):
+                     one task per process reads the change feed every
+                     EVENT_STREAM_POLL_INTERVAL seconds and publishes
+                     what it finds, so writes made by other workers reach
+                     this worker's clients too.
+publish_on_commit  — what core.services calls.
+
+Events (data is JSON; "owner" is the id of the user who owns the request,
+null for events only admins receive):
+
+    request.created           {"id", "owner", "status", "priority", "assigned_to"}
+    request.status_changed    {"id", "owner", "from", "to"}
+    request.priority_changed  {"id", "owner", "from", "to"}
+    request.assigned          {"id", "owner", "from", "to"}   (assignee ids)
+    request.deleted           {"id", "owner"}
+    requests.imported         {"owner": null, "count"}
+    request.updated           {"id", "owner", "status", "priority", "assigned_to"}
+                              (Django admin edits, and poll mode, which
+                              cannot tell what changed)
+
+Event ids are "<process token>-<sequence>", so a client reconnecting with
+Last-Event-ID is replayed what it missed when it lands on the same
+process, and told to resync ("resync" event) otherwise.
+"""
+
+import asyncio
+import itertools
+import logging
+import threading
+import uuid
+from collections import deque, namedtuple
+from functools import partial
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import transaction
+
+from core.changes import ChangeFeed
+from core.models import Request, RequestActivity, RequestTombstone
+
+logger = logging.getLogger(__name__)
+
+Event = namedtuple("Event", ["id", "seq", "type", "data"])
+
+
+class Subscription:
+    """One SSE client's queue, bound to the event loop it was created on."""
+
+    def __init__(self, loop, queue_size):
+        self.loop = loop
+        self.queue = asyncio.Queue(queue_size)
+        self.overflowed = False
+
+    def deliver(self, event):
+        """Thread-safe: hand the event to the subscriber's loop."""
+        self.loop.call_soon_threadsafe(self._put, event)
+
+    def _put(self, event):
+        try:
+            self.queue.put_nowait(event)
+        except asyncio.QueueFull:
+            # A client this far behind gets a resync instead of a backlog
+            self.overflowed = True
+
+    async def get(self, timeout):
+        """Next event, or None after `timeout` seconds."""
+        try:
+            return await asyncio.wait_for(self.queue.get(), timeout)
+        except asyncio.TimeoutError:
+            return None
+
+
+class EventBus:
+    """Thread-safe in-process pub/sub with a short replay buffer."""
+
+    def __init__(self, replay_size=1000, queue_size=256):
+        self._lock = threading.Lock()
+        self._subscribers = set()
+        self._recent = deque(maxlen=replay_size)
+        self._sequence = itertools.count(1)
+        self.queue_size = queue_size
+        self.token = uuid.uuid4().hex[:12]
+        self.published = 0
+        self.overflows = 0
+
+    def publish(self, event_type, data):
+        with self._lock:
+            seq = next(self._sequence)
+            event = Event(f"{self.token}-{seq}", seq, event_type, data)
+            self._recent.append(event)
+            self.published += 1
+            subscribers = list(self._subscribers)
+
+        for subscription in subscribers:
+            try:
+                subscription.deliver(event)
+            except RuntimeError:
+                # Its event loop is closed; the client is gone
+                self.unsubscribe(subscription)
+        return event
+
+    def subscribe(self):
+        """Register a subscriber on the running event loop."""
+        subscription = Subscription(asyncio.get_running_loop(), self.queue_size)
+        with self._lock:
+            self._subscribers.add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription):
+        with self._lock:
+            self._subscribers.discard(subscription)
+            if subscription.overflowed:
+                self.overflows += 1
+
+    @property
+    def subscriber_count(self):
+        with self._lock:
+            return len(self._subscribers)
+
+    def replay(self, last_event_id):
+        """
+        Events published after `last_event_id`, oldest first, or None when
+        they cannot be replayed (other process, or fell out of the buffer).
+        """
+        token, _, seq = last_event_id.rpartition("-")
+        if token != self.token or not seq.isdigit():
+            return None
+        seq = int(seq)
+        with self._lock:
+            recent = list(self._recent)
+        if recent and seq < recent[0].seq - 1:
+            return None
+        return [event for event in recent if event.seq > seq]
+
+    def stats(self):
+        with self._lock:
+            return {
+                "backend": settings.EVENT_STREAM_BACKEND,
+                "subscribers": len(self._subscribers),
+                "published": self.published,
+                "overflows": self.overflows,
+                "replay_buffer": len(self._recent),
+            }
+
+
+bus = EventBus(
+    replay_size=settings.EVENT_STREAM_REPLAY_SIZE,
+    queue_size=settings.EVENT_STREAM_QUEUE_SIZE,
+)
+
+
+def publish_on_commit(event_type, data):
+    """
+    Publish an event once the current transaction commits.
+
+    No-op in poll mode, where ChangeFeedPoller finds the change instead.
+    """
+    if settings.EVENT_STREAM_BACKEND != "memory":
+        return
+    transaction.on_commit(partial(bus.publish, event_type, data))
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  Poll mode
+# ═══════════════════════════════════════════════════════════════════
+
+
+class ChangeFeedPoller:
+    """
+    Publishes request.updated / request.deleted events from the change
+    feed. Runs as one task on the event loop while there are subscribers.
+    """
+
+    def __init__(self, event_bus, interval):
+        self.bus = event_bus
+        self.interval = interval
+        self.task = None
+
+    def ensure_running(self):
+        if self.task is None or self.task.done():
+            self.task = asyncio.get_running_loop().create_task(self.run())
+
+    async def run(self):
+        feed = ChangeFeed(
+            Request.objects.all(),
+            RequestActivity.objects.none(),
+            RequestTombstone.objects.all(),
+            limit=settings.CHANGE_FEED_LIMIT,
+            retention_days=settings.CHANGE_FEED_TOMBSTONE_DAYS,
+        )
+        # Nobody was listening before now, so there is nothing to catch up on
+        cursor = await sync_to_async(feed.cursor_at_current)()
+
+        while self.bus.subscriber_count:
+            try:
+                rows, cursor, has_more = await sync_to_async(feed.read_rows)(cursor)
+            except Exception as e:
+                logger.error(f"[EVENTS] Change feed poll failed: {e}")
+                rows, has_more = {"requests": [], "deleted": []}, False
+
+            for row in rows["requests"]:
+                self.bus.publish(
+                    "request.updated",
+                    {
+                        "id": row["id"],
+                        "owner": row["user_id"],
+                        "status": row["status"],
+                        "priority": row["priority"],
+                        "assigned_to": row["assigned_to_id"],
+                    },
+                )
+            for row in rows["deleted"]:
+                self.bus.publish("request.deleted", {"id": row["request_id"], "owner": row["owner_id"]})
+
+            if not has_more:
+                await asyncio.sleep(self.interval)
+
+
+poller = ChangeFeedPoller(bus, settings.EVENT_STREAM_POLL_INTERVAL)
@@ -2,16 +2,23 @@
 Firebase Admin SDK Initialization
 
 Initializes Firebase using service account credentials from environment variables.
-Called once on Django startup via helix_backend/__init__.py.
+
+firebase_admin (and the google-auth stack behind it) is imported lazily:
+nothing here runs at Django startup. The SDK is loaded and initialized on
+the first call to get_auth() — i.e. the first request verified with the
+firebase_sdk verifier — or ahead of time via core.authentication.warm_up().
 """
 
 import logging
-import firebase_admin
-from firebase_admin import credentials
+import threading
+
 from decouple import config
 
 logger = logging.getLogger(__name__)
 
+_lock = threading.Lock()
+_auth_module = None
+
 
 def initialize_firebase():
     """
@@ -24,6 +31,9 @@ def initialize_firebase():
 
     Skips initialization if already initialized or if credentials are missing.
     """
+    import firebase_admin
+    from firebase_admin import credentials
+
     if firebase_admin._apps:
         return  # Already initialized
 
@@ -51,3 +61,19 @@ def initialize_firebase():
 
     except Exception as e:
         logger.error(f"Firebase Admin SDK initialization failed: {e}")
+
+
+def get_auth():
+    """
+    Return the firebase_admin.auth module, importing and initializing
+    the SDK on first use. Thread-safe; later calls are a global lookup.
+    """
+    global _auth_module
+    if _auth_module is None:
+        with _lock:
+            if _auth_module is None:
+                initialize_firebase()
+                from firebase_admin import auth
+
+                _auth_module = auth
+    return _auth_module
@@ -0,0 +1,183 @@
+"""
+Local Identity Provider — a stand-in for Firebase Authentication
+
+Selected with IDENTITY_BACKEND=local. Mints and verifies ID tokens with a
+local key, so the whole API can run under synthetic load (or in CI) with
+no Firebase project and no network access:
+
+    HS256 — shared secret (IDENTITY_LOCAL_SECRET, required)
+    RS256 — PEM private key file (IDENTITY_LOCAL_PRIVATE_KEY_FILE);
+            verification only needs the public half
+
+Tokens carry the same claims FirebaseAuthentication reads from Firebase
+tokens (sub/uid, email, exp). Anyone holding the key can mint a token
+for any user, so the backend refuses to load with DEBUG=False.
+
+Mint tokens with:  python manage.py mint_token --email someone@example.com
+"""
+
+import time
+import uuid
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from rest_framework import exceptions
+
+ALGORITHMS = ("HS256", "RS256")
+
+
+def generate_rsa_private_key_pem(key_size=2048):
+    """Return a new PEM-encoded (PKCS8, unencrypted) RSA private key."""
+    key = rsa.generate_private_key(public_exponent=65537, key_size=key_size)
+    return key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    )
+
+
+class LocalIdentityProvider:
+    """
+    Mints and verifies ID tokens signed with a local key.
+
+    Args:
+        algorithm: "HS256" or "RS256"
+        secret: Shared secret for HS256
+        private_key_pem: PEM private key for RS256 (needed to mint)
+        public_key_pem: PEM public key for RS256 (derived from the private
+                        key when omitted)
+        issuer / audience: Values minted into and required on every token
+        ttl: Default token lifetime in seconds
+    """
+
+    def __init__(
+        self,
+        algorithm="HS256",
+        secret=None,
+        private_key_pem=None,
+        public_key_pem=None,
+        issuer="helix-local",
+        audience="helix-local",
+        ttl=3600,
+    ):
+        if algorithm not in ALGORITHMS:
+            raise ValueError(
+                f"Unsupported local identity algorithm '{algorithm}'. "
+                f"Expected one of: {', '.join(ALGORITHMS)}"
+            )
+        self.algorithm = algorithm
+        self.issuer = issuer
+        self.audience = audience
+        self.ttl = ttl
+
+        if algorithm == "HS256":
+            if not secret:
+                raise ValueError("HS256 local identity requires a secret.")
+            self._signing_key = self._verifying_key = secret
+        else:
+            self._signing_key = (
+                serialization.load_pem_private_key(private_key_pem, password=None)
+                if private_key_pem
+                else None
+            )
+            if public_key_pem:
+                self._verifying_key = serialization.load_pem_public_key(public_key_pem)
+            elif self._signing_key is not None:
+                self._verifying_key = self._signing_key.public_key()
+            else:
+                raise ValueError("RS256 local identity requires a private or public key.")
+
+    @classmethod
+    def from_settings(cls):
+        if not settings.DEBUG:
+            raise ImproperlyConfigured(
+                "IDENTITY_BACKEND=local lets anyone with the key sign in as any "
+                "user and is refused when DEBUG=False."
+            )
+        algorithm = settings.IDENTITY_LOCAL_ALGORITHM
+        if algorithm not in ALGORITHMS:
+            raise ImproperlyConfigured(
+                f"Unsupported IDENTITY_LOCAL_ALGORITHM '{algorithm}'. "
+                f"Expected one of: {', '.join(ALGORITHMS)}"
+            )
+        if algorithm == "HS256" and not settings.IDENTITY_LOCAL_SECRET:
+            raise ImproperlyConfigured(
+                "IDENTITY_BACKEND=local with HS256 requires IDENTITY_LOCAL_SECRET."
+            )
+        if algorithm == "RS256" and not (
+            settings.IDENTITY_LOCAL_PRIVATE_KEY_FILE or settings.IDENTITY_LOCAL_PUBLIC_KEY_FILE
+        ):
+            raise ImproperlyConfigured(
+                "IDENTITY_BACKEND=local with RS256 requires IDENTITY_LOCAL_PRIVATE_KEY_FILE "
+                "(or IDENTITY_LOCAL_PUBLIC_KEY_FILE to verify only)."
+            )
+        private_key_pem = public_key_pem = None
+        if algorithm == "RS256":
+            if settings.IDENTITY_LOCAL_PRIVATE_KEY_FILE:
+                with open(settings.IDENTITY_LOCAL_PRIVATE_KEY_FILE, "rb") as f:
+                    private_key_pem = f.read()
+            if settings.IDENTITY_LOCAL_PUBLIC_KEY_FILE:
+                with open(settings.IDENTITY_LOCAL_PUBLIC_KEY_FILE, "rb") as f:
+                    public_key_pem = f.read()
+        return cls(
+            algorithm=algorithm,
+            secret=settings.IDENTITY_LOCAL_SECRET,
+            private_key_pem=private_key_pem,
+            public_key_pem=public_key_pem,
+            issuer=settings.IDENTITY_LOCAL_ISSUER,
+            audience=settings.IDENTITY_LOCAL_AUDIENCE,
+            ttl=settings.IDENTITY_LOCAL_TOKEN_TTL,
+        )
+
+    def mint_token(self, uid, email="", ttl=None, **claims):
+        """
+        Return a signed ID token for the given uid/email.
+
+        Extra keyword arguments are added as claims.
+        """
+        if self._signing_key is None:
+            raise ValueError("This provider has no private key and cannot mint tokens.")
+        now = int(time.time())
+        payload = {
+            "iss": self.issuer,
+            "aud": self.audience,
+            "sub": uid,
+            "email": email,
+            "iat": now,
+            "auth_time": now,
+            "exp": now + (ttl or self.ttl),
+            "jti": uuid.uuid4().hex,
+        }
+        payload.update(claims)
+        return jwt.encode(payload, self._signing_key, algorithm=self.algorithm)
+
+    def verify(self, token):
+        """
+        Returns:
+            The decoded token dict, with "uid" copied from "sub".
+
+        Raises:
+            AuthenticationFailed on invalid/expired tokens.
+        """
+        try:
+            decoded = jwt.decode(
+                token,
+                self._verifying_key,
+                algorithms=[self.algorithm],
+                audience=self.audience,
+                issuer=self.issuer,
+                options={"require": ["exp", "iat", "sub"]},
+            )
+        except jwt.ExpiredSignatureError:
+            raise exceptions.AuthenticationFailed("Token has expired.")
+        except jwt.InvalidTokenError:
+            raise exceptions.AuthenticationFailed("Invalid ID token.")
+
+        decoded["uid"] = decoded["sub"]
+        return decoded
+
+    def stats(self):
+        return {"verifier": "local_identity", "algorithm": self.algorithm}
@@ -0,0 +1,303 @@
+"""
+Signing Key Store for local ID token verification
+
+Holds the public keys (kid → key) that sign Firebase ID tokens so that
+core.authentication.LocalJWTVerifier can check RS256 signatures without
+going through firebase_admin.
+
+Key sources (AUTH_SIGNING_KEYS_SOURCE):
+    url      — Google's x509 cert endpoint. Honours Cache-Control max-age
+               and mirrors the keys to AUTH_SIGNING_KEYS_FILE, so a restart
+               can start verifying before the network is reachable.
+    file     — a JSON file on disk, re-read when its mtime changes
+               (e.g. kept current by a cron job or sidecar).
+    env      — a JSON {kid: pem} bundle in AUTH_SIGNING_KEYS_BUNDLE.
+    fixtures — a directory of <kid>.pem files (test / load-test mode,
+               no network access at all).
+
+Refreshable sources (url, file) are refreshed by a daemon thread shortly
+before the keys expire.
+"""
+
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import urllib.request
+from pathlib import Path
+
+from cryptography import x509
+from cryptography.hazmat.primitives import serialization
+
+logger = logging.getLogger(__name__)
+
+GOOGLE_CERTS_URL = (
+    "https://www.googleapis.com/robot/v1/metadata/x509/"
+    "securetoken@system.gserviceaccount.com"
+)
+
+SOURCES = ("url", "file", "env", "fixtures")
+
+_MAX_AGE_RE = re.compile(r"max-age\s*=\s*(\d+)")
+
+
+def load_public_key(pem):
+    """Load a PEM certificate or public key and return the public key object."""
+    data = pem.encode("utf-8") if isinstance(pem, str) else pem
+    if b"BEGIN CERTIFICATE" in data:
+        return x509.load_pem_x509_certificate(data).public_key()
+    return serialization.load_pem_public_key(data)
+
+
+def parse_max_age(cache_control):
+    """Return the max-age (seconds) from a Cache-Control header, or None."""
+    if not cache_control:
+        return None
+    match = _MAX_AGE_RE.search(cache_control)
+    return int(match.group(1)) if match else None
+
+
+class SigningKeyStore:
+    """
+    In-memory map of kid → public key with a refreshable backing source.
+
+    Args:
+        source: One of SOURCES
+        url: Cert endpoint for the "url" source
+        path: JSON file for the "file" source, and the on-disk mirror for "url"
+        bundle: JSON {kid: pem} string for the "env" source
+        fixture_dir: Directory of <kid>.pem files for the "fixtures" source
+        default_max_age: Lifetime (seconds) used when the source gives none
+        min_refresh_interval: Floor between two refreshes, also used as the
+                              retry delay after a failed refresh
+    """
+
+    def __init__(
+        self,
+        source="url",
+        url=GOOGLE_CERTS_URL,
+        path=None,
+        bundle=None,
+        fixture_dir=None,
+        default_max_age=3600,
+        min_refresh_interval=60,
+    ):
+        if source not in SOURCES:
+            raise ValueError(
+                f"Unknown signing key source '{source}'. Expected one of: {', '.join(SOURCES)}"
+            )
+        self.source = source
+        self.url = url
+        self.path = Path(path) if path else None
+        self.bundle = bundle
+        self.fixture_dir = Path(fixture_dir) if fixture_dir else None
+        self.default_max_age = default_max_age
+        self.min_refresh_interval = min_refresh_interval
+
+        self._keys = {}
+        self._expires_at = 0.0
+        self._last_refresh = 0.0
+        self._file_mtime = None
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop = threading.Event()
+        self._wakeup = threading.Event()
+
+    @property
+    def refreshable(self):
+        return self.source in ("url", "file")
+
+    # ── Lookup ───────────────────────────────────────────────────
+
+    def get_key(self, kid):
+        """
+        Return the public key for a kid, or None if it is unknown.
+
+        Loads the keys on first use. Once they expire, the refresh thread is
+        woken and every caller keeps verifying with the old keys, so no
+        request waits on the network. An unknown kid (Google rotates keys
+        daily) triggers one rate-limited refresh before giving up.
+        """
+        if (not self._keys or time.time() >= self._expires_at) and self._refresh_due():
+            if self._keys and self.refreshable:
+                self.start_background_refresh()
+                self._wakeup.set()
+            else:
+                # Only the first load (or a local source) is done inline
+                self._refresh_if_due(blocking=not self._keys)
+                self.start_background_refresh()
+        key = self._keys.get(kid)
+        if key is None and self.refreshable and self._refresh_due():
+            self._refresh_if_due(blocking=True)
+            key = self._keys.get(kid)
+        return key
+
+    def _refresh_due(self):
+        return time.time() - self._last_refresh >= self.min_refresh_interval
+
+    def _refresh_if_due(self, blocking):
+        """
+        Refresh unless another thread is doing so (non-blocking) or did so
+        while this one waited for the lock (blocking).
+        """
+        if not self._lock.acquire(blocking=blocking):
+            return False
+        try:
+            if not self._refresh_due():
+                return False
+            return self._refresh_locked()
+        finally:
+            self._lock.release()
+
+    def kids(self):
+        return sorted(self._keys)
+
+    # ── Refresh ──────────────────────────────────────────────────
+
+    def refresh(self):
+        """
+        Reload keys from the source.
+
+        On failure the previous keys are kept and the error is logged.
+        Returns True if the key set was (re)loaded.
+        """
+        with self._lock:
+            return self._refresh_locked()
+
+    def _refresh_locked(self):
+        self._last_refresh = time.time()
+        try:
+            pems, max_age = self._load()
+        except Exception as e:
+            logger.error(f"[KEYS] Signing key refresh from {self.source} failed: {e}")
+            return False
+        if pems is None:
+            return False  # Source unchanged since the last load
+
+        keys = {}
+        for kid, pem in pems.items():
+            try:
+                keys[kid] = load_public_key(pem)
+            except ValueError as e:
+                logger.warning(f"[KEYS] Skipping unparsable key kid={kid}: {e}")
+        if not keys:
+            logger.error(f"[KEYS] No usable signing keys from {self.source}")
+            return False
+
+        self._keys = keys
+        self._expires_at = time.time() + (
+            max_age if max_age is not None else self.default_max_age
+        )
+        logger.info(
+            f"[KEYS] Loaded {len(keys)} signing key(s) from {self.source}, "
+            f"valid for {int(self._expires_at - time.time())}s"
+        )
+        return True
+
+    def _load(self):
+        """Return ({kid: pem}, max_age) from the configured source."""
+        if self.source == "url":
+            return self._load_url()
+        if self.source == "file":
+            return self._load_file()
+        if self.source == "env":
+            return json.loads(self.bundle or "{}"), None
+        return self._load_fixtures(), None
+
+    def _load_url(self):
+        # On a cold start prefer a still-valid on-disk mirror over the network
+        if not self._keys and self.path and self.path.exists():
+            pems, expires_at = self._read_mirror()
+            if pems and expires_at > time.time():
+                return pems, expires_at - time.time()
+
+        with urllib.request.urlopen(self.url, timeout=10) as response:
+            pems = json.loads(response.read().decode("utf-8"))
+            max_age = parse_max_age(response.headers.get("Cache-Control"))
+
+        if self.path:
+            self._write_mirror(pems, time.time() + (max_age or self.default_max_age))
+        return pems, max_age
+
+    def _load_file(self):
+        # Checking the mtime is cheap, so poll the file on the minimum interval
+        mtime = self.path.stat().st_mtime
+        if self._keys and mtime == self._file_mtime:
+            self._expires_at = time.time() + self.min_refresh_interval
+            return None, None
+        pems, _ = self._read_mirror()
+        self._file_mtime = mtime
+        return pems, self.min_refresh_interval
+
+    def _load_fixtures(self):
+        return {
+            pem_file.stem: pem_file.read_text()
+            for pem_file in sorted(self.fixture_dir.glob("*.pem"))
+        }
+
+    def _read_mirror(self):
+        """
+        Read a key file. Accepts a plain {kid: pem} mapping or the mirror
+        format {"expires_at": <epoch>, "keys": {kid: pem}}.
+        """
+        data = json.loads(self.path.read_text())
+        if "keys" in data and isinstance(data["keys"], dict):
+            return data["keys"], float(data.get("expires_at") or 0)
+        return data, 0.0
+
+    def _write_mirror(self, pems, expires_at):
+        """Atomically write the fetched keys next to the configured path."""
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            fd, tmp = tempfile.mkstemp(dir=self.path.parent, prefix=".keys-")
+            with os.fdopen(fd, "w") as f:
+                json.dump({"expires_at": expires_at, "keys": pems}, f)
+            os.replace(tmp, self.path)
+        except OSError as e:
+            logger.warning(f"[KEYS] Could not write signing key mirror {self.path}: {e}")
+
+    # ── Background refresh ───────────────────────────────────────
+
+    def start_background_refresh(self):
+        """Start the daemon refresh thread (refreshable sources only, idempotent)."""
+        if not self.refreshable or (self._thread and self._thread.is_alive()):
+            return
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(
+                target=self._refresh_loop,
+                name="helix-signing-keys",
+                daemon=True,
+            )
+            self._thread.start()
+
+    def stop_background_refresh(self):
+        self._stop.set()
+        self._wakeup.set()
+
+    def _refresh_loop(self):
+        while not self._stop.is_set():
+            # Refresh a little before expiry so requests never wait on the
+            # network; get_key() wakes the thread early once the keys expire
+            delay = max(
+                self.min_refresh_interval,
+                (self._expires_at - time.time()) * 0.9,
+            )
+            self._wakeup.wait(delay)
+            self._wakeup.clear()
+            if self._stop.is_set():
+                break
+            self._refresh_if_due(blocking=True)
+
+    def stats(self):
+        return {
+            "source": self.source,
+            "keys": len(self._keys),
+            "expires_in": max(0, int(self._expires_at - time.time())),
+            "background_refresh": bool(self._thread and self._thread.is_alive()),
+        }
@@ -0,0 +1,266 @@
+"""
+Compare the async views (core.async_views) under ASGI with the sync DRF
+views under WSGI: requests/sec, p50 and p99 per endpoint.
+
+By default both stacks run in-process through httpx (ASGITransport and
+WSGITransport, full middleware), driven by --concurrency concurrent
+clients: asyncio tasks on the ASGI side, threads on the WSGI side. The
+response cache is disabled unless --response-cache is given, so every
+request reaches the database. Bodies from both sides are checked to be
+identical before timing.
+
+To measure real servers instead (e.g. uvicorn with ASYNC_VIEWS=True and
+gunicorn with the defaults), pass their base URLs and a token:
+
+    uvicorn helix_backend.asgi:application --port 8001 --workers 4
+    gunicorn helix_backend.wsgi --bind :8000 --workers 4 --threads 8
+    python manage.py benchmark_async --sync-url http://127.0.0.1:8000 \\
+        --async-url http://127.0.0.1:8001 --token "$(python manage.py mint_token \\
+        --email admin@example.com --role ADMIN --create-user)"
+
+In-process runs authenticate a temporary admin (and the owner of the
+first request) by seeding token_cache, so no identity backend is needed.
+Requests are read from the existing data; import some first.
+
+Needs httpx (pip install httpx), and uvicorn / gunicorn for the
+real-server mode; neither is in requirements.txt.
+
+Usage:
+    python manage.py benchmark_async
+    python manage.py benchmark_async --requests 2000 --concurrency 50
+    python manage.py benchmark_async --endpoints me admin-requests
+"""
+
+import asyncio
+import contextlib
+import statistics
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.core.asgi import get_asgi_application
+from django.core.management.base import BaseCommand, CommandError
+from django.core.wsgi import get_wsgi_application
+from django.test import override_settings
+from django.urls import path
+
+from core import async_views, views
+from core.authentication import token_cache
+from core.models import Request, User
+
+try:
+    import httpx
+except ImportError:  # optional: benchmarking only
+    httpx = None
+
+ENDPOINTS = {
+    # name: (path, sync view, async view, token)
+    "me": ("auth/me/", views.AuthMeView, async_views.AsyncAuthMeView, "user"),
+    "requests": (
+        "requests/",
+        views.UserRequestListCreateView,
+        async_views.AsyncUserRequestListView,
+        "user",
+    ),
+    "activities": (
+        "requests/<int:pk>/activities/",
+        views.UserRequestActivitiesView,
+        async_views.AsyncUserRequestActivitiesView,
+        "user",
+    ),
+    "admin-requests": (
+        "admin/requests/",
+        views.AdminRequestListView,
+        async_views.AsyncAdminRequestListView,
+        "admin",
+    ),
+    "admin-activities": (
+        "admin/requests/<int:pk>/activities/",
+        views.AdminRequestActivitiesView,
+        async_views.AsyncAdminRequestActivitiesView,
+        "admin",
+    ),
+}
+
+
+class URLConf:
+    """A ROOT_URLCONF serving only the benchmarked endpoints."""
+
+    def __init__(self, view_index):
+        self.urlpatterns = [
+            path(f"api/{route}", spec[view_index].as_view())
+            for route, *spec in ENDPOINTS.values()
+        ]
+
+
+class Command(BaseCommand):
+    help = "Benchmark the async views under ASGI against the sync views under WSGI."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--endpoints", nargs="+", choices=list(ENDPOINTS), default=list(ENDPOINTS)
+        )
+        parser.add_argument("--requests", type=int, default=500, help="Timed requests per run")
+        parser.add_argument("--concurrency", type=int, default=20)
+        parser.add_argument("--warmup", type=int, default=20, help="Untimed requests per run")
+        parser.add_argument(
+            "--response-cache",
+            action="store_true",
+            help="Keep RESPONSE_CACHE_TTL as configured (disabled by default)",
+        )
+        parser.add_argument("--sync-url", help="Base URL of a running WSGI server")
+        parser.add_argument("--async-url", help="Base URL of a running ASGI server")
+        parser.add_argument(
+            "--token",
+            help="ID token for --sync-url/--async-url (an ADMIN, used for every endpoint)",
+        )
+        parser.add_argument(
+            "--request-id", type=int, help="Request whose activities are fetched"
+        )
+
+    def handle(self, *args, **options):
+        if httpx is None:
+            raise CommandError("benchmark_async needs httpx: pip install httpx")
+        if options["requests"] < 1 or options["concurrency"] < 1 or options["warmup"] < 0:
+            raise CommandError("--requests and --concurrency must be positive.")
+        remote = options["sync_url"] or options["async_url"]
+        if remote and not options["token"]:
+            raise CommandError("--token is required with --sync-url / --async-url.")
+
+        sample = Request.objects.order_by("id").first()
+        request_id = options["request_id"] or (sample.pk if sample else 0)
+        if sample is None:
+            self.stdout.write(self.style.WARNING("No requests in the database; lists will be empty."))
+
+        overrides = {} if options["response_cache"] else {"RESPONSE_CACHE_TTL": 0}
+        admin, created = User.objects.get_or_create(
+            uid="benchmark:async",
+            defaults={"email": "benchmark-async@example.com", "role": User.Role.ADMIN},
+        )
+        tokens = {
+            "admin": self.seed_token(admin),
+            "user": self.seed_token(sample.user if sample else admin),
+        }
+
+        try:
+            with override_settings(**overrides):
+                self.stdout.write(
+                    f"{'endpoint':>16}  {'stack':>6}  {'req/s':>9}  {'p50':>8}  {'p99':>8}"
+                )
+                for name in options["endpoints"]:
+                    route, _, _, token_name = ENDPOINTS[name]
+                    url = "/api/" + route.replace("<int:pk>", str(request_id))
+                    sides = []
+                    for label, base_url, index in (
+                        ("wsgi", options["sync_url"], 0),
+                        ("asgi", options["async_url"], 1),
+                    ):
+                        if base_url:
+                            runner = self.run_remote(base_url, url, options["token"])
+                        else:
+                            runner = self.run_local(index, url, tokens[token_name])
+                        sides.append((label, runner))
+
+                    if not remote:
+                        bodies = [runner(1, 1)[1] for _, runner in sides]
+                        if bodies[0] != bodies[1]:
+                            raise CommandError(f"{name}: sync and async responses differ.")
+
+                    for label, runner in sides:
+                        runner(options["warmup"], options["concurrency"])
+                        latencies, _, elapsed = runner(options["requests"], options["concurrency"])
+                        self.report(name, label, latencies, elapsed)
+        finally:
+            if created:
+                admin.delete()
+
+    def seed_token(self, user):
+        token = f"benchmark-{uuid.uuid4().hex}"
+        token_cache.set(token, {"uid": user.uid, "email": user.email, "exp": time.time() + 3600})
+        return token
+
+    # ── Runners: (count, concurrency) → (latencies, last body, seconds) ──
+
+    def run_local(self, view_index, url, token):
+        host = settings.ALLOWED_HOSTS[0].lstrip(".").replace("*", "localhost") or "localhost"
+        urlconf = URLConf(view_index)
+        headers = {"Authorization": f"Bearer {token}"}
+        if view_index == 1:
+            transport = httpx.ASGITransport(app=get_asgi_application())
+            return self.async_runner(
+                lambda: httpx.AsyncClient(transport=transport, base_url=f"http://{host}"),
+                url,
+                headers,
+                urlconf,
+            )
+        return self.threaded_runner(
+            httpx.WSGITransport(app=get_wsgi_application()), f"http://{host}", url, headers, urlconf
+        )
+
+    def run_remote(self, base_url, url, token):
+        headers = {"Authorization": f"Bearer {token}"}
+        return self.async_runner(lambda: httpx.AsyncClient(base_url=base_url), url, headers, None)
+
+    def async_runner(self, make_client, url, headers, urlconf):
+        def run(count, concurrency):
+            with override_settings(ROOT_URLCONF=urlconf) if urlconf else contextlib.nullcontext():
+                return asyncio.run(self.drive_async(make_client, url, headers, count, concurrency))
+
+        return run
+
+    async def drive_async(self, make_client, url, headers, count, concurrency):
+        latencies = []
+        body = None
+        remaining = iter(range(count))
+
+        async with make_client() as client:
+
+            async def worker():
+                nonlocal body
+                for _ in remaining:
+                    started = time.perf_counter()
+                    response = await client.get(url, headers=headers)
+                    latencies.append(time.perf_counter() - started)
+                    self.check_response(response)
+                    body = response.content
+
+            started = time.perf_counter()
+            await asyncio.gather(*(worker() for _ in range(min(concurrency, count) or 1)))
+            return latencies, body, time.perf_counter() - started
+
+    def threaded_runner(self, transport, base_url, url, headers, urlconf):
+        local = threading.local()
+
+        def get():
+            if not hasattr(local, "client"):
+                local.client = httpx.Client(transport=transport, base_url=base_url)
+            started = time.perf_counter()
+            response = local.client.get(url, headers=headers)
+            elapsed = time.perf_counter() - started
+            self.check_response(response)
+            return elapsed, response.content
+
+        def run(count, concurrency):
+            with override_settings(ROOT_URLCONF=urlconf):
+                with ThreadPoolExecutor(max_workers=concurrency) as pool:
+                    started = time.perf_counter()
+                    results = list(pool.map(lambda _: get(), range(count)))
+                    elapsed = time.perf_counter() - started
+            return [r[0] for r in results], results[-1][1] if results else None, elapsed
+
+        return run
+
+    def check_response(self, response):
+        if response.status_code != 200:
+            raise CommandError(
+                f"GET {response.request.url} returned {response.status_code}: {response.text[:200]}"
+            )
+
+    def report(self, name, label, latencies, elapsed):
+        cuts = statistics.quantiles(latencies, n=100) if len(latencies) > 1 else latencies * 99
+        self.stdout.write(
+            f"{name:>16}  {label:>6}  {len(latencies) / elapsed:>9.1f}  "
+            f"{cuts[49] * 1000:>6.2f}ms  {cuts[98] * 1000:>6.2f}ms"
+        )
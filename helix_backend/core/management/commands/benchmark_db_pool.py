@@ -0,0 +1,106 @@
+"""
+Measure the cost of database connections per request, with or without
+the connection pool (core.db.pool).
+
+--threads threads each run --requests simulated requests: the connection
+handling Django does on request_started / request_finished around one
+small query, optionally holding the connection for --hold ms. Compare a
+run with the defaults against one with DATABASE_POOL=True (and e.g.
+DATABASE_POOL_MAX_SIZE below --threads to see waits):
+
+    python manage.py benchmark_db_pool
+    DATABASE_POOL=True python manage.py benchmark_db_pool
+    DATABASE_POOL=True DATABASE_POOL_MAX_SIZE=4 python manage.py benchmark_db_pool --hold 5
+
+Works against any configured database (SQLite file or Postgres).
+
+Usage:
+    python manage.py benchmark_db_pool
+    python manage.py benchmark_db_pool --threads 32 --requests 500
+"""
+
+import statistics
+import threading
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, close_old_connections, connections
+from django.db.backends.signals import connection_created
+
+from core.db import pool as db_pool
+
+
+class Command(BaseCommand):
+    help = "Benchmark per-request database connection handling (pooled or not)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=16)
+        parser.add_argument("--requests", type=int, default=200, help="Requests per thread")
+        parser.add_argument("--hold", type=float, default=0.0, help="ms to hold the connection")
+        parser.add_argument("--database", default=DEFAULT_DB_ALIAS)
+
+    def handle(self, *args, **options):
+        if options["threads"] < 1 or options["requests"] < 1:
+            raise CommandError("--threads and --requests must be positive.")
+        alias = options["database"]
+        connection = connections[alias]
+        self.stdout.write(
+            f"{connection.settings_dict['ENGINE']} ({connection.vendor}), "
+            f"CONN_MAX_AGE={connection.settings_dict['CONN_MAX_AGE']}"
+        )
+        connection.close()
+
+        connects = []
+        connection_created.connect(lambda sender, connection, **kwargs: connects.append(1))
+        latencies = []
+        errors = []
+        lock = threading.Lock()
+        barrier = threading.Barrier(options["threads"])
+        hold = options["hold"] / 1000
+
+        def worker():
+            timings = []
+            try:
+                barrier.wait()
+                for _ in range(options["requests"]):
+                    started = time.perf_counter()
+                    close_old_connections()
+                    with connections[alias].cursor() as cursor:
+                        cursor.execute("SELECT COUNT(*) FROM core_request")
+                        cursor.fetchone()
+                    if hold:
+                        time.sleep(hold)
+                    close_old_connections()
+                    timings.append(time.perf_counter() - started)
+            except Exception as e:
+                with lock:
+                    errors.append(repr(e))
+            finally:
+                connections[alias].close()
+                with lock:
+                    latencies.extend(timings)
+
+        threads = [threading.Thread(target=worker) for _ in range(options["threads"])]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - started
+
+        if not latencies:
+            raise CommandError(f"No request completed: {errors[:3]}")
+        latencies.sort()
+        p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+        self.stdout.write(
+            f"{len(latencies)} requests x {options['threads']} threads in {elapsed:.2f}s: "
+            f"{len(latencies) / elapsed:.0f} req/s, "
+            f"p50 {statistics.median(latencies) * 1000:.2f} ms, p99 {p99 * 1000:.2f} ms, "
+            f"{len(connects)} connection checkouts"
+        )
+        for name, stats in db_pool.pool_stats().items():
+            self.stdout.write(f"pool '{name}': {stats}")
+        if errors:
+            for error in errors[:5]:
+                self.stderr.write(error)
+            raise CommandError(f"{len(errors)} thread(s) failed.")
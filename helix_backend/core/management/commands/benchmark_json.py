@@ -0,0 +1,161 @@
+"""
+Compare DRF's JSONRenderer/JSONParser with FastJSONRenderer/FastJSONParser.
+
+Two measurements per page size:
+    render   — render a page of the request list (RequestListSerializer
+               data) and an activity log, then parse it back
+    endpoint — GET /api/admin/requests/?page=1 with the page size set to
+               the row count, through AdminRequestListView with each
+               renderer (query + serialization + rendering)
+
+Rendered bytes are checked to be identical. Missing rows are created in
+a transaction that is rolled back at the end.
+
+Usage:
+    python manage.py benchmark_json
+    python manage.py benchmark_json --sizes 20 100 1000 --repeat 50
+"""
+
+import io
+import statistics
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.parsers import JSONParser
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core.models import Request, RequestActivity, User
+from core.parsers import FastJSONParser
+from core.renderers import FastJSONRenderer
+from core.serializers import RequestActivitySerializer, RequestListSerializer
+from core.views import AdminRequestListView
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark the fast JSON renderer/parser against DRF's stdlib ones."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[20, 100, 1000])
+        parser.add_argument("--repeat", type=int, default=20, help="Timed runs per size")
+
+    def handle(self, *args, **options):
+        sizes = options["sizes"]
+        repeat = options["repeat"]
+        if repeat < 1 or min(sizes) < 1:
+            raise CommandError("--sizes and --repeat must be positive.")
+        if FastJSONRenderer().backend is None:
+            self.stdout.write(self.style.WARNING("orjson is not in use; both sides run stdlib json."))
+
+        try:
+            with transaction.atomic():
+                admin = self.ensure_rows(max(sizes))
+                self.stdout.write(
+                    f"{'case':>10}  {'payload':>10}  {'stdlib':>10}  {'fast':>10}  {'speedup':>8}"
+                )
+                for size in sizes:
+                    self.run_render(size, repeat)
+                for size in sizes:
+                    self.run_endpoint(size, repeat, admin)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def ensure_rows(self, count):
+        admin, _ = User.objects.get_or_create(
+            uid="benchmark:admin",
+            defaults={"email": "benchmark-admin@example.com", "role": User.Role.ADMIN},
+        )
+        missing = count - Request.objects.count()
+        if missing > 0:
+            requests = Request.objects.bulk_create(
+                Request(
+                    user=admin,
+                    title=f"Benchmark request {i} — ünïcødé",
+                    description="Generated by benchmark_json. " * 4,
+                    assigned_to=admin if i % 2 else None,
+                )
+                for i in range(missing)
+            )
+            RequestActivity.objects.bulk_create(
+                RequestActivity(
+                    request=requests[0],
+                    action=RequestActivity.Action.CREATED,
+                    detail=f"Benchmark activity {i}",
+                    performed_by=admin,
+                )
+                for i in range(missing)
+            )
+            self.stdout.write(f"Created {missing} temporary request(s).")
+        return admin
+
+    def run_render(self, size, repeat):
+        rows = Request.objects.values(*RequestListSerializer.values_fields)[:size]
+        activities = RequestActivity.objects.select_related("performed_by")[:size]
+        payload = {
+            "next": None,
+            "previous": None,
+            "results": RequestListSerializer(rows, many=True).data,
+            "activities": RequestActivitySerializer(activities, many=True).data,
+        }
+
+        def roundtrip(renderer, parser):
+            body = renderer.render(payload)
+            parser.parse(io.BytesIO(body))
+            return body
+
+        stdlib = (JSONRenderer(), JSONParser())
+        fast = (FastJSONRenderer(), FastJSONParser())
+        body = roundtrip(*stdlib)
+        if body != roundtrip(*fast):
+            raise CommandError(f"Rendered output differs at {size} rows.")
+        self.report(f"render {size}", len(body), roundtrip, stdlib, fast, repeat)
+
+    def run_endpoint(self, size, repeat, admin):
+        host = settings.ALLOWED_HOSTS[0].lstrip(".").replace("*", "localhost") or "localhost"
+        factory = APIRequestFactory(HTTP_HOST=host)
+        views = [
+            AdminRequestListView.as_view(renderer_classes=[renderer])
+            for renderer in (JSONRenderer, FastJSONRenderer)
+        ]
+
+        def get(view):
+            request = factory.get("/api/admin/requests/", {"page": 1})
+            force_authenticate(request, user=admin)
+            response = view(request)
+            response.render()
+            return response.content
+
+        # Page size of the page-number mode, so one call returns `size` rows
+        previous = AdminRequestListView.pagination_class.page_number_class.page_size
+        AdminRequestListView.pagination_class.page_number_class.page_size = size
+        try:
+            body = get(views[0])
+            if body != get(views[1]):
+                raise CommandError(f"Endpoint output differs at {size} rows.")
+            self.report(f"GET {size}", len(body), get, (views[0],), (views[1],), repeat)
+        finally:
+            AdminRequestListView.pagination_class.page_number_class.page_size = previous
+
+    def report(self, label, payload_size, func, stdlib_args, fast_args, repeat):
+        stdlib_ms = self.time(func, stdlib_args, repeat)
+        fast_ms = self.time(func, fast_args, repeat)
+        self.stdout.write(
+            f"{label:>10}  {payload_size / 1024:>8.1f}KB  {stdlib_ms:>8.2f}ms  "
+            f"{fast_ms:>8.2f}ms  {stdlib_ms / fast_ms:>7.1f}x"
+        )
+
+    @staticmethod
+    def time(func, args, repeat):
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func(*args)
+            samples.append((time.perf_counter() - started) * 1000)
+        return statistics.median(samples)
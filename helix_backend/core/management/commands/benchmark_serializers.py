@@ -0,0 +1,103 @@
+"""
+Compare RequestSerializer with the RequestListSerializer fast path.
+
+For each page size the command times fetching + serializing + rendering
+a page of requests both ways, and checks that the rendered JSON is
+byte-identical. Missing rows are created inside a transaction that is
+rolled back at the end, so the database is left untouched.
+
+Usage:
+    python manage.py benchmark_serializers
+    python manage.py benchmark_serializers --sizes 20 100 1000 --repeat 50
+"""
+
+import statistics
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+
+from core.models import Request, User
+from core.serializers import RequestListSerializer, RequestSerializer
+
+
+class Rollback(Exception):
+    pass
+
+
+class Command(BaseCommand):
+    help = "Benchmark RequestSerializer against RequestListSerializer."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--sizes", type=int, nargs="+", default=[20, 100, 1000])
+        parser.add_argument("--repeat", type=int, default=20, help="Timed runs per size")
+
+    def handle(self, *args, **options):
+        sizes = options["sizes"]
+        repeat = options["repeat"]
+        if repeat < 1 or min(sizes) < 1:
+            raise CommandError("--sizes and --repeat must be positive.")
+
+        try:
+            with transaction.atomic():
+                self.ensure_rows(max(sizes))
+                self.stdout.write(f"{'rows':>6}  {'serializer':>12}  {'fast path':>12}  {'speedup':>8}")
+                for size in sizes:
+                    self.run_size(size, repeat)
+                raise Rollback
+        except Rollback:
+            pass
+
+    def ensure_rows(self, count):
+        missing = count - Request.objects.count()
+        if missing <= 0:
+            return
+        owner, _ = User.objects.get_or_create(
+            uid="benchmark:owner", defaults={"email": "benchmark-owner@example.com"}
+        )
+        admin, _ = User.objects.get_or_create(
+            uid="benchmark:admin",
+            defaults={"email": "benchmark-admin@example.com", "role": User.Role.ADMIN},
+        )
+        Request.objects.bulk_create(
+            Request(
+                user=owner,
+                title=f"Benchmark request {i}",
+                description="Generated by benchmark_serializers.",
+                assigned_to=admin if i % 2 else None,
+                priority=Request.Priority.values[i % len(Request.Priority.values)],
+            )
+            for i in range(missing)
+        )
+        self.stdout.write(f"Created {missing} temporary request(s).")
+
+    def run_size(self, size, repeat):
+        renderer = JSONRenderer()
+        queryset = Request.objects.order_by("-created_at", "-id")
+
+        def full():
+            rows = queryset.select_related("user", "assigned_to")[:size]
+            return renderer.render(RequestSerializer(rows, many=True).data)
+
+        def fast():
+            rows = queryset.values(*RequestListSerializer.values_fields)[:size]
+            return renderer.render(RequestListSerializer(rows, many=True).data)
+
+        if full() != fast():
+            raise CommandError(f"Output differs at {size} rows.")
+
+        full_ms = self.time(full, repeat)
+        fast_ms = self.time(fast, repeat)
+        self.stdout.write(
+            f"{size:>6}  {full_ms:>10.2f}ms  {fast_ms:>10.2f}ms  {full_ms / fast_ms:>7.1f}x"
+        )
+
+    @staticmethod
+    def time(func, repeat):
+        samples = []
+        for _ in range(repeat):
+            started = time.perf_counter()
+            func()
+            samples.append((time.perf_counter() - started) * 1000)
+        return statistics.median(samples)
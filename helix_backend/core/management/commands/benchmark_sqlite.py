@@ -0,0 +1,202 @@
+"""
+Benchmark concurrent reads and writes on SQLite with the default
+settings and with the tuned profile (SQLITE_TUNED, see core.db.sqlite).
+
+For each profile the configured database is copied to a scratch file
+(the real one is not touched) and, for --duration seconds:
+
+    --readers processes  list the 50 newest requests
+    --writers processes  create a request, move it to REVIEWING, then to
+                         IN_PROGRESS with a bulk change through
+                         core.services (three write transactions)
+
+Workers are forked processes, like the workers of a WSGI server: threads
+in one process would mostly measure contention on the GIL.
+
+    default — rollback journal, Django's connection settings, no retries
+    tuned   — SQLITE_PRAGMAS (WAL, synchronous=NORMAL, busy_timeout,
+              mmap_size, cache_size) and SQLITE_LOCK_RETRIES retries
+
+Reported per profile: reads/s, writes/s, p99 write latency and the
+number of writes that failed with "database is locked".
+
+Usage:
+    python manage.py benchmark_sqlite
+    python manage.py benchmark_sqlite --readers 16 --writers 8 --duration 10
+"""
+
+import multiprocessing
+import shutil
+import sqlite3
+import statistics
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connection, connections
+from django.test.utils import override_settings
+
+from core import activity_log, services
+from core.db import sqlite
+from core.models import Request, User
+
+PROFILES = ("default", "tuned")
+
+
+class Command(BaseCommand):
+    help = "Benchmark concurrent SQLite reads/writes with and without the tuned profile."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--readers", type=int, default=8)
+        parser.add_argument("--writers", type=int, default=4)
+        parser.add_argument("--duration", type=float, default=5.0, help="Seconds per profile")
+        parser.add_argument("--profiles", nargs="+", choices=PROFILES, default=list(PROFILES))
+
+    def handle(self, *args, **options):
+        if connection.vendor != "sqlite" or connection.is_in_memory_db():
+            raise CommandError("The default database must be an SQLite file.")
+        if options["writers"] < 1 or options["readers"] < 0 or options["duration"] <= 0:
+            raise CommandError("Need at least one writer and a positive --duration.")
+
+        db_settings = connections.settings[DEFAULT_DB_ALIAS]
+        source = db_settings["NAME"]
+        scratch = Path(tempfile.mkdtemp(prefix="helix-sqlite-bench-"))
+        results = []
+        try:
+            for profile in options["profiles"]:
+                target = scratch / f"{profile}.sqlite3"
+                connection.close()
+                with sqlite3.connect(source) as src, sqlite3.connect(target) as dst:
+                    src.backup(dst)
+                db_settings["NAME"] = str(target)
+                results.append((profile, self.run_profile(profile, options)))
+                connection.close()
+        finally:
+            db_settings["NAME"] = source
+            shutil.rmtree(scratch, ignore_errors=True)
+
+        self.stdout.write(
+            f"\n{'profile':<9} {'reads/s':>9} {'writes/s':>9} {'write p99':>10} "
+            f"{'locked':>7} {'retries':>8}"
+        )
+        for profile, result in results:
+            self.stdout.write(
+                f"{profile:<9} {result['reads/s']:>9.0f} {result['writes/s']:>9.0f} "
+                f"{result['write_p99_ms']:>8.1f}ms {result['locked']:>7} {result['retries']:>8}"
+            )
+
+    def run_profile(self, profile, options):
+        tuned = profile == "tuned"
+        overrides = {"SQLITE_TUNED": tuned}
+        if not tuned:
+            overrides["SQLITE_LOCK_RETRIES"] = 0
+
+        with override_settings(**overrides):
+            with connection.cursor() as cursor:
+                cursor.execute(f"PRAGMA journal_mode = {'WAL' if tuned else 'DELETE'}")
+            admin, _ = User.objects.get_or_create(
+                uid="benchmark:sqlite",
+                defaults={"email": "benchmark-sqlite@example.com", "role": User.Role.ADMIN},
+            )
+            # Forked workers must open their own connections
+            connection.close()
+
+            context = multiprocessing.get_context("fork")
+            results = context.Queue()
+            barrier = context.Barrier(options["readers"] + options["writers"])
+            workers = [
+                context.Process(target=read_loop, args=(barrier, results, options["duration"]))
+                for _ in range(options["readers"])
+            ]
+            workers += [
+                context.Process(
+                    target=write_loop, args=(barrier, results, options["duration"], admin, number)
+                )
+                for number in range(options["writers"])
+            ]
+            for worker in workers:
+                worker.start()
+            outcomes = [results.get() for _ in workers]
+            for worker in workers:
+                worker.join()
+
+        counts = Counter()
+        write_latencies = []
+        errors = []
+        for outcome in outcomes:
+            counts.update(outcome["counts"])
+            write_latencies.extend(outcome["latencies"])
+            errors.extend(outcome["errors"])
+        if errors:
+            for error in errors[:5]:
+                self.stderr.write(f"{profile}: {error}")
+            raise CommandError(f"{len(errors)} worker(s) failed in the {profile} profile.")
+
+        write_latencies.sort()
+        p99 = (
+            write_latencies[min(len(write_latencies) - 1, int(len(write_latencies) * 0.99))]
+            if write_latencies
+            else 0.0
+        )
+        elapsed = options["duration"]
+        result = {
+            "reads/s": counts["reads"] / elapsed,
+            "writes/s": counts["writes"] / elapsed,
+            "write_p50_ms": statistics.median(write_latencies) * 1000 if write_latencies else 0.0,
+            "write_p99_ms": p99 * 1000,
+            "locked": counts["locked"],
+            "retries": counts["retries"],
+        }
+        self.stdout.write(f"{profile}: {result}")
+        return result
+
+
+def read_loop(barrier, results, duration):
+    outcome = {"counts": Counter(), "latencies": [], "errors": []}
+    try:
+        barrier.wait()
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            list(Request.objects.order_by("-created_at").values("id", "status")[:50])
+            outcome["counts"]["reads"] += 1
+    except Exception as e:
+        outcome["errors"].append(repr(e))
+    finally:
+        connection.close()
+        results.put(outcome)
+
+
+def write_loop(barrier, results, duration, admin, number):
+    outcome = {"counts": Counter(), "latencies": [], "errors": []}
+    try:
+        barrier.wait()
+        deadline = time.perf_counter() + duration
+        while time.perf_counter() < deadline:
+            started = time.perf_counter()
+            try:
+                request_obj = services.create_request(
+                    user=admin, title=f"SQLite benchmark {number}", description="benchmark_sqlite"
+                )
+                services.change_request_status(request_obj, Request.Status.REVIEWING, admin)
+                # Reads, then writes in one transaction (SELECT ... FOR UPDATE
+                # is a plain SELECT on SQLite)
+                services.bulk_change_request_status(
+                    [request_obj.pk], Request.Status.IN_PROGRESS, admin
+                )
+            except OperationalError as e:
+                if not sqlite.is_locked_error(e):
+                    raise
+                outcome["counts"]["locked"] += 1
+                continue
+            outcome["latencies"].append(time.perf_counter() - started)
+            outcome["counts"]["writes"] += 3
+        # Forked processes exit without running atexit handlers
+        activity_log.flush()
+    except Exception as e:
+        outcome["errors"].append(repr(e))
+    finally:
+        outcome["counts"]["retries"] = sqlite.stats()["retries"]
+        connection.close()
+        results.put(outcome)
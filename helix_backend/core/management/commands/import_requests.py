@@ -0,0 +1,84 @@
+"""
+Bulk import requests from a JSON-lines file.
+
+Each line is one request:
+    {"user_email": "a@b.com", "title": "...", "description": "...", "priority": "HIGH"}
+
+Usage:
+    python manage.py import_requests tickets.jsonl
+    python manage.py import_requests tickets.jsonl --chunk-size 5000 --create-users
+    python manage.py import_requests - --dry-run < tickets.jsonl
+"""
+
+import json
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+from core import services
+from core.parsers import iter_json_lines
+
+
+class Command(BaseCommand):
+    help = "Bulk import requests from a JSON-lines file (use '-' for stdin)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="JSON-lines file, or - for stdin")
+        parser.add_argument("--chunk-size", type=int, default=1000, help="Rows per transaction")
+        parser.add_argument(
+            "--create-users",
+            action="store_true",
+            help="Create missing users with a placeholder uid",
+        )
+        parser.add_argument("--dry-run", action="store_true", help="Validate only, write nothing")
+        parser.add_argument(
+            "--errors-file",
+            help="Write per-line errors as JSON lines to this file",
+        )
+
+    def handle(self, *args, **options):
+        if options["chunk_size"] < 1:
+            raise CommandError("--chunk-size must be at least 1.")
+
+        def progress(report):
+            self.stderr.write(
+                f"chunk {report['chunks']}: {report['processed']} rows, "
+                f"{report['created']} created, {report['failed']} failed, "
+                f"{report['rows_per_second']} rows/s"
+            )
+
+        if options["path"] == "-":
+            stream = sys.stdin.buffer
+        else:
+            try:
+                stream = open(options["path"], "rb")
+            except OSError as e:
+                raise CommandError(f"Cannot open {options['path']}: {e}")
+
+        with stream:
+            report = services.bulk_import_requests(
+                rows=iter_json_lines(stream),
+                chunk_size=options["chunk_size"],
+                create_users=options["create_users"],
+                dry_run=options["dry_run"],
+                max_errors=sys.maxsize if options["errors_file"] else 1000,
+                on_chunk=progress,
+            )
+
+        if options["errors_file"]:
+            with open(options["errors_file"], "w") as f:
+                for error in report["errors"]:
+                    f.write(json.dumps(error) + "\n")
+        else:
+            for error in report["errors"][:20]:
+                self.stderr.write(f"line {error['line']}: {json.dumps(error['errors'])}")
+            if report["failed"] > 20:
+                self.stderr.write(f"... {report['failed'] - 20} more (use --errors-file)")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{'Validated' if options['dry_run'] else 'Imported'} {report['created']} "
+                f"request(s), {report['failed']} failed, in {report['elapsed_seconds']}s "
+                f"({report['rows_per_second']} rows/s)"
+            )
+        )
@@ -0,0 +1,113 @@
+"""
+Report startup import time per module.
+
+Boots Django in a fresh interpreter under `python -X importtime` and
+summarises the result, so worker cold-start regressions (e.g. a heavy SDK
+imported at module level) show up before deploy.
+
+Usage:
+    python manage.py profile_imports
+    python manage.py profile_imports --target wsgi --top 40
+    python manage.py profile_imports --target auth --sort self
+    python manage.py profile_imports --match firebase
+"""
+
+import os
+import subprocess
+import sys
+
+from django.core.management.base import BaseCommand, CommandError
+
+# What each target imports after django.setup()
+TARGETS = {
+    "setup": "",
+    "urls": "from django.urls import get_resolver; get_resolver().url_patterns",
+    "wsgi": "import helix_backend.wsgi",
+    # Worker boot plus what the first authenticated request loads
+    "auth": (
+        "import helix_backend.wsgi; "
+        "from core.authentication import warm_up; warm_up()"
+    ),
+}
+
+
+def parse_importtime(stderr):
+    """
+    Parse `-X importtime` output into a list of
+    (module, self_us, cumulative_us, depth) tuples.
+    """
+    rows = []
+    for line in stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        try:
+            self_us, cumulative_us, name = line.split("|", 2)
+            self_us = int(self_us.split(":")[-1])
+            cumulative_us = int(cumulative_us)
+        except ValueError:
+            continue  # Header line
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        rows.append((name.strip(), self_us, cumulative_us, depth))
+    return rows
+
+
+class Command(BaseCommand):
+    help = "Report startup import time per module (python -X importtime)."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target", choices=sorted(TARGETS), default="wsgi")
+        parser.add_argument("--top", type=int, default=25, help="Number of modules to show")
+        parser.add_argument(
+            "--sort",
+            choices=["cumulative", "self"],
+            default="cumulative",
+            help="Sort by time including sub-imports (cumulative) or own time (self)",
+        )
+        parser.add_argument(
+            "--match",
+            help="Only show modules whose name contains this string",
+        )
+        parser.add_argument(
+            "--all-depths",
+            action="store_true",
+            help="Include nested imports (default: top-level package imports only)",
+        )
+
+    def handle(self, *args, **options):
+        code = (
+            "import django; django.setup(); "
+            + TARGETS[options["target"]]
+        )
+        env = dict(os.environ)
+        env.setdefault("DJANGO_SETTINGS_MODULE", "helix_backend.settings")
+
+        result = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+        )
+        if result.returncode != 0:
+            raise CommandError(f"Startup failed:\n{result.stderr[-2000:]}")
+
+        rows = parse_importtime(result.stderr)
+        total_us = sum(cumulative for _, _, cumulative, depth in rows if depth == 0)
+
+        if options["match"]:
+            rows = [row for row in rows if options["match"] in row[0]]
+        elif not options["all_depths"]:
+            rows = [row for row in rows if row[3] == 0]
+
+        sort_index = 2 if options["sort"] == "cumulative" else 1
+        rows.sort(key=lambda row: row[sort_index], reverse=True)
+
+        self.stdout.write(f"{'cumulative ms':>14} {'self ms':>9}  module")
+        for name, self_us, cumulative_us, depth in rows[: options["top"]]:
+            self.stdout.write(
+                f"{cumulative_us / 1000:>14.1f} {self_us / 1000:>9.1f}  {'  ' * depth}{name}"
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Total import time for target '{options['target']}': {total_us / 1000:.1f} ms"
+            )
+        )
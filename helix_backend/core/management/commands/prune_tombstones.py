@@ -0,0 +1,39 @@
+"""
+Delete request tombstones older than CHANGE_FEED_TOMBSTONE_DAYS.
+
+Change feed cursors older than that are already rejected, so nothing can
+still need them. Run it from cron, e.g. daily:
+
+    python manage.py prune_tombstones
+    python manage.py prune_tombstones --days 7
+"""
+
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+
+from core.models import RequestTombstone
+
+
+class Command(BaseCommand):
+    help = "Delete request tombstones older than the change feed retention period."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--days",
+            type=int,
+            default=settings.CHANGE_FEED_TOMBSTONE_DAYS,
+            help="Keep tombstones this many days (default: CHANGE_FEED_TOMBSTONE_DAYS)",
+        )
+
+    def handle(self, *args, **options):
+        if options["days"] < settings.CHANGE_FEED_TOMBSTONE_DAYS:
+            raise CommandError(
+                "--days cannot be below CHANGE_FEED_TOMBSTONE_DAYS: feed cursors within "
+                "the retention period would miss deletions."
+            )
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        deleted, _ = RequestTombstone.objects.filter(deleted_at__lt=cutoff).delete()
+        self.stdout.write(self.style.SUCCESS(f"Deleted {deleted} tombstone(s) older than {cutoff}."))
@@ -0,0 +1,65 @@
+"""
+Rebuild the RequestCounter table from core_request, or check it for drift.
+
+Usage:
+    python manage.py rebuild_request_counters --check   # report drift, exit 1 if any
+    python manage.py rebuild_request_counters           # recompute and overwrite
+
+Drift appears when requests are changed outside core.services
+(Django admin, raw SQL, restored backups).
+"""
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from core.models import RequestCounter
+from core.services import count_requests
+
+
+class Command(BaseCommand):
+    help = "Rebuild the denormalized request counters, or check them for drift."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--check",
+            action="store_true",
+            help="Only compare the counters with core_request; exit with status 1 on drift",
+        )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            # Lock the existing counters so service-layer updates wait for us
+            stored = {
+                (counter.dimension, counter.value): counter
+                for counter in RequestCounter.objects.select_for_update()
+            }
+            actual = count_requests()
+
+            drift = []
+            for key in sorted(set(stored) | set(actual)):
+                stored_count = stored[key].count if key in stored else 0
+                if stored_count != actual.get(key, 0):
+                    drift.append((key, stored_count, actual.get(key, 0)))
+
+            for (dimension, value), stored_count, actual_count in drift:
+                self.stdout.write(
+                    f"{dimension}:{value or '-'}  stored={stored_count}  actual={actual_count}"
+                )
+
+            if options["check"]:
+                if drift:
+                    raise CommandError(f"{len(drift)} counter(s) drifted.")
+                self.stdout.write(self.style.SUCCESS("Request counters are consistent."))
+                return
+
+            for (dimension, value), _, actual_count in drift:
+                if (dimension, value) in stored:
+                    counter = stored[(dimension, value)]
+                    counter.count = actual_count
+                    counter.save(update_fields=["count", "updated_at"])
+                else:
+                    RequestCounter.objects.create(
+                        dimension=dimension, value=value, count=actual_count
+                    )
+
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt request counters ({len(drift)} fixed)."))
@@ -0,0 +1,47 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:09
+
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def populate_counters(apps, schema_editor):
+    """Seed the counters from the requests that already exist."""
+    Request = apps.get_model('core', 'Request')
+    RequestCounter = apps.get_model('core', 'RequestCounter')
+
+    counters = [RequestCounter(dimension='TOTAL', value='', count=Request.objects.count())]
+    for dimension, field in (('STATUS', 'status'), ('PRIORITY', 'priority'), ('ASSIGNEE', 'assigned_to')):
+        for row in Request.objects.order_by().values(field).annotate(n=Count('id')):
+            value = '' if row[field] is None else str(row[field])
+            counters.append(RequestCounter(dimension=dimension, value=value, count=row['n']))
+    RequestCounter.objects.bulk_create(counters)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0002_requestactivity_request_assigned_to_request_priority_and_more'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RequestCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('dimension', models.CharField(choices=[('TOTAL', 'Total'), ('STATUS', 'Status'), ('PRIORITY', 'Priority'), ('ASSIGNEE', 'Assignee')], help_text='What the requests are grouped by', max_length=10)),
+                ('value', models.CharField(blank=True, default='', help_text="Status/priority code or assignee user id ('' = total / unassigned)", max_length=32)),
+                ('count', models.BigIntegerField(default=0, help_text='Number of requests with this value')),
+                ('updated_at', models.DateTimeField(auto_now=True, help_text='When the counter last changed')),
+            ],
+            options={
+                'verbose_name': 'Request Counter',
+                'verbose_name_plural': 'Request Counters',
+                'ordering': ['dimension', 'value'],
+            },
+        ),
+        migrations.AddConstraint(
+            model_name='requestcounter',
+            constraint=models.UniqueConstraint(fields=('dimension', 'value'), name='unique_request_counter'),
+        ),
+        migrations.RunPython(populate_counters, migrations.RunPython.noop),
+    ]
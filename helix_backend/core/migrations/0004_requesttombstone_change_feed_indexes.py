@@ -0,0 +1,44 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:20
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0003_requestcounter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RequestTombstone',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('request_id', models.BigIntegerField(help_text='ID of the deleted request')),
+                ('owner_id', models.BigIntegerField(help_text='ID of the user who owned the deleted request')),
+                ('deleted_at', models.DateTimeField(default=django.utils.timezone.now, help_text='When the request was deleted')),
+            ],
+            options={
+                'verbose_name': 'Request Tombstone',
+                'verbose_name_plural': 'Request Tombstones',
+                'ordering': ['deleted_at', 'id'],
+            },
+        ),
+        migrations.AddIndex(
+            model_name='request',
+            index=models.Index(fields=['updated_at', 'id'], name='core_reques_updated_7c6856_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='requestactivity',
+            index=models.Index(fields=['timestamp', 'id'], name='core_reques_timesta_c2de5a_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='requesttombstone',
+            index=models.Index(fields=['deleted_at', 'id'], name='core_reques_deleted_2b22f2_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='requesttombstone',
+            index=models.Index(fields=['owner_id', 'deleted_at'], name='core_reques_owner_i_6fbc6a_idx'),
+        ),
+    ]
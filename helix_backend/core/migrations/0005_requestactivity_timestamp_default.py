@@ -0,0 +1,19 @@
+# Generated by Django 4.2.30 on 2026-10-17 04:32
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_requesttombstone_change_feed_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='requestactivity',
+            name='timestamp',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False, help_text='When the action occurred'),
+        ),
+    ]
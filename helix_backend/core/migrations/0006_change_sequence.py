@@ -0,0 +1,68 @@
+# Generated by Django 4.2.30 on 2026-10-17 05:08
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+def create_sequence(apps, schema_editor):
+    """The single counter row; existing rows keep change_seq 0 (synced by id)."""
+    ChangeSequence = apps.get_model('core', 'ChangeSequence')
+    ChangeSequence.objects.get_or_create(pk=1)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0005_requestactivity_timestamp_default'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ChangeSequence',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('value', models.BigIntegerField(default=0, help_text='Last value handed out')),
+                ('updated_at', models.DateTimeField(default=django.utils.timezone.now, help_text='When the last value was handed out')),
+            ],
+            options={
+                'verbose_name': 'Change Sequence',
+                'verbose_name_plural': 'Change Sequence',
+            },
+        ),
+        migrations.AddField(
+            model_name='request',
+            name='change_seq',
+            field=models.BigIntegerField(default=0, editable=False, help_text='ChangeSequence value of the last write (change feed position)'),
+        ),
+        migrations.AddField(
+            model_name='requestactivity',
+            name='change_seq',
+            field=models.BigIntegerField(default=0, editable=False, help_text='ChangeSequence value of the last write (change feed position)'),
+        ),
+        migrations.AddField(
+            model_name='requesttombstone',
+            name='change_seq',
+            field=models.BigIntegerField(default=0, editable=False, help_text='ChangeSequence value of the last write (change feed position)'),
+        ),
+        migrations.AddIndex(
+            model_name='request',
+            index=models.Index(fields=['change_seq', 'id'], name='core_reques_change__2b8396_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='request',
+            index=models.Index(fields=['user', 'change_seq'], name='core_reques_user_id_fea334_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='requestactivity',
+            index=models.Index(fields=['change_seq', 'id'], name='core_reques_change__bd445f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='requesttombstone',
+            index=models.Index(fields=['change_seq', 'id'], name='core_reques_change__79976f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='requesttombstone',
+            index=models.Index(fields=['owner_id', 'change_seq'], name='core_reques_owner_i_fb8558_idx'),
+        ),
+        migrations.RunPython(create_sequence, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.30 on 2026-10-17 05:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0006_change_sequence'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='requestactivity',
+            name='log_id',
+            field=models.UUIDField(blank=True, editable=False, help_text='Write-behind entry id (buffered activity log only)', null=True, unique=True),
+        ),
+    ]
@@ -4,9 +4,18 @@ Database Models for Helix Platform — Phase 2
 User            — linked to Firebase Authentication via UID
 Request         — service/feature requests with workflow states
 RequestActivity — audit log for all request actions
+RequestTombstone — deleted request markers for the change feed
+RequestCounter  — denormalized request counts per status/priority/assignee
+ChangeSequence  — commit-ordered sequence positioning writes in the change feed
 """
 
-from django.db import models
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.db import DEFAULT_DB_ALIAS, models, transaction
+from django.db.models import F
+from django.db.transaction import TransactionManagementError
+from django.utils import timezone
 
 
 class User(models.Model):
@@ -66,7 +75,150 @@ class User(models.Model):
         return self.role == self.Role.ADMIN
 
 
-class Request(models.Model):
+class ChangeSequence(models.Model):
+    """
+    Single-row counter that positions writes in the change feed
+    (core.changes).
+
+    Rows written inside batch() (every service-layer write transaction)
+    are registered with track() and stamped with one value from
+    allocate() as the last statements before the batch commits. The
+    UPDATE locks the row until that commit, so values are handed out in
+    commit order: once a reader sees value N committed, nothing at or
+    below N can still appear. Writers only queue on this row for the
+    stamp and the commit, not for the whole transaction. User writes
+    advance() the sequence too, and the list ETags (core.views) hash the
+    current value.
+    """
+
+    value = models.BigIntegerField(
+        default=0,
+        help_text="Last value handed out",
+    )
+    updated_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="When the last value was handed out",
+    )
+
+    class Meta:
+        verbose_name = "Change Sequence"
+        verbose_name_plural = "Change Sequence"
+
+    def __str__(self):
+        return f"change sequence = {self.value}"
+
+    @classmethod
+    def allocate(cls):
+        """
+        Return the next value, locking the counter until the current
+        transaction commits or rolls back.
+
+        Raises:
+            TransactionManagementError: outside a transaction, where the
+                lock would be released before the caller's write
+        """
+        if not transaction.get_connection().in_atomic_block:
+            raise TransactionManagementError("ChangeSequence.allocate() needs a transaction.")
+        bump = {"value": F("value") + 1, "updated_at": timezone.now()}
+        if not cls.objects.filter(pk=1).update(**bump):
+            cls.objects.get_or_create(pk=1)
+            cls.objects.filter(pk=1).update(**bump)
+        return cls.objects.values_list("value", flat=True).get(pk=1)
+
+    @classmethod
+    def current(cls):
+        """The last committed value (0 before any write)."""
+        return cls.objects.filter(pk=1).values_list("value", flat=True).first() or 0
+
+    @classmethod
+    @contextmanager
+    def batch(cls, using=None, savepoint=True):
+        """
+        transaction.atomic() that stamps the rows track()ed inside it with
+        one allocate() value just before it exits. Nested batches join
+        the outermost one, which does the stamping.
+        """
+        using = using or DEFAULT_DB_ALIAS
+        connection = transaction.get_connection(using)
+        if getattr(connection, "change_batch", None) is not None:
+            with transaction.atomic(using=using, savepoint=savepoint):
+                yield
+            return
+
+        batch = connection.change_batch = _ChangeBatch()
+        try:
+            with transaction.atomic(using=using, savepoint=savepoint):
+                yield
+                connection.change_batch = None
+                batch.stamp(using)
+        finally:
+            connection.change_batch = None
+
+    @classmethod
+    def track(cls, *instances, using=None):
+        """
+        Stamp saved model instances (rows and objects) at the end of the
+        current batch, or straight away outside one.
+        """
+        with cls.batch(using=using, savepoint=False):
+            batch = transaction.get_connection(using or DEFAULT_DB_ALIAS).change_batch
+            for instance in instances:
+                batch.rows[type(instance)].add(instance.pk)
+            batch.instances.extend(instances)
+            batch.advanced = True
+
+    @classmethod
+    def track_rows(cls, model, pks, using=None):
+        """track() for rows written without instances (QuerySet.update())."""
+        with cls.batch(using=using, savepoint=False):
+            batch = transaction.get_connection(using or DEFAULT_DB_ALIAS).change_batch
+            batch.rows[model].update(pks)
+            batch.advanced = True
+
+    @classmethod
+    def advance(cls, using=None):
+        """Move the sequence with the current batch, without stamping rows."""
+        cls.track(using=using)
+
+
+class _ChangeBatch:
+    """Rows waiting for their change_seq in one ChangeSequence.batch()."""
+
+    def __init__(self):
+        self.rows = defaultdict(set)
+        self.instances = []
+        self.advanced = False
+
+    def stamp(self, using):
+        if not self.advanced:
+            return
+        seq = ChangeSequence.allocate()
+        for model, pks in self.rows.items():
+            model._base_manager.using(using).filter(pk__in=pks).update(change_seq=seq)
+        for instance in self.instances:
+            instance.change_seq = seq
+
+
+class ChangeTrackedModel(models.Model):
+    """Stamps change_seq from ChangeSequence on every save()."""
+
+    change_seq = models.BigIntegerField(
+        default=0,
+        editable=False,
+        help_text="ChangeSequence value of the last write (change feed position)",
+    )
+
+    class Meta:
+        abstract = True
+
+    def save(self, *args, **kwargs):
+        using = kwargs.get("using") or DEFAULT_DB_ALIAS
+        with ChangeSequence.batch(using=using, savepoint=False):
+            super().save(*args, **kwargs)
+            ChangeSequence.track(self, using=using)
+
+
+class Request(ChangeTrackedModel):
     """
     Request model — represents a service/feature request submitted by a user.
 
@@ -74,6 +226,7 @@ class Request(models.Model):
         PENDING → REVIEWING → IN_PROGRESS → COMPLETED → DELIVERED → CLOSED
                           ↘ REJECTED
         CANCELLED can be reached from any non-terminal state.
+    The transition rules live in core.workflow.
     """
 
     class Status(models.TextChoices):
@@ -143,6 +296,9 @@ class Request(models.Model):
             models.Index(fields=["status"]),
             models.Index(fields=["assigned_to"]),
             models.Index(fields=["created_at"]),
+            models.Index(fields=["updated_at", "id"]),
+            models.Index(fields=["change_seq", "id"]),
+            models.Index(fields=["user", "change_seq"]),
         ]
 
     def __str__(self):
@@ -150,15 +306,13 @@ class Request(models.Model):
 
     @property
     def is_terminal(self):
-        """Check if the request is in a terminal (final) state."""
-        return self.status in (
-            self.Status.CLOSED,
-            self.Status.REJECTED,
-            self.Status.CANCELLED,
-        )
+        """Check if the request is in a terminal (final) state (see core.workflow)."""
+        from core.workflow import workflow  # core.workflow imports this module
+
+        return workflow.is_terminal(self.status)
 
 
-class RequestActivity(models.Model):
+class RequestActivity(ChangeTrackedModel):
     """
     Audit log entry for request actions.
 
@@ -195,10 +349,22 @@ class RequestActivity(models.Model):
         related_name="performed_activities",
         help_text="User who performed this action",
     )
+    # Not auto_now_add: write-behind logging (core.activity_log) sets the
+    # time of the action before the row is inserted
     timestamp = models.DateTimeField(
-        auto_now_add=True,
+        default=timezone.now,
+        editable=False,
         help_text="When the action occurred",
     )
+    # Set on buffered entries, so one replayed from the spool after a
+    # crash (core.activity_log) is not inserted twice
+    log_id = models.UUIDField(
+        null=True,
+        blank=True,
+        unique=True,
+        editable=False,
+        help_text="Write-behind entry id (buffered activity log only)",
+    )
 
     class Meta:
         ordering = ["-timestamp"]
@@ -206,7 +372,100 @@ class RequestActivity(models.Model):
         verbose_name_plural = "Request Activities"
         indexes = [
             models.Index(fields=["request", "timestamp"]),
+            models.Index(fields=["timestamp", "id"]),
+            models.Index(fields=["change_seq", "id"]),
         ]
 
     def __str__(self):
         return f"{self.action} on {self.request.title} by {self.performed_by}"
+
+
+class RequestTombstone(ChangeTrackedModel):
+    """
+    Marker left behind when a request is deleted, so the change feed can
+    tell syncing clients to drop it.
+
+    Written by a post_delete signal (any ORM delete, including cascades).
+    request_id and owner_id are plain integers: the rows they pointed to
+    are gone. Tombstones older than CHANGE_FEED_TOMBSTONE_DAYS are pruned
+    by `manage.py prune_tombstones`.
+    """
+
+    request_id = models.BigIntegerField(
+        help_text="ID of the deleted request",
+    )
+    owner_id = models.BigIntegerField(
+        help_text="ID of the user who owned the deleted request",
+    )
+    deleted_at = models.DateTimeField(
+        default=timezone.now,
+        help_text="When the request was deleted",
+    )
+
+    class Meta:
+        ordering = ["deleted_at", "id"]
+        verbose_name = "Request Tombstone"
+        verbose_name_plural = "Request Tombstones"
+        indexes = [
+            models.Index(fields=["deleted_at", "id"]),
+            models.Index(fields=["owner_id", "deleted_at"]),
+            models.Index(fields=["change_seq", "id"]),
+            models.Index(fields=["owner_id", "change_seq"]),
+        ]
+
+    def __str__(self):
+        return f"Request {self.request_id} deleted at {self.deleted_at}"
+
+
+class RequestCounter(models.Model):
+    """
+    Denormalized request counts, one row per (dimension, value).
+
+    Kept up to date transactionally by the service layer (Django admin
+    saves go through it too) and, for deletions and cascades from deleted
+    users, by the delete signal handlers in core.signals, so the admin
+    dashboard can read status/priority/assignee breakdowns without
+    scanning core_request. Raw SQL and QuerySet.update() outside
+    core.services are not tracked; `manage.py rebuild_request_counters`
+    checks for and repairs drift.
+    """
+
+    class Dimension(models.TextChoices):
+        TOTAL = "TOTAL", "Total"
+        STATUS = "STATUS", "Status"
+        PRIORITY = "PRIORITY", "Priority"
+        ASSIGNEE = "ASSIGNEE", "Assignee"
+
+    dimension = models.CharField(
+        max_length=10,
+        choices=Dimension.choices,
+        help_text="What the requests are grouped by",
+    )
+    value = models.CharField(
+        max_length=32,
+        blank=True,
+        default="",
+        help_text="Status/priority code or assignee user id ('' = total / unassigned)",
+    )
+    count = models.BigIntegerField(
+        default=0,
+        help_text="Number of requests with this value",
+    )
+    updated_at = models.DateTimeField(
+        auto_now=True,
+        help_text="When the counter last changed",
+    )
+
+    class Meta:
+        ordering = ["dimension", "value"]
+        verbose_name = "Request Counter"
+        verbose_name_plural = "Request Counters"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["dimension", "value"],
+                name="unique_request_counter",
+            ),
+        ]
+
+    def __str__(self):
+        return f"{self.dimension}:{self.value or '-'} = {self.count}"
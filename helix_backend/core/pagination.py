@@ -0,0 +1,457 @@
+"""
+Pagination for Helix list endpoints.
+
+KeysetPagination (the default) pages with an opaque cursor over the view's
+ordering instead of OFFSET, so every page is an index range scan and no
+COUNT(*) is issued:
+
+    GET /api/requests/                     → first page
+    GET /api/requests/?cursor=<opaque>     → page after / before a cursor
+
+    {"next": <url|null>, "previous": <url|null>, "results": [...]}
+
+Ordering ties are broken by primary key, so rows with equal timestamps are
+never skipped or repeated. Querysets may be model instances or values()
+rows, as long as the ordering fields are among the selected values.
+
+Clients that need page numbers and a total count opt in to the old mode
+by sending ?page=N, which is served by DRF's PageNumberPagination
+unchanged.
+
+AdminRequestPagination's page-number mode takes its total from a
+CountStrategy instead of an unbounded COUNT(*): exact below a threshold,
+otherwise read from the RequestCounter table (unfiltered or single
+status/priority/assignee filter) or a cached count, refreshed in the
+background. No request runs an unbounded COUNT(*). The response says
+which one it got:
+
+    {"count": 48210, "count_exact": false, "next": ..., "previous": ..., "results": [...]}
+"""
+
+import base64
+import binascii
+import contextvars
+import hashlib
+import json
+import logging
+import threading
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property, partial
+from types import SimpleNamespace
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.paginator import Paginator
+from django.db import connections
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.settings import api_settings
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+from core.db.timeouts import statement_timeout
+from core.models import RequestCounter
+
+logger = logging.getLogger(__name__)
+
+
+class KeysetPagination(BasePagination):
+    """
+    Keyset (seek) pagination with opaque cursors, ties broken by id.
+
+    Falls back to PageNumberPagination when the `page` query param is sent.
+    """
+
+    page_size = api_settings.PAGE_SIZE
+    cursor_query_param = "cursor"
+    invalid_cursor_message = "Invalid cursor."
+    page_number_class = PageNumberPagination
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.page_number_paginator = None
+        if self.page_number_class.page_query_param in request.query_params:
+            self.page_number_paginator = self.page_number_class()
+            return self.page_number_paginator.paginate_queryset(queryset, request, view)
+
+        return self.set_page(list(self.get_page_queryset(queryset, request, view)))
+
+    def get_page_queryset(self, queryset, request, view=None):
+        """
+        Return the (unevaluated) queryset of the requested page plus one
+        row. Async views evaluate it themselves and pass the rows to
+        set_page().
+        """
+        self.request = request
+        self.base_url = request.build_absolute_uri()
+        self.model = queryset.model
+        self.ordering = self.get_ordering(queryset, view)
+        self.cursor = self.decode_cursor(request)
+
+        if self.cursor is None:
+            self.reverse = False
+        else:
+            position, self.reverse = self.cursor
+            queryset = queryset.filter(self._seek_filter(position, self.reverse))
+
+        order_by = [
+            ("-" if descending != self.reverse else "") + name
+            for name, descending in self.ordering
+        ]
+        return queryset.order_by(*order_by)[: self.page_size + 1]
+
+    def set_page(self, rows):
+        """Trim the rows fetched from get_page_queryset() and record the links."""
+        has_more = len(rows) > self.page_size
+        rows = rows[: self.page_size]
+        if self.reverse:
+            rows.reverse()
+
+        # Paging backwards: there are later rows because we came from them
+        started = self.cursor is not None
+        self.has_next = has_more if not self.reverse else started
+        self.has_previous = started if not self.reverse else has_more
+        self.page = rows
+        return rows
+
+    def get_paginated_data(self, data):
+        """The response body of get_paginated_response() (keyset mode)."""
+        return OrderedDict(
+            [
+                ("next", self.get_next_link()),
+                ("previous", self.get_previous_link()),
+                ("results", data),
+            ]
+        )
+
+    def get_paginated_response(self, data):
+        if self.page_number_paginator is not None:
+            return self.page_number_paginator.get_paginated_response(data)
+        return Response(self.get_paginated_data(data))
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "previous": {"type": "string", "nullable": True, "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    # ── Ordering ─────────────────────────────────────────────────
+
+    def get_ordering(self, queryset, view):
+        """
+        Return [(field_name, descending), ...] for the keyset, always ending
+        in the primary key so the ordering is total.
+
+        Uses the queryset's ordering (as set by OrderingFilter), else the
+        view's `ordering`, else the model's Meta.ordering.
+        """
+        fields = list(queryset.query.order_by) or list(getattr(view, "ordering", None) or [])
+        if not fields:
+            fields = list(queryset.model._meta.ordering)
+
+        ordering = []
+        pk_name = queryset.model._meta.pk.name
+        for field in fields:
+            name = field.lstrip("-")
+            name = pk_name if name == "pk" else name
+            ordering.append((name, field.startswith("-")))
+            if name == pk_name:
+                return ordering
+
+        descending = ordering[0][1] if ordering else True
+        ordering.append((pk_name, descending))
+        return ordering
+
+    def _seek_filter(self, position, reverse):
+        """
+        Build the "strictly after position" filter for the ordering:
+            f1 > v1  OR  (f1 = v1 AND f2 > v2)  OR  ...
+        with > / < chosen per field direction (flipped when paging back).
+        """
+        condition = Q()
+        equal_prefix = {}
+        for (name, descending), value in zip(self.ordering, position):
+            lookup = "lt" if descending != reverse else "gt"
+            condition |= Q(**equal_prefix, **{f"{name}__{lookup}": value})
+            equal_prefix[name] = value
+        return condition
+
+    # ── Cursors ──────────────────────────────────────────────────
+
+    def decode_cursor(self, request):
+        """Return (position, reverse) from the request, or None on the first page."""
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(encoded.encode("ascii")))
+            values = payload["p"]
+            reverse = bool(payload.get("r"))
+            if len(values) != len(self.ordering):
+                raise ValueError("cursor does not match ordering")
+            position = [
+                self.model._meta.get_field(name).to_python(value)
+                for (name, _), value in zip(self.ordering, values)
+            ]
+        except (
+            binascii.Error,
+            UnicodeError,
+            ValueError,
+            KeyError,
+            TypeError,
+            FieldDoesNotExist,
+            ValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+        return position, reverse
+
+    def encode_cursor(self, row, reverse):
+        if isinstance(row, dict):
+            # values() rows: the ordering fields are keys, not attributes
+            row = SimpleNamespace(**row)
+        values = [
+            self.model._meta.get_field(name).value_to_string(row)
+            for name, _ in self.ordering
+        ]
+        payload = json.dumps({"p": values, "r": int(reverse)}, separators=(",", ":"))
+        encoded = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+        return replace_query_param(self.base_url, self.cursor_query_param, encoded)
+
+    def get_next_link(self):
+        if not self.has_next or not self.page:
+            return None
+        return self.encode_cursor(self.page[-1], reverse=False)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.page:
+            return remove_query_param(self.base_url, self.cursor_query_param)
+        return self.encode_cursor(self.page[0], reverse=True)
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  Count strategies (page-number mode)
+# ═══════════════════════════════════════════════════════════════════
+
+CountResult = namedtuple("CountResult", ["count", "exact"])
+
+
+class CountStrategy:
+    """
+    Computes the total row count for a filtered queryset without letting
+    its cost grow with the table.
+
+    1. A bounded exact count (COUNT over LIMIT exact_threshold + 1). At or
+       below the threshold this is the answer, and it is exact.
+    2. Above it, estimate() may supply a count (none by default).
+    3. Otherwise the last full count for the same query, cached for
+       cache_ttl seconds, is returned as an approximate count. On a cache
+       miss the full count is queued on a bounded background worker
+       with a statement timeout (refresh_count_in_background) and a
+       lower bound is returned meanwhile: the rows counted up to the end
+       of the requested page, so that page is still served.
+    """
+
+    cache_prefix = "helix:count:"
+
+    def __init__(self, exact_threshold=10000, cache_ttl=60):
+        self.exact_threshold = exact_threshold
+        self.cache_ttl = cache_ttl
+
+    @classmethod
+    def from_settings(cls):
+        return cls(
+            exact_threshold=settings.LIST_EXACT_COUNT_THRESHOLD,
+            cache_ttl=settings.LIST_COUNT_CACHE_TTL,
+        )
+
+    def count(self, queryset, request=None, rows_needed=0):
+        """
+        Args:
+            rows_needed: rows up to the end of the requested page; a
+                         lower-bound count covers at least these
+        """
+        queryset = queryset.order_by()
+        bounded = queryset.values("pk")[: self.exact_threshold + 1].count()
+        if bounded <= self.exact_threshold:
+            return CountResult(bounded, True)
+
+        estimated = self.estimate(queryset, request)
+        if estimated is not None:
+            return estimated
+
+        key = self.cache_key(queryset)
+        cached = cache.get(key)
+        if cached is not None:
+            return CountResult(cached, False)
+        refresh_count_in_background(key, queryset, self.cache_ttl)
+        if rows_needed > bounded:
+            # Costs what the OFFSET of the page query costs anyway
+            bounded = queryset.values("pk")[: rows_needed + 1].count()
+        return CountResult(bounded, False)
+
+    def estimate(self, queryset, request):
+        """Return a CountResult without scanning, or None if not possible."""
+        return None
+
+    def cache_key(self, queryset):
+        sql, params = queryset.query.sql_with_params()
+        digest = hashlib.sha1(f"{sql}|{params!r}".encode("utf-8")).hexdigest()
+        return f"{self.cache_prefix}{digest}"
+
+
+_refreshing = set()
+_refreshing_lock = threading.Lock()
+_count_executor = None
+
+
+def refresh_count_in_background(key, queryset, ttl):
+    """
+    Queue queryset.count() on the count workers and cache it under `key`.
+
+    At most LIST_COUNT_WORKERS counts run at once per process, each cut
+    off after LIST_COUNT_TIMEOUT seconds, and at most
+    LIST_COUNT_MAX_QUEUED distinct queries are queued or running; further
+    refreshes are skipped and the caller keeps serving its lower bound. A
+    marker in the default cache stops processes sharing it from counting
+    the same query at the same time.
+
+    Returns whether the count was queued.
+    """
+    global _count_executor
+    with _refreshing_lock:
+        if key in _refreshing or len(_refreshing) >= settings.LIST_COUNT_MAX_QUEUED:
+            return False
+        _refreshing.add(key)
+        if _count_executor is None:
+            _count_executor = ThreadPoolExecutor(
+                max_workers=settings.LIST_COUNT_WORKERS, thread_name_prefix="helix-count"
+            )
+
+    if not cache.add(f"{key}:refreshing", 1, settings.LIST_COUNT_TIMEOUT + ttl):
+        _done_refreshing(key)
+        return False
+    # Copied context: the count reads from the same database as the request
+    _count_executor.submit(contextvars.copy_context().run, _refresh_count, key, queryset, ttl)
+    return True
+
+
+def _refresh_count(key, queryset, ttl):
+    try:
+        with statement_timeout(queryset.db, settings.LIST_COUNT_TIMEOUT):
+            count = queryset.count()
+        cache.set(key, count, ttl)
+    except Exception as e:
+        logger.warning(f"[PAGINATION] Background count failed: {e}")
+    finally:
+        connections.close_all()
+        cache.delete(f"{key}:refreshing")
+        _done_refreshing(key)
+
+
+def _done_refreshing(key):
+    with _refreshing_lock:
+        _refreshing.discard(key)
+
+
+class RequestCounterCountStrategy(CountStrategy):
+    """
+    CountStrategy for the admin request list that reads large totals from
+    the RequestCounter table when the list is unfiltered or filtered on a
+    single counted field. The counters are maintained transactionally for
+    every change made through the ORM, but writes that bypass it (raw SQL,
+    QuerySet.update()) go unnoticed until rebuild_request_counters runs,
+    so the result is reported as not exact.
+    """
+
+    filter_dimensions = {
+        "status": RequestCounter.Dimension.STATUS,
+        "priority": RequestCounter.Dimension.PRIORITY,
+        "assigned_to": RequestCounter.Dimension.ASSIGNEE,
+    }
+
+    def estimate(self, queryset, request):
+        if request is None:
+            return None
+        active = [name for name in self.filter_dimensions if request.query_params.get(name)]
+        if len(active) > 1:
+            return None
+        if active:
+            name = active[0]
+            key = (self.filter_dimensions[name], request.query_params[name])
+        else:
+            key = (RequestCounter.Dimension.TOTAL, "")
+
+        count = (
+            RequestCounter.objects.filter(dimension=key[0], value=key[1])
+            .values_list("count", flat=True)
+            .first()
+        )
+        return CountResult(count or 0, False)
+
+
+class CountingPaginator(Paginator):
+    """Django Paginator whose `count` comes from a CountStrategy."""
+
+    def __init__(self, *args, count_strategy, request=None, rows_needed=0, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.count_strategy = count_strategy
+        self.request = request
+        self.rows_needed = rows_needed
+        self.count_exact = True
+
+    @cached_property
+    def count(self):
+        result = self.count_strategy.count(self.object_list, self.request, self.rows_needed)
+        self.count_exact = result.exact
+        return result.count
+
+
+class CountedPageNumberPagination(PageNumberPagination):
+    """
+    PageNumberPagination using the view's get_count_strategy() (or the
+    default CountStrategy) and reporting `count_exact` in the response.
+    """
+
+    def paginate_queryset(self, queryset, request, view=None):
+        get_count_strategy = getattr(view, "get_count_strategy", None)
+        strategy = get_count_strategy() if get_count_strategy else CountStrategy.from_settings()
+        try:
+            page_number = max(int(request.query_params.get(self.page_query_param, 1)), 1)
+        except ValueError:
+            page_number = 1
+        page_size = self.get_page_size(request) or 0
+        self.django_paginator_class = partial(
+            CountingPaginator,
+            count_strategy=strategy,
+            request=request,
+            rows_needed=page_number * page_size,
+        )
+        return super().paginate_queryset(queryset, request, view)
+
+    def get_paginated_response(self, data):
+        return Response(
+            OrderedDict(
+                [
+                    ("count", self.page.paginator.count),
+                    ("count_exact", self.page.paginator.count_exact),
+                    ("next", self.get_next_link()),
+                    ("previous", self.get_previous_link()),
+                    ("results", data),
+                ]
+            )
+        )
+
+
+class AdminRequestPagination(KeysetPagination):
+    """Keyset by default; ?page=N uses the count strategy instead of COUNT(*)."""
+
+    page_number_class = CountedPageNumberPagination
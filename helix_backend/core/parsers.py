@@ -0,0 +1,90 @@
+"""
+Request parsers for Helix backend.
+
+FastJSONParser  — drop-in replacement for DRF's JSONParser that decodes
+                  with orjson when available (see core.renderers).
+JSONLinesParser — streams newline-delimited JSON (one object per line)
+                  for the bulk import endpoint without loading the body
+                  into memory.
+"""
+
+import json
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+
+from core.renderers import FastJSONRenderer, fast_json_backend
+
+
+class FastJSONParser(JSONParser):
+    """
+    JSONParser backed by orjson when available.
+
+    orjson reads UTF-8 only and always rejects NaN/Infinity, which is
+    what DRF's strict mode does; other encodings or non-strict mode fall
+    back to the stdlib parser.
+    """
+
+    renderer_class = FastJSONRenderer
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", "utf-8")
+        backend = fast_json_backend()
+        if backend is None or not self.strict or encoding.lower().replace("-", "") != "utf8":
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return backend.loads(stream.read())
+        except ValueError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
+
+
+def iter_json_lines(stream, encoding="utf-8"):
+    """
+    Lazily parse a JSON-lines byte/str stream.
+
+    Yields (line_number, obj, error) tuples: obj is the decoded value and
+    error is None, or obj is None and error describes the bad line.
+    Blank lines are skipped.
+    """
+    loads = json.loads
+    backend = fast_json_backend()
+    if backend is not None:
+        loads = backend.loads
+    for line_number, line in enumerate(stream, start=1):
+        if isinstance(line, bytes):
+            try:
+                line = line.decode(encoding)
+            except UnicodeDecodeError as e:
+                yield line_number, None, f"Invalid {encoding}: {e}"
+                continue
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield line_number, loads(line), None
+        except ValueError as e:
+            yield line_number, None, f"Invalid JSON: {e}"
+
+
+class JSONLinesParser(BaseParser):
+    """
+    Parses application/x-ndjson (also accepted as application/jsonl).
+
+    request.data is a generator of (line_number, obj, error) tuples that
+    reads the body as it is consumed, so it can only be iterated once.
+    """
+
+    media_type = "application/x-ndjson"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", "utf-8")
+        if stream is None:
+            return iter(())
+        return iter_json_lines(stream, encoding)
+
+
+class JSONLParser(JSONLinesParser):
+    media_type = "application/jsonl"
@@ -0,0 +1,69 @@
+"""
+Response renderers for Helix backend.
+
+FastJSONRenderer — drop-in replacement for DRF's JSONRenderer that
+                   serializes with orjson when it is installed and
+                   JSON_BACKEND allows it, and with the stdlib otherwise.
+
+Output is the same as JSONRenderer's: compact, UTF-8, U+2028/U+2029
+escaped, and types orjson does not handle the way DRF does (datetimes,
+Decimal, lazy strings, querysets, ...) go through DRF's JSONEncoder.
+"""
+
+import logging
+
+from django.conf import settings
+from rest_framework.renderers import JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None
+
+logger = logging.getLogger(__name__)
+
+
+def fast_json_backend():
+    """Return the orjson module if it should be used, else None."""
+    if settings.JSON_BACKEND == "stdlib":
+        return None
+    if orjson is None and settings.JSON_BACKEND == "orjson":
+        logger.warning("[JSON] JSON_BACKEND=orjson but orjson is not installed, using stdlib")
+    return orjson
+
+
+class FastJSONRenderer(JSONRenderer):
+    """JSONRenderer backed by orjson when available."""
+
+    def __init__(self):
+        super().__init__()
+        self.backend = fast_json_backend()
+        if self.backend is not None:
+            self.options = (
+                self.backend.OPT_NON_STR_KEYS
+                | self.backend.OPT_PASSTHROUGH_DATETIME
+                | self.backend.OPT_PASSTHROUGH_DATACLASS
+            )
+            self.default = JSONEncoder().default
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        # orjson always emits compact UTF-8 and only indents by 2 spaces;
+        # any other configuration is left to the stdlib implementation
+        if self.backend is None or self.ensure_ascii or not self.compact:
+            return super().render(data, accepted_media_type, renderer_context)
+        if self.get_indent(accepted_media_type, renderer_context or {}) is not None:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = self.backend.dumps(data, default=self.default, option=self.options)
+        except TypeError:
+            # e.g. integers wider than 64 bits
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Same as JSONRenderer: these are valid JSON but not valid JavaScript
+        if b"\xe2\x80\xa8" in ret or b"\xe2\x80\xa9" in ret:
+            ret = ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(b"\xe2\x80\xa9", b"\\u2029")
+        return ret
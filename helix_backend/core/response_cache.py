@@ -0,0 +1,164 @@
+"""
+Server-side cache of list responses for Helix backend.
+
+Entries live in Django's default cache under a key made of the items
+below. The cache must be shared by every worker process, so it is off
+(RESPONSE_CACHE_TTL=0) by default with the per-process locmem backend
+and system check core.E001 rejects turning it on there:
+
+    data version : a random token replaced after every committed write
+    scope        : the user for per-user lists, the role for shared ones
+    URL          : scheme, host, path and the sorted query string
+                   (filters, ordering, cursor / page)
+
+Writers never delete entries; they call data_changed(), which replaces
+the data version once the transaction commits, so every entry cached
+before the write stops being reachable. Readers that started before the
+commit can only store their result under the old version. Responses read
+from a replica (core.db.routers) within READ_REPLICA_STICKY_SECONDS of
+the last change are not stored: the replica may not have it yet.
+
+Stats (hits, misses, stores) are counted per process.
+"""
+
+import hashlib
+import threading
+import time
+import uuid
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from core.db import routers
+
+DATA_VERSION_KEY = "helix:data-version"
+DATA_CHANGED_AT_KEY = "helix:data-changed-at"
+KEY_PREFIX = "helix:response:"
+
+
+class ResponseCacheStats:
+    """Thread-safe hit / miss counters."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.stores = 0
+        self.invalidations = 0
+
+    def record(self, name):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def as_dict(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "enabled": settings.RESPONSE_CACHE_TTL > 0,
+                "backend": settings.CACHES["default"]["BACKEND"].rsplit(".", 1)[-1],
+                "ttl": settings.RESPONSE_CACHE_TTL,
+                "hits": self.hits,
+                "misses": self.misses,
+                "stores": self.stores,
+                "invalidations": self.invalidations,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else None,
+            }
+
+
+stats = ResponseCacheStats()
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  Data version
+# ═══════════════════════════════════════════════════════════════════
+
+
+def get_data_version():
+    """Return the current data version, creating one if the cache lost it."""
+    version = cache.get(DATA_VERSION_KEY)
+    if version is None:
+        cache.add(DATA_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = cache.get(DATA_VERSION_KEY)
+    return version
+
+
+def bump_data_version():
+    """Replace the data version, orphaning every cached response."""
+    cache.set_many({DATA_VERSION_KEY: uuid.uuid4().hex, DATA_CHANGED_AT_KEY: time.time()}, timeout=None)
+    stats.record("invalidations")
+
+
+def data_changed():
+    """
+    Invalidate cached responses once the current transaction commits
+    (immediately when not in a transaction).
+    """
+    transaction.on_commit(bump_data_version)
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  Entries
+# ═══════════════════════════════════════════════════════════════════
+
+
+def make_key(request, scope):
+    """Cache key for `request` within `scope` at the current data version."""
+    return f"{KEY_PREFIX}{get_data_version()}:{_request_digest(request, scope)}"
+
+
+def _request_digest(request, scope):
+    query = sorted(
+        (name, value)
+        for name, values in request.query_params.lists()
+        for value in values
+    )
+    url = f"{request.scheme}://{request.get_host()}{request.path}?{query!r}"
+    return hashlib.sha1(f"{scope}|{url}".encode("utf-8")).hexdigest()
+
+
+def get_entry(key):
+    entry = cache.get(key)
+    stats.record("misses" if entry is None else "hits")
+    return entry
+
+
+def store_entry(key, entry):
+    if routers.reading_from_replica() and _changed_recently(cache.get(DATA_CHANGED_AT_KEY)):
+        return
+    cache.set(key, entry, settings.RESPONSE_CACHE_TTL)
+    stats.record("stores")
+
+
+def _changed_recently(changed_at):
+    return changed_at is not None and time.time() - changed_at < settings.READ_REPLICA_STICKY_SECONDS
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  Async variants (core.async_views)
+# ═══════════════════════════════════════════════════════════════════
+
+
+async def aget_data_version():
+    version = await cache.aget(DATA_VERSION_KEY)
+    if version is None:
+        await cache.aadd(DATA_VERSION_KEY, uuid.uuid4().hex, timeout=None)
+        version = await cache.aget(DATA_VERSION_KEY)
+    return version
+
+
+async def amake_key(request, scope):
+    return f"{KEY_PREFIX}{await aget_data_version()}:{_request_digest(request, scope)}"
+
+
+async def aget_entry(key):
+    entry = await cache.aget(key)
+    stats.record("misses" if entry is None else "hits")
+    return entry
+
+
+async def astore_entry(key, entry):
+    if routers.reading_from_replica() and _changed_recently(await cache.aget(DATA_CHANGED_AT_KEY)):
+        return
+    await cache.aset(key, entry, settings.RESPONSE_CACHE_TTL)
+    stats.record("stores")
@@ -3,14 +3,32 @@ Django REST Framework Serializers for Helix Platform — Phase 2
 
 RequestCreateSerializer     — validates incoming request creation data
 RequestSerializer           — full read representation of a Request
+                              (with the statuses the viewer may move it to)
+RequestListSerializer       — RequestSerializer output from values() rows (lists)
 RequestStatusSerializer     — validates workflow status transitions
+BulkStatusSerializer        — validates bulk status change payloads
 RequestAssignSerializer     — validates admin assignment
+BulkAssignSerializer        — validates bulk assignment payloads
 RequestActivitySerializer   — read-only activity log entries
+ChangeFeedActivitySerializer — activity log entries with their request id
 """
 
+from functools import cached_property
+
 from rest_framework import serializers
 
 from core.models import Request, RequestActivity, User
+from core.workflow import workflow
+
+# Upper bound on the number of requests a single bulk call may touch
+BULK_MAX_IDS = 1000
+
+
+def viewer_next_statuses(context):
+    """workflow.next_statuses() for the role of the user in the serializer context."""
+    request = (context or {}).get("request")
+    user = getattr(request, "user", None)
+    return workflow.next_statuses(getattr(user, "role", None))
 
 
 class RequestCreateSerializer(serializers.ModelSerializer):
@@ -55,6 +73,7 @@ class RequestSerializer(serializers.ModelSerializer):
         source="get_priority_display", read_only=True
     )
     is_terminal = serializers.BooleanField(read_only=True)
+    next_statuses = serializers.SerializerMethodField()
 
     class Meta:
         model = Request
@@ -70,6 +89,7 @@ class RequestSerializer(serializers.ModelSerializer):
             "assigned_to",
             "assigned_to_email",
             "is_terminal",
+            "next_statuses",
             "created_at",
             "updated_at",
         ]
@@ -80,6 +100,68 @@ class RequestSerializer(serializers.ModelSerializer):
             return obj.assigned_to.email
         return None
 
+    def get_next_statuses(self, obj):
+        return self._next_statuses.get(obj.status, ())
+
+    @cached_property
+    def _next_statuses(self):
+        # Once per serializer (the shared child when many=True), not per row
+        return viewer_next_statuses(self.context)
+
+
+class RequestListSerializer(serializers.BaseSerializer):
+    """
+    Read-only fast path for request lists.
+
+    Produces exactly the same output as RequestSerializer, but from the
+    dict rows of `queryset.values(*RequestListSerializer.values_fields)`:
+    no model instances, no per-row field objects, and display labels
+    come from precomputed choice maps.
+    """
+
+    values_fields = (
+        "id",
+        "title",
+        "description",
+        "status",
+        "priority",
+        "user__email",
+        "assigned_to_id",
+        "assigned_to__email",
+        "created_at",
+        "updated_at",
+    )
+
+    status_labels = dict(Request.Status.choices)
+    priority_labels = dict(Request.Priority.choices)
+    terminal_statuses = workflow.terminal
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.format_datetime = serializers.DateTimeField().to_representation
+        self.next_statuses = viewer_next_statuses(self._context)
+
+    def to_representation(self, row):
+        format_datetime = self.format_datetime
+        status = row["status"]
+        priority = row["priority"]
+        return {
+            "id": row["id"],
+            "title": row["title"],
+            "description": row["description"],
+            "status": status,
+            "status_display": self.status_labels.get(status, status),
+            "priority": priority,
+            "priority_display": self.priority_labels.get(priority, priority),
+            "user_email": row["user__email"],
+            "assigned_to": row["assigned_to_id"],
+            "assigned_to_email": row["assigned_to__email"],
+            "is_terminal": status in self.terminal_statuses,
+            "next_statuses": self.next_statuses.get(status, ()),
+            "created_at": format_datetime(row["created_at"]) if row["created_at"] else None,
+            "updated_at": format_datetime(row["updated_at"]) if row["updated_at"] else None,
+        }
+
 
 class RequestStatusSerializer(serializers.Serializer):
     """
@@ -92,11 +174,29 @@ class RequestStatusSerializer(serializers.Serializer):
     status = serializers.ChoiceField(choices=Request.Status.choices)
 
 
+class BulkStatusSerializer(serializers.Serializer):
+    """
+    Validates bulk status update payloads.
+
+    Per-request transition validation is done by
+    services.bulk_change_request_status.
+    """
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=BULK_MAX_IDS,
+    )
+    status = serializers.ChoiceField(choices=Request.Status.choices)
+
+
 class RequestAssignSerializer(serializers.Serializer):
     """
     Validates request assignment payloads.
 
     assigned_to can be a User ID (admin) or null to unassign.
+    The validated value is the User instance (or None), so callers do not
+    need to load the assignee again.
     """
 
     assigned_to = serializers.IntegerField(required=False, allow_null=True)
@@ -110,7 +210,17 @@ class RequestAssignSerializer(serializers.Serializer):
             raise serializers.ValidationError(f"User with id={value} does not exist.")
         if not user.is_admin():
             raise serializers.ValidationError("Requests can only be assigned to admin users.")
-        return value
+        return user
+
+
+class BulkAssignSerializer(RequestAssignSerializer):
+    """Validates bulk assignment payloads: {"ids": [...], "assigned_to": <id>|null}."""
+
+    ids = serializers.ListField(
+        child=serializers.IntegerField(min_value=1),
+        allow_empty=False,
+        max_length=BULK_MAX_IDS,
+    )
 
 
 class RequestActivitySerializer(serializers.ModelSerializer):
@@ -138,3 +248,11 @@ class RequestActivitySerializer(serializers.ModelSerializer):
         if obj.performed_by:
             return obj.performed_by.email
         return None
+
+
+class ChangeFeedActivitySerializer(RequestActivitySerializer):
+    """Activity entries in the change feed, which mixes requests."""
+
+    class Meta(RequestActivitySerializer.Meta):
+        fields = ["id", "request", *RequestActivitySerializer.Meta.fields[1:]]
+        read_only_fields = fields
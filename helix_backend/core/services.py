@@ -6,65 +6,240 @@ instead of containing logic directly.
 
 Functions:
     create_request()          — create + log CREATED
-    change_request_status()   — validate transition + log STATUS_CHANGED
+    change_request_status()   — check the transition (core.workflow) + log STATUS_CHANGED
+    bulk_change_request_status() — set-based status change for many requests
+    bulk_assign_requests()    — set-based (un)assignment of many requests
+    bulk_import_requests()    — chunked bulk_create of imported requests
+    change_request_priority() — set priority + log STATUS_CHANGED
     assign_request()          — set assigned_to + log ASSIGNED
-    log_activity()            — create RequestActivity record
+    delete_request()          — delete a request
+    save_request()            — save a request edited outside the API (Django admin)
+    log_activity()            — create RequestActivity record (sync or write-behind)
+    get_request_stats()       — status/priority/assignee breakdown (O(1))
+    count_requests()          — recompute counters from core_request
+
+Single-request changes are applied with a conditional UPDATE on the
+values they were validated against (_apply_change), so concurrent
+changes to one request cannot both pass validation.
+
+Write transactions are ChangeSequence batches (_write_transaction): the
+rows they write are stamped with one sequence value for the change feed
+(core.changes) just before they commit, so writers only queue on the
+sequence row for their last statements. Request rows are locked in id
+order and counter rows in key order, so writers do not deadlock on
+each other.
+
+On SQLite, writes that fail with "database is locked" are retried with
+backoff (core.db.sqlite.retry_on_locked).
+
+Every mutation also updates the RequestCounter rows it affects, in the
+same transaction as the change itself (deletions, including cascades
+from deleted users, through the signal handlers in core.signals), and
+calls data_changed() so cached
+list responses are invalidated when it commits and stick_to_primary() so
+the acting user keeps reading from the primary while a read replica
+(core.db.routers) catches up. Changes are also published to the live
+event stream (core.events) after commit.
 """
 
 import logging
+import time
+import uuid
+from collections import Counter, defaultdict
+from contextlib import contextmanager
+from itertools import islice
 
 from django.core.exceptions import ValidationError
+from django.db import DatabaseError, transaction
+from django.db.models import Count, F
+from django.utils import timezone
 
-from core.models import Request, RequestActivity, User
+from rest_framework.exceptions import ValidationError as DRFValidationError
+
+from core import activity_log
+from core.db.routers import stick_to_primary
+from core.db.sqlite import retry_on_locked
+from core.models import ChangeSequence, Request, RequestActivity, RequestCounter, User
+from core.events import publish_on_commit
+from core.response_cache import data_changed
+from core.serializers import RequestCreateSerializer
+from core.workflow import workflow
 
 logger = logging.getLogger(__name__)
 
 # ═══════════════════════════════════════════════════════════════════
-#  Workflow Transition Map
+#  Concurrent Changes
 # ═══════════════════════════════════════════════════════════════════
 
-TRANSITIONS = {
-    Request.Status.PENDING: [
-        Request.Status.REVIEWING,
-        Request.Status.REJECTED,
-        Request.Status.CANCELLED,
-    ],
-    Request.Status.REVIEWING: [
-        Request.Status.IN_PROGRESS,
-        Request.Status.REJECTED,
-        Request.Status.CANCELLED,
-    ],
-    Request.Status.IN_PROGRESS: [
-        Request.Status.COMPLETED,
-        Request.Status.CANCELLED,
-    ],
-    Request.Status.COMPLETED: [
-        Request.Status.DELIVERED,
-    ],
-    Request.Status.DELIVERED: [
-        Request.Status.CLOSED,
-    ],
-    # Terminal states — no outgoing transitions
-    Request.Status.CLOSED: [],
-    Request.Status.REJECTED: [],
-    Request.Status.CANCELLED: [],
-}
-
-
-def _validate_transition(current_status, new_status):
-    """
-    Validate that a status transition is allowed.
+# Lost races tolerated before a single-request change gives up
+MAX_CHANGE_ATTEMPTS = 5
+
+
+@contextmanager
+def _write_transaction():
+    """
+    transaction.atomic() whose rows are stamped with a ChangeSequence
+    value when it is about to commit (ChangeSequence.batch()).
+    """
+    with ChangeSequence.batch():
+        yield
+
+
+def _apply_change(request_obj, fields, validate, **changes):
+    """
+    Apply `changes` to one request with a conditional UPDATE that only
+    matches while `fields` still hold the values request_obj was read with.
+
+    When another transaction changed them first, they are re-read and
+    `validate(request_obj)` runs again against the new values, so each
+    change is checked against the state it is applied to, without a lock
+    held across the request. Must run inside the transaction that logs
+    the change.
+
+    Returns:
+        dict: {attname: value} of `fields` the change was applied over
 
     Raises:
-        ValidationError if the transition is not permitted.
+        ValidationError: from `validate`, if the request was deleted, or
+                         after MAX_CHANGE_ATTEMPTS lost races
     """
-    allowed = TRANSITIONS.get(current_status, [])
-    if new_status not in allowed:
-        allowed_display = ", ".join(allowed) if allowed else "none (terminal state)"
-        raise ValidationError(
-            f"Cannot transition from {current_status} to {new_status}. "
-            f"Allowed transitions: {allowed_display}"
+    attnames = [Request._meta.get_field(name).attname for name in fields]
+    for _ in range(MAX_CHANGE_ATTEMPTS):
+        validate(request_obj)
+        expected = {attname: getattr(request_obj, attname) for attname in attnames}
+        changes["updated_at"] = timezone.now()
+        if Request.objects.filter(pk=request_obj.pk, **expected).update(**changes):
+            for name, value in changes.items():
+                setattr(request_obj, name, value)
+            ChangeSequence.track(request_obj)
+            return expected
+
+        try:
+            request_obj.refresh_from_db(fields=fields)
+        except Request.DoesNotExist:
+            raise ValidationError("Request no longer exists.")
+        logger.info(f"[SERVICE] Request id={request_obj.pk} changed concurrently; re-validating")
+
+    raise ValidationError("Request is being modified concurrently. Please retry.")
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  Request Counters
+# ═══════════════════════════════════════════════════════════════════
+
+Dimension = RequestCounter.Dimension
+
+
+def _assignee_value(assigned_to_id):
+    return "" if assigned_to_id is None else str(assigned_to_id)
+
+
+def _counter_keys(status, priority, assigned_to_id):
+    """Counter keys a request with these values contributes to."""
+    return [
+        (Dimension.TOTAL, ""),
+        (Dimension.STATUS, status),
+        (Dimension.PRIORITY, priority),
+        (Dimension.ASSIGNEE, _assignee_value(assigned_to_id)),
+    ]
+
+
+def _apply_counter_deltas(deltas):
+    """
+    Add {(dimension, value): delta} to the counters table.
+
+    Must run inside the transaction of the change being counted.
+    Uses F() increments, so concurrent writers never lose updates.
+    """
+    for (dimension, value), delta in sorted(deltas.items()):
+        if not delta:
+            continue
+        updated = RequestCounter.objects.filter(dimension=dimension, value=value).update(
+            count=F("count") + delta
         )
+        if not updated:
+            counter, created = RequestCounter.objects.get_or_create(
+                dimension=dimension, value=value, defaults={"count": delta}
+            )
+            if not created:
+                RequestCounter.objects.filter(pk=counter.pk).update(count=F("count") + delta)
+
+
+def _move_counter(dimension, old_value, new_value, amount=1):
+    """Move `amount` requests from one value of a dimension to another."""
+    if old_value == new_value:
+        return
+    _apply_counter_deltas({(dimension, old_value): -amount, (dimension, new_value): amount})
+
+
+def count_deleted_request(request_obj):
+    """
+    Remove a deleted request from the counters. Called from the Request
+    post_delete handler (core.signals), inside the deleting transaction.
+    """
+    keys = _counter_keys(request_obj.status, request_obj.priority, request_obj.assigned_to_id)
+    _apply_counter_deltas({key: -1 for key in keys})
+
+
+def count_deleted_assignee(user):
+    """
+    Move the requests assigned to `user` to unassigned, as deleting the
+    user does (assigned_to is SET_NULL). Called from the User pre_delete
+    handler (core.signals). Requests the user owns are deleted with them
+    and leave the counters through count_deleted_request().
+    """
+    amount = Request.objects.filter(assigned_to=user).exclude(user=user).count()
+    if amount:
+        _move_counter(Dimension.ASSIGNEE, _assignee_value(user.pk), "", amount)
+
+
+def count_requests(queryset=None):
+    """
+    Compute {(dimension, value): count} from core_request with GROUP BY
+    queries. Used to rebuild the counters and check them for drift.
+    """
+    queryset = (queryset if queryset is not None else Request.objects.all()).order_by()
+    counts = Counter({(Dimension.TOTAL, ""): queryset.count()})
+    for dimension, field in (
+        (Dimension.STATUS, "status"),
+        (Dimension.PRIORITY, "priority"),
+        (Dimension.ASSIGNEE, "assigned_to"),
+    ):
+        for row in queryset.values(field).annotate(n=Count("id")):
+            value = row[field]
+            if dimension == Dimension.ASSIGNEE:
+                value = _assignee_value(value)
+            counts[(dimension, value)] = row["n"]
+    return counts
+
+
+def get_request_stats():
+    """
+    Return request counts by status, priority and assignee from the
+    counters table (one small query, independent of the number of requests).
+    """
+    stats = {
+        "total": 0,
+        "by_status": {value: 0 for value in Request.Status.values},
+        "by_priority": {value: 0 for value in Request.Priority.values},
+        "by_assignee": {},
+        "unassigned": 0,
+    }
+    for dimension, value, count in RequestCounter.objects.values_list(
+        "dimension", "value", "count"
+    ):
+        if dimension == Dimension.TOTAL:
+            stats["total"] = count
+        elif dimension == Dimension.STATUS:
+            stats["by_status"][value] = count
+        elif dimension == Dimension.PRIORITY:
+            stats["by_priority"][value] = count
+        elif value:
+            if count:
+                stats["by_assignee"][value] = count
+        else:
+            stats["unassigned"] = count
+    return stats
 
 
 # ═══════════════════════════════════════════════════════════════════
@@ -76,17 +251,22 @@ def log_activity(request_obj, action, performed_by, detail=""):
     """
     Create a RequestActivity audit log entry.
 
+    Inserted in the current transaction, or after it commits in batches
+    when ACTIVITY_LOG_MODE=buffered (see core.activity_log).
+
     Args:
         request_obj: Request instance
         action: RequestActivity.Action value
         performed_by: User who performed the action
         detail: Human-readable description
     """
-    activity = RequestActivity.objects.create(
-        request=request_obj,
-        action=action,
-        detail=detail,
-        performed_by=performed_by,
+    activity = activity_log.record(
+        RequestActivity(
+            request=request_obj,
+            action=action,
+            detail=detail,
+            performed_by=performed_by,
+        )
     )
     logger.info(
         f"[ACTIVITY] {action} on request id={request_obj.id} by {performed_by.email}: {detail}"
@@ -94,6 +274,7 @@ def log_activity(request_obj, action, performed_by, detail=""):
     return activity
 
 
+@retry_on_locked
 def create_request(user, title, description, priority=None):
     """
     Create a new request and log the CREATED activity.
@@ -115,22 +296,41 @@ def create_request(user, title, description, priority=None):
     if priority:
         kwargs["priority"] = priority
 
-    request_obj = Request.objects.create(**kwargs)
+    with _write_transaction():
+        request_obj = Request.objects.create(**kwargs)
 
-    log_activity(
-        request_obj=request_obj,
-        action=RequestActivity.Action.CREATED,
-        performed_by=user,
-        detail=f"Request '{title}' created with priority {request_obj.priority}",
-    )
+        log_activity(
+            request_obj=request_obj,
+            action=RequestActivity.Action.CREATED,
+            performed_by=user,
+            detail=f"Request '{title}' created with priority {request_obj.priority}",
+        )
+        keys = _counter_keys(
+            request_obj.status, request_obj.priority, request_obj.assigned_to_id
+        )
+        _apply_counter_deltas({key: 1 for key in keys})
+        data_changed()
+        stick_to_primary(user)
+        publish_on_commit(
+            "request.created",
+            {
+                "id": request_obj.pk,
+                "owner": request_obj.user_id,
+                "status": request_obj.status,
+                "priority": request_obj.priority,
+                "assigned_to": request_obj.assigned_to_id,
+            },
+        )
 
     logger.info(f"[SERVICE] Request id={request_obj.id} created by {user.email}")
     return request_obj
 
 
+@retry_on_locked
 def change_request_status(request_obj, new_status, changed_by):
     """
-    Change the status of a request with transition validation.
+    Change the status of a request with transition validation
+    (core.workflow: admins may take any transition, owners may cancel).
 
     Args:
         request_obj: Request instance
@@ -141,20 +341,38 @@ def change_request_status(request_obj, new_status, changed_by):
         Request: The updated request
 
     Raises:
-        ValidationError: If the transition is not allowed
+        ValidationError: If the workflow does not allow changed_by's role
+                         the transition from the status the request has
+                         when it is updated, or changed_by is neither an
+                         admin nor the owner
     """
-    old_status = request_obj.status
-    _validate_transition(old_status, new_status)
-
-    request_obj.status = new_status
-    request_obj.save(update_fields=["status", "updated_at"])
+    role = workflow.actor_role(changed_by, request_obj)
+    if role is None:
+        raise ValidationError("You can only change the status of your own requests.")
+
+    with _write_transaction():
+        # UPDATE ... WHERE status=<status validated>: of two concurrent
+        # changes only one matches; the other is validated again
+        old_status = _apply_change(
+            request_obj,
+            ["status"],
+            lambda obj: workflow.validate(obj.status, new_status, role),
+            status=new_status,
+        )["status"]
 
-    log_activity(
-        request_obj=request_obj,
-        action=RequestActivity.Action.STATUS_CHANGED,
-        performed_by=changed_by,
-        detail=f"Status changed from {old_status} to {new_status}",
-    )
+        log_activity(
+            request_obj=request_obj,
+            action=RequestActivity.Action.STATUS_CHANGED,
+            performed_by=changed_by,
+            detail=f"Status changed from {old_status} to {new_status}",
+        )
+        _move_counter(Dimension.STATUS, old_status, new_status)
+        data_changed()
+        stick_to_primary(changed_by)
+        publish_on_commit(
+            "request.status_changed",
+            {"id": request_obj.pk, "owner": request_obj.user_id, "from": old_status, "to": new_status},
+        )
 
     logger.info(
         f"[SERVICE] Request id={request_obj.id} status: {old_status} → {new_status} "
@@ -163,6 +381,7 @@ def change_request_status(request_obj, new_status, changed_by):
     return request_obj
 
 
+@retry_on_locked
 def assign_request(request_obj, admin_user, assigned_by):
     """
     Assign a request to an admin user.
@@ -179,35 +398,543 @@ def assign_request(request_obj, admin_user, assigned_by):
         ValidationError: If the request is in a terminal state,
                          or admin_user is not an admin
     """
-    if request_obj.is_terminal:
-        raise ValidationError(
-            f"Cannot assign a request in terminal state ({request_obj.status})."
+    if admin_user is not None and not admin_user.is_admin():
+        raise ValidationError("Requests can only be assigned to admin users.")
+
+    def validate(obj):
+        if workflow.is_terminal(obj.status):
+            raise ValidationError(f"Cannot assign a request in terminal state ({obj.status}).")
+
+    old_assignee = request_obj.assigned_to
+
+    with _write_transaction():
+        old_assignee_id = _apply_change(
+            request_obj, ["status", "assigned_to"], validate, assigned_to=admin_user
+        )["assigned_to_id"]
+        if old_assignee_id != (old_assignee.pk if old_assignee else None):
+            # Reassigned by someone else since request_obj was read
+            old_assignee = User.objects.filter(pk=old_assignee_id).first()
+
+        if admin_user:
+            log_activity(
+                request_obj=request_obj,
+                action=RequestActivity.Action.ASSIGNED,
+                performed_by=assigned_by,
+                detail=f"Assigned to {admin_user.email}",
+            )
+        else:
+            log_activity(
+                request_obj=request_obj,
+                action=RequestActivity.Action.UNASSIGNED,
+                performed_by=assigned_by,
+                detail=f"Unassigned from {old_assignee.email if old_assignee else 'nobody'}",
+            )
+        _move_counter(
+            Dimension.ASSIGNEE,
+            _assignee_value(old_assignee_id),
+            _assignee_value(admin_user.pk if admin_user else None),
+        )
+        data_changed()
+        stick_to_primary(assigned_by)
+        publish_on_commit(
+            "request.assigned",
+            {
+                "id": request_obj.pk,
+                "owner": request_obj.user_id,
+                "from": old_assignee_id,
+                "to": admin_user.pk if admin_user else None,
+            },
         )
 
+    logger.info(
+        f"[SERVICE] Request id={request_obj.id} assigned to "
+        f"{admin_user.email if admin_user else 'nobody'} by {assigned_by.email}"
+    )
+    return request_obj
+
+
+@retry_on_locked
+def bulk_change_request_status(request_ids, new_status, changed_by):
+    """
+    Move many requests to new_status with set-based validation.
+
+    Each request is checked against the workflow. Valid ones are applied
+    with one UPDATE per source status, and their STATUS_CHANGED
+    activities are written with a single bulk_create. Invalid or missing
+    ids are reported, not raised, so one bad id does not fail the batch.
+
+    Args:
+        request_ids: Iterable of Request ids (duplicates are ignored)
+        new_status: Target status (must be a valid Request.Status value)
+        changed_by: User performing the change
+
+    Returns:
+        list[dict]: One {"id", "success", "message"} entry per id, in input order
+    """
+    ids = list(dict.fromkeys(request_ids))
+    role = User.Role.ADMIN if changed_by.is_admin() else None
+    results = {}
+    by_source = defaultdict(list)
+
+    with _write_transaction():
+        current = {}
+        owners = {}
+        for pk, request_status, owner_id in (
+            Request.objects.select_for_update()
+            .filter(pk__in=ids)
+            .order_by("pk")
+            .values_list("id", "status", "user_id")
+        ):
+            current[pk] = request_status
+            owners[pk] = owner_id
+        for pk in ids:
+            if pk not in current:
+                results[pk] = {"id": pk, "success": False, "message": "Request not found."}
+                continue
+            error = workflow.check(current[pk], new_status, role)
+            if error:
+                results[pk] = {"id": pk, "success": False, "message": error}
+            else:
+                by_source[current[pk]].append(pk)
+
+        now = timezone.now()
+        activities = []
+        deltas = Counter()
+        for old_status, pks in by_source.items():
+            Request.objects.filter(pk__in=pks, status=old_status).update(
+                status=new_status, updated_at=now
+            )
+            ChangeSequence.track_rows(Request, pks)
+            detail = f"Status changed from {old_status} to {new_status}"
+            for pk in pks:
+                activities.append(
+                    RequestActivity(
+                        request_id=pk,
+                        action=RequestActivity.Action.STATUS_CHANGED,
+                        performed_by=changed_by,
+                        detail=detail,
+                    )
+                )
+                results[pk] = {"id": pk, "success": True, "message": detail}
+                publish_on_commit(
+                    "request.status_changed",
+                    {"id": pk, "owner": owners[pk], "from": old_status, "to": new_status},
+                )
+            deltas[(Dimension.STATUS, old_status)] -= len(pks)
+            deltas[(Dimension.STATUS, new_status)] += len(pks)
+
+        ChangeSequence.track(*RequestActivity.objects.bulk_create(activities))
+        _apply_counter_deltas(deltas)
+        data_changed()
+        stick_to_primary(changed_by)
+
+    logger.info(
+        f"[SERVICE] Bulk status → {new_status} by {changed_by.email}: "
+        f"{len(activities)} updated, {len(ids) - len(activities)} rejected"
+    )
+    return [results[pk] for pk in ids]
+
+
+@retry_on_locked
+def bulk_assign_requests(request_ids, admin_user, assigned_by):
+    """
+    Assign many requests to one admin user (or unassign them).
+
+    Terminal and missing requests are rejected per id using a single
+    query; the rest are updated with one UPDATE and their ASSIGNED /
+    UNASSIGNED activities written with a single bulk_create.
+
+    Args:
+        request_ids: Iterable of Request ids (duplicates are ignored)
+        admin_user: User (with ADMIN role) to assign, or None to unassign
+        assigned_by: User performing the assignment
+
+    Returns:
+        list[dict]: One {"id", "success", "message"} entry per id, in input order
+
+    Raises:
+        ValidationError: If admin_user is not an admin
+    """
     if admin_user is not None and not admin_user.is_admin():
         raise ValidationError("Requests can only be assigned to admin users.")
 
-    old_assignee = request_obj.assigned_to
-    request_obj.assigned_to = admin_user
-    request_obj.save(update_fields=["assigned_to", "updated_at"])
+    ids = list(dict.fromkeys(request_ids))
+    new_value = _assignee_value(admin_user.pk if admin_user else None)
+    results = {}
+
+    with _write_transaction():
+        rows = {
+            pk: (request_status, assigned_to_id, assigned_to_email, owner_id)
+            for pk, request_status, assigned_to_id, assigned_to_email, owner_id in (
+                Request.objects.select_for_update(of=("self",))
+                .filter(pk__in=ids)
+                .order_by("pk")
+                .values_list("id", "status", "assigned_to_id", "assigned_to__email", "user_id")
+            )
+        }
+
+        activities = []
+        deltas = Counter()
+        for pk in ids:
+            if pk not in rows:
+                results[pk] = {"id": pk, "success": False, "message": "Request not found."}
+                continue
+            request_status, assigned_to_id, assigned_to_email, owner_id = rows[pk]
+            if workflow.is_terminal(request_status):
+                results[pk] = {
+                    "id": pk,
+                    "success": False,
+                    "message": f"Cannot assign a request in terminal state ({request_status}).",
+                }
+                continue
+
+            if admin_user:
+                action = RequestActivity.Action.ASSIGNED
+                detail = f"Assigned to {admin_user.email}"
+            else:
+                action = RequestActivity.Action.UNASSIGNED
+                detail = f"Unassigned from {assigned_to_email or 'nobody'}"
+            activities.append(
+                RequestActivity(
+                    request_id=pk,
+                    action=action,
+                    performed_by=assigned_by,
+                    detail=detail,
+                )
+            )
+            results[pk] = {"id": pk, "success": True, "message": detail}
+            publish_on_commit(
+                "request.assigned",
+                {
+                    "id": pk,
+                    "owner": owner_id,
+                    "from": assigned_to_id,
+                    "to": admin_user.pk if admin_user else None,
+                },
+            )
+            deltas[(Dimension.ASSIGNEE, _assignee_value(assigned_to_id))] -= 1
+            deltas[(Dimension.ASSIGNEE, new_value)] += 1
+
+        if activities:
+            assigned = [activity.request_id for activity in activities]
+            Request.objects.filter(pk__in=assigned).update(
+                assigned_to=admin_user, updated_at=timezone.now()
+            )
+            ChangeSequence.track_rows(Request, assigned)
+            ChangeSequence.track(*RequestActivity.objects.bulk_create(activities))
+            _apply_counter_deltas(deltas)
+            data_changed()
+            stick_to_primary(assigned_by)
 
-    if admin_user:
-        log_activity(
-            request_obj=request_obj,
-            action=RequestActivity.Action.ASSIGNED,
-            performed_by=assigned_by,
-            detail=f"Assigned to {admin_user.email}",
+    logger.info(
+        f"[SERVICE] Bulk assign to {admin_user.email if admin_user else 'nobody'} "
+        f"by {assigned_by.email}: {len(activities)} updated, {len(ids) - len(activities)} rejected"
+    )
+    return [results[pk] for pk in ids]
+
+
+@retry_on_locked
+def change_request_priority(request_obj, new_priority, changed_by):
+    """
+    Change the priority of a request.
+
+    Args:
+        request_obj: Request instance
+        new_priority: Target priority (must be a valid Request.Priority value)
+        changed_by: User performing the change
+
+    Returns:
+        Request: The updated request
+
+    Raises:
+        ValidationError: If the priority is not valid
+    """
+    if new_priority not in Request.Priority.values:
+        raise ValidationError(
+            f"Invalid priority. Must be one of: {', '.join(Request.Priority.values)}"
         )
-    else:
+
+    with _write_transaction():
+        old_priority = _apply_change(
+            request_obj, ["priority"], lambda obj: None, priority=new_priority
+        )["priority"]
+
         log_activity(
             request_obj=request_obj,
-            action=RequestActivity.Action.UNASSIGNED,
-            performed_by=assigned_by,
-            detail=f"Unassigned from {old_assignee.email if old_assignee else 'nobody'}",
+            action=RequestActivity.Action.STATUS_CHANGED,
+            performed_by=changed_by,
+            detail=f"Priority changed from {old_priority} to {new_priority}",
+        )
+        _move_counter(Dimension.PRIORITY, old_priority, new_priority)
+        data_changed()
+        stick_to_primary(changed_by)
+        publish_on_commit(
+            "request.priority_changed",
+            {
+                "id": request_obj.pk,
+                "owner": request_obj.user_id,
+                "from": old_priority,
+                "to": new_priority,
+            },
         )
 
     logger.info(
-        f"[SERVICE] Request id={request_obj.id} assigned to "
-        f"{admin_user.email if admin_user else 'nobody'} by {assigned_by.email}"
+        f"[SERVICE] Request id={request_obj.id} priority: {old_priority} → {new_priority} "
+        f"by {changed_by.email}"
     )
     return request_obj
+
+
+@retry_on_locked
+def delete_request(request_obj, deleted_by):
+    """
+    Delete a request (its activities cascade).
+
+    The row is re-read under a lock and deleted as stored, so the counters
+    (decremented by the post_delete handler) never use values that a
+    concurrent change has replaced since request_obj was read. Deleting a
+    request that is already gone does nothing.
+
+    Args:
+        request_obj: Request instance
+        deleted_by: User performing the deletion
+    """
+    request_id = request_obj.id
+
+    with _write_transaction():
+        current = Request.objects.select_for_update().filter(pk=request_id).first()
+        if current is None:
+            logger.info(f"[SERVICE] Request id={request_id} already deleted")
+            return
+        owner_id = current.user_id
+        current.delete()
+        data_changed()
+        stick_to_primary(deleted_by)
+        publish_on_commit("request.deleted", {"id": request_id, "owner": owner_id})
+
+    logger.info(f"[SERVICE] Request id={request_id} deleted by {deleted_by.email}")
+
+
+@retry_on_locked
+def save_request(request_obj, saved_by=None):
+    """
+    Save a request edited as a whole, as the Django admin does, moving it
+    between counters by the values it replaces (re-read under a lock).
+
+    Status edits are checked against the workflow by the admin form; this
+    keeps counters, cached responses and the event stream in step.
+
+    Args:
+        request_obj: new or changed Request instance
+        saved_by: User making the edit (None for the Django admin, whose
+                  staff accounts are not Helix users)
+    """
+    with _write_transaction():
+        deltas = Counter()
+        created = request_obj.pk is None
+        if not created:
+            old = (
+                Request.objects.select_for_update()
+                .filter(pk=request_obj.pk)
+                .values("status", "priority", "assigned_to_id")
+                .first()
+            )
+            if old is not None:
+                for key in _counter_keys(old["status"], old["priority"], old["assigned_to_id"]):
+                    deltas[key] -= 1
+        request_obj.save()
+        for key in _counter_keys(
+            request_obj.status, request_obj.priority, request_obj.assigned_to_id
+        ):
+            deltas[key] += 1
+        _apply_counter_deltas(deltas)
+        data_changed()
+        stick_to_primary(saved_by)
+        publish_on_commit(
+            "request.created" if created else "request.updated",
+            {
+                "id": request_obj.pk,
+                "owner": request_obj.user_id,
+                "status": request_obj.status,
+                "priority": request_obj.priority,
+                "assigned_to": request_obj.assigned_to_id,
+            },
+        )
+
+    logger.info(
+        f"[SERVICE] Request id={request_obj.pk} {'created' if created else 'saved'} "
+        f"by {saved_by.email if saved_by else 'Django admin'}"
+    )
+    return request_obj
+
+
+def bulk_import_requests(
+    rows,
+    chunk_size=1000,
+    create_users=False,
+    dry_run=False,
+    max_errors=1000,
+    on_chunk=None,
+    imported_by=None,
+):
+    """
+    Import requests from a stream of rows in chunks.
+
+    Each row is a dict with "user_email", "title", "description" and an
+    optional "priority", validated with the RequestCreateSerializer rules.
+    Valid rows are inserted with one bulk_create per chunk, followed by a
+    bulk_create of their CREATED activities and one counters update, all
+    in a per-chunk transaction. Rows are consumed lazily, so memory use is
+    bounded by the chunk size, not the input size.
+
+    Args:
+        rows: Iterable of (line_number, row_dict, parse_error) tuples,
+              as produced by core.parsers.iter_json_lines
+        chunk_size: Rows per transaction / bulk_create
+        create_users: Create missing users with a placeholder uid
+                      (synced to the real Firebase uid on first login)
+        dry_run: Validate only, write nothing
+        max_errors: Stop collecting per-row errors after this many
+        on_chunk: Optional callback(report) after each chunk
+        imported_by: Optional User running the import
+
+    Returns:
+        dict: processed/created/failed counts, throughput and per-row errors
+    """
+    validator = RequestCreateSerializer()
+    users_by_email = {}
+    report = {
+        "processed": 0,
+        "created": 0,
+        "failed": 0,
+        "chunks": 0,
+        "dry_run": dry_run,
+        "elapsed_seconds": 0.0,
+        "rows_per_second": 0.0,
+        "errors": [],
+        "errors_truncated": False,
+    }
+
+    def add_error(line_number, errors):
+        report["failed"] += 1
+        if len(report["errors"]) < max_errors:
+            report["errors"].append({"line": line_number, "errors": errors})
+        else:
+            report["errors_truncated"] = True
+
+    @retry_on_locked
+    def insert_chunk(to_create):
+        with _write_transaction():
+            created = Request.objects.bulk_create(
+                [
+                    Request(
+                        user=user,
+                        title=data["title"],
+                        description=data["description"],
+                        priority=data.get("priority") or Request.Priority.MEDIUM,
+                    )
+                    for _, user, data in to_create
+                ]
+            )
+            activities = RequestActivity.objects.bulk_create(
+                [
+                    RequestActivity(
+                        request=request_obj,
+                        action=RequestActivity.Action.CREATED,
+                        performed_by=request_obj.user,
+                        detail=(
+                            f"Request '{request_obj.title}' created with priority "
+                            f"{request_obj.priority} (imported)"
+                        ),
+                    )
+                    for request_obj in created
+                ]
+            )
+            ChangeSequence.track(*created, *activities)
+            deltas = Counter()
+            for request_obj in created:
+                for key in _counter_keys(
+                    request_obj.status, request_obj.priority, request_obj.assigned_to_id
+                ):
+                    deltas[key] += 1
+            _apply_counter_deltas(deltas)
+            data_changed()
+            stick_to_primary(imported_by)
+            publish_on_commit("requests.imported", {"owner": None, "count": len(created)})
+        return created
+
+    started = time.monotonic()
+    rows = iter(rows)
+    while True:
+        chunk = list(islice(rows, chunk_size))
+        if not chunk:
+            break
+        report["chunks"] += 1
+        report["processed"] += len(chunk)
+
+        # ── Validate ─────────────────────────────────────────────
+        valid = []
+        for line_number, row, parse_error in chunk:
+            if parse_error:
+                add_error(line_number, {"non_field_errors": [parse_error]})
+                continue
+            if not isinstance(row, dict):
+                add_error(line_number, {"non_field_errors": ["Expected a JSON object."]})
+                continue
+            email = str(row.get("user_email") or "").strip()
+            if not email:
+                add_error(line_number, {"user_email": ["This field is required."]})
+                continue
+            try:
+                data = validator.run_validation(row)
+            except DRFValidationError as e:
+                add_error(line_number, e.detail)
+                continue
+            valid.append((line_number, email, data))
+
+        # ── Resolve users (one query per chunk) ──────────────────
+        missing = {email for _, email, _ in valid} - users_by_email.keys()
+        if missing:
+            for user in User.objects.filter(email__in=missing):
+                users_by_email[user.email] = user
+            missing -= users_by_email.keys()
+            if missing and create_users and not dry_run:
+                User.objects.bulk_create(
+                    [User(uid=f"imported:{uuid.uuid4().hex}", email=email) for email in missing],
+                    ignore_conflicts=True,
+                )
+                for user in User.objects.filter(email__in=missing):
+                    users_by_email[user.email] = user
+
+        to_create = []
+        for line_number, email, data in valid:
+            user = users_by_email.get(email)
+            if user is None and not (create_users and dry_run):
+                add_error(line_number, {"user_email": [f"No user with email {email}."]})
+                continue
+            to_create.append((line_number, user, data))
+
+        # ── Insert ───────────────────────────────────────────────
+        if dry_run:
+            report["created"] += len(to_create)
+        elif to_create:
+            try:
+                created = insert_chunk(to_create)
+                report["created"] += len(created)
+            except DatabaseError as e:
+                logger.error(f"[SERVICE] Import chunk {report['chunks']} failed: {e}")
+                for line_number, _, _ in to_create:
+                    add_error(line_number, {"non_field_errors": [f"Database error: {e}"]})
+
+        elapsed = time.monotonic() - started
+        report["elapsed_seconds"] = round(elapsed, 3)
+        report["rows_per_second"] = round(report["processed"] / elapsed, 1) if elapsed else 0.0
+        if on_chunk:
+            on_chunk(report)
+
+    logger.info(
+        f"[SERVICE] Import {'dry run ' if dry_run else ''}finished: "
+        f"{report['created']} created, {report['failed']} failed, "
+        f"{report['rows_per_second']} rows/s"
+    )
+    return report
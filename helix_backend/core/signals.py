@@ -0,0 +1,98 @@
+"""
+Signal handlers for Helix backend.
+
+Connected in CoreConfig.ready().
+"""
+
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db.backends.signals import connection_created
+from django.db.models.signals import post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from core import activity_log, services
+from core.authentication import user_cache
+from core.db import sqlite
+from core.models import ChangeSequence, Request, RequestActivity, RequestTombstone, User
+from core.response_cache import data_changed
+
+
+@receiver(post_save, sender=User, dispatch_uid="core.user_cache.post_save")
+@receiver(post_delete, sender=User, dispatch_uid="core.user_cache.post_delete")
+def invalidate_cached_user(sender, instance, **kwargs):
+    """Drop the saved/deleted user from the authentication user cache."""
+    user_cache.invalidate(instance)
+
+
+@receiver(post_save, sender=User, dispatch_uid="core.response_cache.user.post_save")
+@receiver(post_delete, sender=User, dispatch_uid="core.response_cache.user.post_delete")
+@receiver(post_save, sender=Request, dispatch_uid="core.response_cache.request.post_save")
+@receiver(post_delete, sender=Request, dispatch_uid="core.response_cache.request.post_delete")
+@receiver(post_save, sender=RequestActivity, dispatch_uid="core.response_cache.activity.post_save")
+@receiver(
+    post_delete, sender=RequestActivity, dispatch_uid="core.response_cache.activity.post_delete"
+)
+def invalidate_cached_responses(sender, instance, **kwargs):
+    """
+    Invalidate cached list responses on saves/deletes made outside the
+    service layer (Django admin, shell). Service functions call
+    data_changed() themselves, including for bulk updates that send no
+    signals.
+    """
+    data_changed()
+
+
+@receiver(post_delete, sender=Request, dispatch_uid="core.counters.request.post_delete")
+def uncount_deleted_request(sender, instance, **kwargs):
+    """
+    Keep RequestCounter in step with every deletion: delete_request(),
+    the Django admin and requests cascading from a deleted user.
+    """
+    services.count_deleted_request(instance)
+
+
+@receiver(pre_delete, sender=User, dispatch_uid="core.counters.user.pre_delete")
+def unassign_deleted_user(sender, instance, **kwargs):
+    """Requests assigned to a deleted user become unassigned (SET_NULL)."""
+    services.count_deleted_assignee(instance)
+
+
+@receiver(pre_delete, sender=User, dispatch_uid="core.change_feed.user.pre_delete")
+def reposition_unassigned_requests(sender, instance, **kwargs):
+    """
+    Deleting a user unassigns their requests with a bulk UPDATE
+    (SET_NULL), which stamps no change_seq: move them in the change feed
+    with the deleting transaction.
+    """
+    assigned = list(Request.objects.filter(assigned_to=instance).values_list("pk", flat=True))
+    if assigned:
+        ChangeSequence.track_rows(Request, assigned)
+
+
+@receiver(post_save, sender=User, dispatch_uid="core.list_validators.user.post_save")
+@receiver(post_delete, sender=User, dispatch_uid="core.list_validators.user.post_delete")
+def advance_change_sequence(sender, instance, **kwargs):
+    """
+    Request lists show the owner's and assignee's email: move the
+    sequence so their ETags (ConditionalListMixin) change with the user.
+    """
+    ChangeSequence.advance()
+
+
+@receiver(post_delete, sender=Request, dispatch_uid="core.change_feed.request.post_delete")
+def record_request_tombstone(sender, instance, **kwargs):
+    """Leave a tombstone so change feed clients learn about the deletion."""
+    RequestTombstone.objects.create(request_id=instance.pk, owner_id=instance.user_id)
+
+
+@receiver(request_finished, dispatch_uid="core.activity_log.request_finished")
+def flush_activity_log(sender, **kwargs):
+    """Write the activities queued in buffered mode once the response is sent."""
+    activity_log.flush()
+
+
+@receiver(connection_created, dispatch_uid="core.db.sqlite.connection_created")
+def tune_sqlite_connection(sender, connection, **kwargs):
+    """Apply the SQLite profile (SQLITE_TUNED) to each new connection."""
+    if connection.vendor == "sqlite" and settings.SQLITE_TUNED:
+        sqlite.apply_pragmas(connection)
@@ -0,0 +1,104 @@
+"""Write-behind activity log (core.activity_log)."""
+
+import tempfile
+from pathlib import Path
+from unittest import mock
+
+from django.db import OperationalError
+from django.test import TestCase, override_settings
+
+from core import activity_log, services
+from core.activity_log import ActivitySpool, ActivityWriter
+from core.models import Request, RequestActivity, User
+
+Action = RequestActivity.Action
+
+
+@override_settings(ACTIVITY_LOG_MODE="buffered")
+class ActivityWriterTests(TestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+        self.writer = ActivityWriter(ActivitySpool(self.directory), max_pending=3)
+        # Flushed by the tests, not the background thread
+        self.writer.start = mock.Mock()
+        patcher = mock.patch.object(activity_log, "writer", self.writer)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.request_obj = services.create_request(user=self.admin, title="t", description="d")
+
+    def status_changes(self):
+        return RequestActivity.objects.filter(request=self.request_obj, action=Action.STATUS_CHANGED)
+
+    def change_status(self, new_status):
+        with self.captureOnCommitCallbacks(execute=True):
+            services.change_request_status(self.request_obj, new_status, self.admin)
+
+    def spooled(self):
+        return [
+            line for path in self.directory.glob("*.jsonl") for line in path.read_text().splitlines()
+        ]
+
+    def test_entries_are_spooled_until_flushed(self):
+        self.change_status(Request.Status.REVIEWING)
+        self.assertEqual(len(self.spooled()), 2)
+        self.assertFalse(RequestActivity.objects.exists())
+
+        self.assertEqual(self.writer.flush(), 2)
+        self.assertEqual(self.spooled(), [])
+        self.assertEqual(self.status_changes().count(), 1)
+
+    def test_failed_flush_is_kept_and_logging_falls_back_to_sync(self):
+        with mock.patch.object(
+            RequestActivity.objects, "bulk_create", side_effect=OperationalError("down")
+        ):
+            self.assertEqual(self.writer.flush(), 0)
+        self.assertEqual(self.writer.pending, 1)
+        self.assertEqual(len(self.spooled()), 1)
+
+        # Written in the mutation's transaction while flushes fail
+        self.change_status(Request.Status.REVIEWING)
+        self.assertEqual(self.status_changes().count(), 1)
+        self.assertEqual(self.writer.pending, 1)
+
+        self.assertEqual(self.writer.flush(), 1)
+        self.assertEqual(self.spooled(), [])
+        self.assertEqual(RequestActivity.objects.filter(action=Action.CREATED).count(), 1)
+        self.assertTrue(self.writer.accepting())
+
+    def test_full_queue_falls_back_to_sync(self):
+        self.change_status(Request.Status.REVIEWING)
+        self.change_status(Request.Status.IN_PROGRESS)
+        self.assertEqual(self.writer.pending, 3)
+        self.change_status(Request.Status.COMPLETED)
+        self.assertEqual(self.writer.pending, 3)
+        self.assertEqual(self.status_changes().count(), 1)
+        self.assertEqual(self.writer.stats()["sync_fallbacks"], 1)
+
+        self.writer.flush()
+        self.assertEqual(self.status_changes().count(), 3)
+
+    def test_spool_of_a_dead_process_is_replayed_once(self):
+        self.change_status(Request.Status.REVIEWING)
+        # The process dies: its spool is left behind, unlocked
+        (path,) = self.directory.glob("*.jsonl")
+        self.writer.spool._file.close()
+        copy = self.directory / "copy.jsonl"
+        copy.write_text(path.read_text())
+
+        restarted = ActivityWriter(ActivitySpool(self.directory))
+        self.assertTrue(restarted.replay())
+        self.assertEqual(restarted.replayed, 4)
+        self.assertEqual(RequestActivity.objects.count(), 2)
+        self.assertEqual(list(self.directory.glob("*.jsonl")), [])
+
+    def test_spool_of_a_live_process_is_left_alone(self):
+        self.change_status(Request.Status.REVIEWING)
+        other = ActivityWriter(ActivitySpool(self.directory))
+        self.assertTrue(other.replay())
+        self.assertFalse(RequestActivity.objects.exists())
+        self.assertEqual(len(self.spooled()), 2)
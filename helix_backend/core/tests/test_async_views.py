@@ -0,0 +1,128 @@
+"""Async views (core.async_views) against their sync counterparts, and benchmark_async."""
+
+import json
+from unittest import mock
+
+from asgiref.sync import sync_to_async
+from django.core.cache import cache
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import AsyncRequestFactory, SimpleTestCase, TestCase
+from rest_framework.test import APIRequestFactory, force_authenticate
+
+from core import services
+from core.async_views import (
+    AsyncAdminRequestActivitiesView,
+    AsyncAdminRequestListView,
+    AsyncAuthMeView,
+    AsyncUserRequestListView,
+)
+from core.authentication import FirebaseAuthentication
+from core.db import routers
+from core.management.commands import benchmark_async
+from core.models import Request, User
+from core.views import (
+    AdminRequestActivitiesView,
+    AdminRequestListView,
+    AuthMeView,
+    UserRequestListCreateView,
+)
+
+
+class AsyncViewTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(uid="user", email="user@example.com")
+        cls.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+        for number in range(25):
+            request_obj = services.create_request(user=cls.user, title=f"t{number}", description="d")
+        services.assign_request(request_obj, cls.admin, cls.admin)
+        services.change_request_status(request_obj, Request.Status.REVIEWING, cls.admin)
+        cls.request_obj = request_obj
+
+    def sync_get(self, view_class, user, path, **kwargs):
+        request = APIRequestFactory().get(path)
+        force_authenticate(request, user=user)
+        response = view_class.as_view()(request, **kwargs)
+        response.render()
+        return response
+
+    async def async_get(self, view_class, user, path, **kwargs):
+        authenticate = mock.AsyncMock(return_value=(user, None))
+        with mock.patch.object(FirebaseAuthentication, "aauthenticate", authenticate):
+            return await view_class.as_view()(AsyncRequestFactory().get(path), **kwargs)
+
+    async def assertSameResponse(self, sync_view, async_view, user, path, **kwargs):
+        expected = await sync_to_async(self.sync_get)(sync_view, user, path, **kwargs)
+        response = await self.async_get(async_view, user, path, **kwargs)
+        self.assertEqual(response.status_code, expected.status_code)
+        self.assertEqual(json.loads(response.content), json.loads(expected.content))
+        self.assertEqual(response.get("ETag"), expected.get("ETag"))
+        return response
+
+    async def test_request_lists(self):
+        await self.assertSameResponse(
+            UserRequestListCreateView, AsyncUserRequestListView, self.user, "/api/requests/"
+        )
+        await self.assertSameResponse(
+            AdminRequestListView,
+            AsyncAdminRequestListView,
+            self.admin,
+            "/api/admin/requests/?status=REVIEWING",
+        )
+
+    async def test_next_page_cursor(self):
+        first = await self.async_get(AsyncAdminRequestListView, self.admin, "/api/admin/requests/")
+        next_url = json.loads(first.content)["next"]
+        await self.assertSameResponse(
+            AdminRequestListView, AsyncAdminRequestListView, self.admin, next_url
+        )
+
+    async def test_activities(self):
+        path = f"/api/admin/requests/{self.request_obj.pk}/activities/"
+        await self.assertSameResponse(
+            AdminRequestActivitiesView,
+            AsyncAdminRequestActivitiesView,
+            self.admin,
+            path,
+            pk=self.request_obj.pk,
+        )
+
+    async def test_auth_me(self):
+        await self.assertSameResponse(AuthMeView, AsyncAuthMeView, self.user, "/api/auth/me/")
+
+    async def test_permissions_still_apply(self):
+        response = await self.async_get(AsyncAdminRequestListView, self.user, "/api/admin/requests/")
+        self.assertEqual(response.status_code, 403)
+
+    async def test_etag_is_honoured(self):
+        first = await self.async_get(AsyncUserRequestListView, self.user, "/api/requests/")
+        authenticate = mock.AsyncMock(return_value=(self.user, None))
+        request = AsyncRequestFactory().get("/api/requests/", headers={"If-None-Match": first["ETag"]})
+        with mock.patch.object(FirebaseAuthentication, "aauthenticate", authenticate):
+            response = await AsyncUserRequestListView.as_view()(request)
+        self.assertEqual(response.status_code, 304)
+
+    async def test_replica_stickiness_is_checked_without_blocking(self):
+        await cache.aset(f"{routers.STICKY_KEY_PREFIX}{self.user.pk}", 1)
+        self.addCleanup(cache.delete, f"{routers.STICKY_KEY_PREFIX}{self.user.pk}")
+        sync_check = mock.patch.object(
+            routers, "is_sticky", side_effect=AssertionError("sync cache read on the event loop")
+        )
+        start = mock.AsyncMock(wraps=routers.astart_replica_reads)
+        with mock.patch.object(routers, "replica_configured", return_value=True), sync_check:
+            with mock.patch.object(routers, "astart_replica_reads", start):
+                # Sticky: stays on the primary (there is no replica database here)
+                response = await self.async_get(
+                    AsyncUserRequestListView, self.user, "/api/requests/"
+                )
+        self.assertEqual(response.status_code, 200)
+        start.assert_awaited_once()
+        self.assertFalse(routers.reading_from_replica())
+
+
+class BenchmarkCommandTests(SimpleTestCase):
+    def test_missing_httpx_is_a_command_error(self):
+        with mock.patch.object(benchmark_async, "httpx", None):
+            with self.assertRaisesMessage(CommandError, "pip install httpx"):
+                call_command("benchmark_async")
@@ -0,0 +1,153 @@
+"""Token verification and user resolution caches (core.authentication)."""
+
+import time
+from unittest import mock
+
+from django.test import SimpleTestCase, TestCase
+from rest_framework import exceptions
+from rest_framework.test import APIRequestFactory
+
+from core import authentication
+from core.authentication import ExpiringLRUCache, FirebaseAuthentication, VerifiedTokenCache
+from core.models import User
+
+
+class ExpiringLRUCacheTests(SimpleTestCase):
+    def test_hit_miss_and_expiry(self):
+        cache = ExpiringLRUCache(max_size=4)
+        cache.set("a", 1, time.time() + 60)
+        cache.set("b", 2, time.time() + 60)
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("missing"))
+
+        with mock.patch("core.authentication.time.time", return_value=time.time() + 120):
+            self.assertIsNone(cache.get("b"))
+        stats = cache.stats()
+        self.assertEqual(
+            (stats["hits"], stats["misses"], stats["expirations"], stats["size"]), (1, 2, 1, 1)
+        )
+
+    def test_least_recently_used_entry_is_evicted(self):
+        cache = ExpiringLRUCache(max_size=2)
+        expires_at = time.time() + 60
+        cache.set("a", 1, expires_at)
+        cache.set("b", 2, expires_at)
+        cache.get("a")
+        cache.set("c", 3, expires_at)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual((cache.get("a"), cache.get("c")), (1, 3))
+        self.assertEqual(cache.stats()["evictions"], 1)
+
+    def test_size_zero_and_expired_values_are_not_stored(self):
+        ExpiringLRUCache(max_size=0).set("a", 1, time.time() + 60)
+        cache = ExpiringLRUCache()
+        cache.set("a", 1, time.time() - 1)
+        self.assertEqual(cache.stats()["size"], 0)
+
+
+class VerifiedTokenCacheTests(SimpleTestCase):
+    def test_entries_expire_at_the_exp_claim(self):
+        cache = VerifiedTokenCache()
+        cache.set("token", {"uid": "u", "exp": time.time() + 60})
+        cache.set("no-exp", {"uid": "u"})
+        self.assertEqual(cache.get("token")["uid"], "u")
+        self.assertIsNone(cache.get("no-exp"))
+        with mock.patch("core.authentication.time.time", return_value=time.time() + 61):
+            self.assertIsNone(cache.get("token"))
+
+    def test_raw_token_is_not_stored_and_copies_are_returned(self):
+        cache = VerifiedTokenCache()
+        cache.set("secret-token", {"uid": "u", "exp": time.time() + 60})
+        self.assertNotIn("secret-token", cache._entries)
+        cache.get("secret-token")["uid"] = "changed"
+        self.assertEqual(cache.get("secret-token")["uid"], "u")
+
+
+class TokenCacheAuthenticationTests(TestCase):
+    def setUp(self):
+        authentication.token_cache.clear()
+        authentication.user_cache.clear()
+        self.user = User.objects.create(uid="uid-1", email="user@example.com")
+        self.decoded = {"uid": "uid-1", "email": "user@example.com", "exp": time.time() + 3600}
+
+    def authenticate(self, token="token"):
+        request = APIRequestFactory().get("/", HTTP_AUTHORIZATION=f"Bearer {token}")
+        return FirebaseAuthentication().authenticate(request)
+
+    def test_repeat_token_is_verified_once(self):
+        with mock.patch.object(
+            FirebaseAuthentication, "verify_token", return_value=self.decoded
+        ) as verify:
+            for _ in range(3):
+                user, decoded = self.authenticate()
+        verify.assert_called_once_with("token")
+        self.assertEqual((user.pk, decoded["uid"]), (self.user.pk, "uid-1"))
+        self.assertEqual(authentication.token_cache.stats()["hits"], 2)
+
+    def test_failed_verification_is_not_cached(self):
+        failure = exceptions.AuthenticationFailed("Invalid Firebase ID token.")
+        with mock.patch.object(FirebaseAuthentication, "verify_token", side_effect=failure) as verify:
+            for _ in range(2):
+                with self.assertRaises(exceptions.AuthenticationFailed):
+                    self.authenticate()
+        self.assertEqual(verify.call_count, 2)
+
+
+class UserCacheTests(TestCase):
+    def setUp(self):
+        authentication.token_cache.clear()
+        authentication.user_cache.clear()
+        self.user = User.objects.create(uid="uid-1", email="user@example.com")
+        self.auth = FirebaseAuthentication()
+
+    def resolve(self, uid="uid-1", email="user@example.com"):
+        decoded = {"uid": uid, "email": email, "exp": time.time() + 3600}
+        with mock.patch.object(FirebaseAuthentication, "verify_token", return_value=decoded):
+            return self.auth.authenticate_credentials(f"{uid}:{email}")[0]
+
+    def test_cache_hit_needs_no_queries(self):
+        self.resolve()
+        with self.assertNumQueries(0):
+            user = self.resolve()
+        self.assertEqual(user.pk, self.user.pk)
+
+    def test_cached_users_are_private_copies(self):
+        self.resolve().role = User.Role.ADMIN
+        self.assertEqual(self.resolve().role, User.Role.USER)
+
+    def test_save_and_delete_invalidate(self):
+        self.resolve()
+        self.user.role = User.Role.ADMIN
+        self.user.save()
+        self.assertEqual(self.resolve().role, User.Role.ADMIN)
+
+        self.user.delete()
+        user = self.resolve()
+        self.assertNotEqual(user.pk, self.user.pk)
+        self.assertEqual(user.role, User.Role.USER)
+
+    def test_uid_change_drops_the_old_entry(self):
+        self.resolve()
+        self.user.uid = "uid-2"
+        self.user.save()
+        self.assertIsNone(authentication.user_cache.get("uid-1"))
+
+    def test_email_mismatch_resyncs_from_the_database(self):
+        self.resolve()
+        user = self.resolve(email="renamed@example.com")
+        self.assertEqual(user.email, "renamed@example.com")
+        self.user.refresh_from_db()
+        self.assertEqual(self.user.email, "renamed@example.com")
+
+    def test_entries_expire_after_the_ttl(self):
+        self.resolve()
+        later = time.time() + authentication.user_cache.ttl + 1
+        with mock.patch("core.authentication.time.time", return_value=later):
+            self.assertIsNone(authentication.user_cache.get("uid-1"))
+
+    def test_disabling_a_user_takes_effect_at_once(self):
+        self.resolve()
+        self.user.is_active = False
+        self.user.save(update_fields=["is_active"])
+        with self.assertRaisesMessage(exceptions.AuthenticationFailed, "disabled"):
+            self.resolve()
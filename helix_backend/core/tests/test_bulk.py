@@ -0,0 +1,143 @@
+"""Bulk status changes and assignment (core.services, admin bulk views)."""
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core import services
+from core.models import Request, RequestActivity, User
+
+Status = Request.Status
+
+
+class BulkTestCase(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create(uid="owner", email="owner@example.com")
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+        self.requests = [
+            services.create_request(user=self.owner, title=f"t{number}", description="d")
+            for number in range(4)
+        ]
+        self.ids = [request_obj.pk for request_obj in self.requests]
+        self.client.force_authenticate(self.admin)
+
+    def statuses(self):
+        return dict(Request.objects.filter(pk__in=self.ids).values_list("pk", "status"))
+
+
+class BulkStatusTests(BulkTestCase):
+    url = reverse("admin-request-bulk-status")
+
+    def test_valid_transitions_apply_and_the_rest_are_reported(self):
+        services.change_request_status(self.requests[1], Status.REJECTED, self.admin)
+        missing = max(self.ids) + 100
+        response = self.client.post(
+            self.url, {"ids": [*self.ids, missing, self.ids[0]], "status": Status.REVIEWING}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data["updated"], response.data["failed"]), (3, 2))
+        self.assertFalse(response.data["success"])
+        self.assertEqual([result["id"] for result in response.data["results"]], [*self.ids, missing])
+        self.assertEqual(
+            [result["success"] for result in response.data["results"]], [True, False, True, True, False]
+        )
+        self.assertEqual(response.data["results"][-1]["message"], "Request not found.")
+
+        statuses = self.statuses()
+        self.assertEqual(statuses.pop(self.ids[1]), Status.REJECTED)
+        self.assertEqual(set(statuses.values()), {Status.REVIEWING})
+        self.assertEqual(
+            RequestActivity.objects.filter(
+                action=RequestActivity.Action.STATUS_CHANGED,
+                detail="Status changed from PENDING to REVIEWING",
+            ).count(),
+            3,
+        )
+
+    def test_counters_follow_the_applied_changes(self):
+        services.change_request_status(self.requests[0], Status.REVIEWING, self.admin)
+        services.bulk_change_request_status(self.ids, Status.REJECTED, self.admin)
+        by_status = services.get_request_stats()["by_status"]
+        self.assertEqual(by_status[Status.REJECTED], 4)
+        self.assertEqual(by_status[Status.PENDING], 0)
+        self.assertEqual(by_status[Status.REVIEWING], 0)
+
+    def test_query_count_does_not_grow_with_the_batch(self):
+        services.bulk_change_request_status(self.ids[:1], Status.REVIEWING, self.admin)
+        counts = []
+        for ids in (self.ids[1:2], self.ids[2:]):
+            with CaptureQueriesContext(connection) as queries:
+                services.bulk_change_request_status(ids, Status.REVIEWING, self.admin)
+            counts.append(len(queries))
+        self.assertEqual(counts[0], counts[1])
+
+    def test_payload_and_permissions_are_validated(self):
+        self.assertEqual(
+            self.client.post(self.url, {"ids": [], "status": Status.REVIEWING}, format="json").status_code,
+            400,
+        )
+        self.assertEqual(
+            self.client.post(self.url, {"ids": self.ids, "status": "DONE"}, format="json").status_code,
+            400,
+        )
+        self.client.force_authenticate(self.owner)
+        self.assertEqual(
+            self.client.post(self.url, {"ids": self.ids, "status": Status.CANCELLED}, format="json").status_code,
+            403,
+        )
+
+
+class BulkAssignTests(BulkTestCase):
+    url = reverse("admin-request-bulk-assign")
+
+    def test_terminal_and_missing_requests_are_rejected(self):
+        services.change_request_status(self.requests[1], Status.REJECTED, self.admin)
+        missing = max(self.ids) + 100
+        response = self.client.post(
+            self.url, {"ids": [*self.ids, missing], "assigned_to": self.admin.pk}, format="json"
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual((response.data["updated"], response.data["failed"]), (3, 2))
+        self.assertEqual(
+            [result["message"] for result in response.data["results"][1::3]],
+            ["Cannot assign a request in terminal state (REJECTED).", "Request not found."],
+        )
+        assigned = dict(Request.objects.filter(pk__in=self.ids).values_list("pk", "assigned_to"))
+        self.assertIsNone(assigned.pop(self.ids[1]))
+        self.assertEqual(set(assigned.values()), {self.admin.pk})
+        self.assertEqual(
+            RequestActivity.objects.filter(action=RequestActivity.Action.ASSIGNED).count(), 3
+        )
+        self.assertEqual(services.get_request_stats()["by_assignee"], {str(self.admin.pk): 3})
+
+    def test_null_unassigns(self):
+        services.bulk_assign_requests(self.ids, self.admin, self.admin)
+        response = self.client.post(self.url, {"ids": self.ids, "assigned_to": None}, format="json")
+        self.assertEqual((response.data["updated"], response.data["failed"]), (4, 0))
+        self.assertFalse(Request.objects.filter(assigned_to__isnull=False).exists())
+        self.assertEqual(
+            RequestActivity.objects.filter(
+                action=RequestActivity.Action.UNASSIGNED, detail="Unassigned from admin@example.com"
+            ).count(),
+            4,
+        )
+        stats = services.get_request_stats()
+        self.assertEqual((stats["by_assignee"], stats["unassigned"]), ({}, 4))
+
+    def test_assignee_must_be_an_admin(self):
+        response = self.client.post(
+            self.url, {"ids": self.ids, "assigned_to": self.owner.pk}, format="json"
+        )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(Request.objects.filter(assigned_to__isnull=False).exists())
+        with self.assertRaises(ValidationError):
+            services.bulk_assign_requests(self.ids, self.owner, self.admin)
+
+    def test_non_admins_are_forbidden(self):
+        self.client.force_authenticate(self.owner)
+        response = self.client.post(
+            self.url, {"ids": self.ids, "assigned_to": self.admin.pk}, format="json"
+        )
+        self.assertEqual(response.status_code, 403)
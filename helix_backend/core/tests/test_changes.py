@@ -0,0 +1,167 @@
+"""Change feed cursors (core.changes), the change feed endpoints and ChangeSequence."""
+
+import base64
+import json
+from datetime import timedelta
+from unittest import mock
+
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from core import activity_log, services
+from core.changes import ChangeFeed
+from core.models import ChangeSequence, Request, RequestActivity, RequestTombstone, User
+
+
+def encode(payload):
+    return base64.urlsafe_b64encode(json.dumps(payload).encode()).decode()
+
+
+class ChangeFeedTests(APITestCase):
+    def setUp(self):
+        self.user = User.objects.create(uid="user", email="user@example.com")
+        self.other = User.objects.create(uid="other", email="other@example.com")
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+        self.request_obj = services.create_request(user=self.user, title="mine", description="d")
+        self.other_request = services.create_request(user=self.other, title="theirs", description="d")
+        self.client.force_authenticate(self.user)
+
+    def read(self, since=None, **params):
+        if since:
+            params["since"] = since
+        response = self.client.get(reverse("user-request-changes"), params)
+        self.assertEqual(response.status_code, 200, response.data)
+        return response.data
+
+    def test_full_sync_then_nothing(self):
+        changes = self.read()
+        self.assertEqual([row["id"] for row in changes["requests"]], [self.request_obj.pk])
+        self.assertEqual(len(changes["activities"]), 1)
+        self.assertFalse(changes["has_more"])
+
+        again = self.read(changes["cursor"])
+        self.assertEqual((again["requests"], again["activities"], again["deleted"]), ([], [], []))
+
+    def test_updates_and_deletions_after_the_cursor(self):
+        cursor = self.read()["cursor"]
+        services.change_request_status(self.request_obj, Request.Status.CANCELLED, self.user)
+        services.change_request_status(self.other_request, Request.Status.CANCELLED, self.other)
+
+        changes = self.read(cursor)
+        self.assertEqual([row["id"] for row in changes["requests"]], [self.request_obj.pk])
+        self.assertEqual(changes["requests"][0]["status"], Request.Status.CANCELLED)
+        self.assertEqual(len(changes["activities"]), 1)
+
+        services.delete_request(self.request_obj, self.admin)
+        services.delete_request(self.other_request, self.admin)
+        changes = self.read(changes["cursor"])
+        self.assertEqual([row["id"] for row in changes["deleted"]], [self.request_obj.pk])
+
+    def test_limit_pages_through_every_change_once(self):
+        for number in range(4):
+            services.create_request(user=self.user, title=f"more {number}", description="d")
+        seen, cursor, has_more = [], None, True
+        while has_more:
+            changes = self.read(cursor, limit=2)
+            seen.extend(row["id"] for row in changes["requests"])
+            cursor, has_more = changes["cursor"], changes["has_more"]
+        expected = Request.objects.filter(user=self.user).order_by("change_seq")
+        self.assertEqual(seen, list(expected.values_list("id", flat=True)))
+
+    def test_activities_written_after_the_read_are_not_skipped(self):
+        cursor = self.read()["cursor"]
+        with override_settings(ACTIVITY_LOG_MODE="buffered"):
+            with self.captureOnCommitCallbacks(execute=True):
+                services.change_request_status(self.request_obj, Request.Status.REVIEWING, self.admin)
+            changes = self.read(cursor)
+            self.assertEqual(changes["activities"], [])
+            activity_log.flush()
+        changes = self.read(changes["cursor"])
+        self.assertEqual(
+            [row["action"] for row in changes["activities"]], [RequestActivity.Action.STATUS_CHANGED]
+        )
+
+    def test_cursor_at_current_skips_existing_rows(self):
+        feed = ChangeFeed(
+            Request.objects.all(),
+            RequestActivity.objects.all(),
+            RequestTombstone.objects.all(),
+            limit=10,
+            retention_days=30,
+        )
+        cursor = feed.cursor_at_current()
+        self.assertEqual(feed.read(cursor)["requests"], [])
+        services.change_request_status(self.request_obj, Request.Status.REVIEWING, self.admin)
+        self.assertEqual([row["id"] for row in feed.read(cursor)["requests"]], [self.request_obj.pk])
+
+    def test_malformed_cursor_and_limit_are_rejected(self):
+        url = reverse("user-request-changes")
+        self.assertEqual(self.client.get(url, {"since": "not-a-cursor"}).status_code, 400)
+        self.assertEqual(self.client.get(url, {"limit": 0}).status_code, 400)
+
+    def test_expired_and_timestamp_cursors_are_gone(self):
+        url = reverse("user-request-changes")
+        issued = (timezone.now() - timedelta(days=31)).isoformat()
+        expired = encode({"requests": [1, 1], "at": issued})
+        self.assertEqual(self.client.get(url, {"since": expired}).status_code, 410)
+
+        legacy = encode({"requests": ["2026-01-01T00:00:00+00:00", 1], "at": timezone.now().isoformat()})
+        self.assertEqual(self.client.get(url, {"since": legacy}).status_code, 410)
+
+
+class ChangeSequenceTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(uid="user", email="user@example.com")
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+
+    def test_sequence_is_taken_after_the_writes(self):
+        statements = []
+        allocate = ChangeSequence.allocate
+
+        def record_allocate():
+            statements.append("allocate")
+            return allocate()
+
+        with mock.patch.object(ChangeSequence, "allocate", side_effect=record_allocate):
+            with mock.patch.object(
+                services,
+                "_apply_counter_deltas",
+                side_effect=lambda deltas: statements.append("counters"),
+            ):
+                request_obj = services.create_request(user=self.user, title="t", description="d")
+        self.assertEqual(statements, ["counters", "allocate"])
+
+        seq = ChangeSequence.current()
+        self.assertEqual(request_obj.change_seq, seq)
+        self.assertEqual(Request.objects.get(pk=request_obj.pk).change_seq, seq)
+        self.assertEqual(RequestActivity.objects.get(request=request_obj).change_seq, seq)
+
+    def test_one_value_per_transaction(self):
+        requests = [
+            services.create_request(user=self.user, title=f"t{number}", description="d")
+            for number in range(3)
+        ]
+        before = ChangeSequence.current()
+        services.bulk_change_request_status(
+            [request_obj.pk for request_obj in requests], Request.Status.REVIEWING, self.admin
+        )
+        self.assertEqual(ChangeSequence.current(), before + 1)
+        self.assertEqual(
+            set(Request.objects.values_list("change_seq", flat=True)), {before + 1}
+        )
+
+    def test_rolled_back_batch_takes_no_value(self):
+        before = ChangeSequence.current()
+        with self.assertRaises(ValueError), ChangeSequence.batch():
+            services.create_request(user=self.user, title="t", description="d")
+            raise ValueError
+        self.assertEqual(ChangeSequence.current(), before)
+        self.assertFalse(Request.objects.exists())
+
+    def test_user_writes_move_the_sequence(self):
+        before = ChangeSequence.current()
+        self.user.email = "renamed@example.com"
+        self.user.save()
+        self.assertEqual(ChangeSequence.current(), before + 1)
@@ -0,0 +1,270 @@
+"""
+Concurrent status changes on one request (core.services).
+
+StatusChangeServiceTests check the conditional UPDATE with stale
+instances; LostRaceTests commit a competing change from another thread
+between a change's validation and its UPDATE, to drive the loser
+through _apply_change's re-validation; ConcurrentStatusChangeTests run
+real threads:
+
+Each round creates a request and starts THREADS threads behind a
+barrier. Every thread repeatedly reads the request, picks one of the
+transitions allowed from the status it read, and calls
+services.change_request_status() (half of the threads keep using the
+instance they read first, as a view holding a stale object would),
+until the request reaches a terminal status. The round then checks that:
+
+    - the STATUS_CHANGED activities form one legal chain from PENDING
+      (no transition applied twice, none from a status already left)
+    - there is exactly one activity per successful call
+    - the request's final status is where the chain ends
+    - the status counters moved by exactly PENDING → final status
+"""
+
+import random
+import threading
+from collections import Counter
+from contextlib import contextmanager
+from unittest import mock
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from core import services
+from core.models import Request, RequestActivity, RequestCounter, User
+from core.workflow import workflow
+
+THREADS = 8
+ROUNDS = 5
+
+
+class StatusChangeServiceTests(TestCase):
+    def setUp(self):
+        self.owner = User.objects.create(uid="owner", email="owner@example.com")
+        self.other = User.objects.create(uid="other", email="other@example.com")
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+        self.request_obj = services.create_request(user=self.owner, title="t", description="d")
+
+    def status_activities(self):
+        return RequestActivity.objects.filter(
+            request=self.request_obj, action=RequestActivity.Action.STATUS_CHANGED
+        )
+
+    def test_illegal_transition_is_rejected_without_writing(self):
+        with self.assertRaises(ValidationError):
+            services.change_request_status(self.request_obj, Request.Status.COMPLETED, self.admin)
+        self.request_obj.refresh_from_db()
+        self.assertEqual(self.request_obj.status, Request.Status.PENDING)
+        self.assertFalse(self.status_activities().exists())
+
+    def test_only_the_owner_or_an_admin_may_change_the_status(self):
+        with self.assertRaises(ValidationError):
+            services.change_request_status(self.request_obj, Request.Status.CANCELLED, self.other)
+
+    def test_stale_instance_is_validated_against_the_stored_status(self):
+        stale = Request.objects.get(pk=self.request_obj.pk)
+        services.change_request_status(self.request_obj, Request.Status.REJECTED, self.admin)
+        # PENDING → REVIEWING is legal from what `stale` read, not from REJECTED
+        with self.assertRaises(ValidationError):
+            services.change_request_status(stale, Request.Status.REVIEWING, self.admin)
+        self.request_obj.refresh_from_db()
+        self.assertEqual(self.request_obj.status, Request.Status.REJECTED)
+        self.assertEqual(self.status_activities().count(), 1)
+
+
+    def test_gives_up_after_max_change_attempts(self):
+        statuses = iter([Request.Status.REVIEWING, Request.Status.PENDING] * 10)
+        validate = workflow.validate
+
+        def changed_under_us(old_status, new_status, role):
+            validate(old_status, new_status, role)
+            # Lose every race: the stored status moves before the UPDATE
+            Request.objects.filter(pk=self.request_obj.pk).update(status=next(statuses))
+
+        with mock.patch.object(workflow, "validate", side_effect=changed_under_us) as hook:
+            with self.assertRaisesMessage(ValidationError, "modified concurrently"):
+                services.change_request_status(
+                    self.request_obj, Request.Status.CANCELLED, self.admin
+                )
+        self.assertEqual(hook.call_count, services.MAX_CHANGE_ATTEMPTS)
+        self.assertFalse(self.status_activities().exists())
+
+
+@override_settings(ACTIVITY_LOG_MODE="sync")
+class LostRaceTests(TransactionTestCase):
+    def setUp(self):
+        self.owner = User.objects.create(uid="owner", email="owner@example.com")
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+        self.request_obj = services.create_request(user=self.owner, title="t", description="d")
+
+    @contextmanager
+    def race(self, *winning_statuses):
+        """
+        Patch workflow.validate so that, the first time it passes, another
+        thread commits `winning_statuses` as admin before the caller's
+        conditional UPDATE runs. Yields the caller's validations.
+        """
+        validate = workflow.validate
+        caller = threading.get_ident()
+        raced = []
+        attempts = []
+
+        def winner():
+            try:
+                obj = Request.objects.get(pk=self.request_obj.pk)
+                for new_status in winning_statuses:
+                    services.change_request_status(obj, new_status, self.admin)
+            finally:
+                connection.close()
+
+        def validate_then_lose(old_status, new_status, role):
+            if threading.get_ident() == caller:
+                attempts.append(old_status)
+            validate(old_status, new_status, role)
+            if not raced:
+                raced.append(True)
+                thread = threading.Thread(target=winner)
+                thread.start()
+                thread.join()
+
+        with mock.patch.object(workflow, "validate", side_effect=validate_then_lose):
+            yield attempts
+
+    def details(self):
+        return list(
+            RequestActivity.objects.filter(
+                request=self.request_obj, action=RequestActivity.Action.STATUS_CHANGED
+            )
+            .order_by("id")
+            .values_list("detail", flat=True)
+        )
+
+    def test_loser_is_revalidated_and_applied(self):
+        with self.race(Request.Status.REVIEWING) as attempts:
+            services.change_request_status(self.request_obj, Request.Status.CANCELLED, self.owner)
+        self.assertEqual(attempts, [Request.Status.PENDING, Request.Status.REVIEWING])
+        self.request_obj.refresh_from_db()
+        self.assertEqual(self.request_obj.status, Request.Status.CANCELLED)
+        self.assertEqual(
+            self.details(),
+            [
+                "Status changed from PENDING to REVIEWING",
+                "Status changed from REVIEWING to CANCELLED",
+            ],
+        )
+        self.assertEqual(
+            self.request_obj.change_seq,
+            RequestActivity.objects.order_by("-id").values_list("change_seq", flat=True)[0],
+        )
+
+    def test_loser_is_rejected_when_the_winner_made_it_illegal(self):
+        with self.race(Request.Status.REVIEWING, Request.Status.IN_PROGRESS) as attempts:
+            with self.assertRaisesMessage(ValidationError, "Your role cannot"):
+                services.change_request_status(
+                    self.request_obj, Request.Status.CANCELLED, self.owner
+                )
+        self.assertEqual(attempts, [Request.Status.PENDING, Request.Status.IN_PROGRESS])
+        self.request_obj.refresh_from_db()
+        self.assertEqual(self.request_obj.status, Request.Status.IN_PROGRESS)
+        self.assertEqual(len(self.details()), 2)
+        self.assertEqual(
+            RequestCounter.objects.get(
+                dimension=RequestCounter.Dimension.STATUS, value=Request.Status.IN_PROGRESS
+            ).count,
+            1,
+        )
+
+
+@override_settings(ACTIVITY_LOG_MODE="sync")
+class ConcurrentStatusChangeTests(TransactionTestCase):
+    def setUp(self):
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+
+    def test_workflow_stays_legal_under_concurrent_changes(self):
+        random.seed(21)
+        for number in range(ROUNDS):
+            with self.subTest(round=number):
+                request_obj = services.create_request(
+                    user=self.admin, title=f"Stress test {number}", description="d"
+                )
+                before = self.status_counters()
+                outcome = self.run_round(request_obj)
+                self.assertEqual(outcome["errors"], 0)
+                self.assertGreater(outcome["applied"], 0)
+                self.assertConsistent(request_obj, outcome, before)
+
+    def run_round(self, request_obj):
+        barrier = threading.Barrier(THREADS)
+        outcome = Counter()
+        lock = threading.Lock()
+
+        def worker(stale):
+            counts = Counter()
+            try:
+                barrier.wait()
+                obj = Request.objects.get(pk=request_obj.pk)
+                while True:
+                    if not stale:
+                        obj = Request.objects.get(pk=request_obj.pk)
+                    allowed = workflow.next_statuses(User.Role.ADMIN)[obj.status]
+                    if not allowed:
+                        break
+                    try:
+                        services.change_request_status(obj, random.choice(allowed), self.admin)
+                        counts["applied"] += 1
+                    except ValidationError:
+                        counts["rejected"] += 1
+                        # Let the next read see what the winner did
+                        obj.refresh_from_db(fields=["status"])
+            except Exception:
+                counts["errors"] += 1
+                raise
+            finally:
+                connection.close()
+                with lock:
+                    outcome.update(counts)
+
+        threads = [threading.Thread(target=worker, args=(i % 2 == 1,)) for i in range(THREADS)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return outcome
+
+    def assertConsistent(self, request_obj, outcome, before):
+        request_obj.refresh_from_db()
+        details = list(
+            RequestActivity.objects.filter(
+                request=request_obj, action=RequestActivity.Action.STATUS_CHANGED
+            )
+            .order_by("timestamp", "id")
+            .values_list("detail", flat=True)
+        )
+
+        status = Request.Status.PENDING
+        for detail in details:
+            old_status, new_status = detail.removeprefix("Status changed from ").split(" to ")
+            self.assertEqual(old_status, status, f"activity '{detail}' but the status was {status}")
+            self.assertIn(new_status, workflow.transitions[old_status], f"illegal: '{detail}'")
+            status = new_status
+
+        self.assertEqual(len(details), outcome["applied"])
+        self.assertEqual(request_obj.status, status)
+        self.assertTrue(workflow.is_terminal(status))
+
+        moved = self.status_counters()
+        moved.subtract(before)
+        expected = Counter()
+        if request_obj.status != Request.Status.PENDING:
+            expected.update({Request.Status.PENDING: -1, request_obj.status: 1})
+        self.assertEqual({k: v for k, v in moved.items() if v}, dict(expected))
+
+    def status_counters(self):
+        return Counter(
+            dict(
+                RequestCounter.objects.filter(
+                    dimension=RequestCounter.Dimension.STATUS
+                ).values_list("value", "count")
+            )
+        )
@@ -0,0 +1,77 @@
+"""RequestCounter maintenance (core.services, core.signals)."""
+
+from django.test import TestCase
+
+from core import services
+from core.models import Request, RequestCounter, User
+
+
+class RequestCounterTests(TestCase):
+    def setUp(self):
+        self.user = User.objects.create(uid="user", email="user@example.com")
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+
+    def assertCountersMatch(self):
+        stored = {
+            (counter.dimension, counter.value): counter.count
+            for counter in RequestCounter.objects.exclude(count=0)
+        }
+        expected = {key: count for key, count in services.count_requests().items() if count}
+        self.assertEqual(stored, expected)
+
+    def test_service_writes(self):
+        request_obj = services.create_request(user=self.user, title="t", description="d")
+        services.assign_request(request_obj, self.admin, self.admin)
+        services.change_request_status(request_obj, Request.Status.REVIEWING, self.admin)
+        services.change_request_priority(request_obj, Request.Priority.HIGH, self.admin)
+        self.assertCountersMatch()
+        self.assertEqual(
+            RequestCounter.objects.get(dimension=RequestCounter.Dimension.TOTAL, value="").count, 1
+        )
+
+    def test_bulk_writes(self):
+        ids = [
+            services.create_request(user=self.user, title=f"t{n}", description="d").pk
+            for n in range(3)
+        ]
+        services.bulk_assign_requests(ids, self.admin, self.admin)
+        services.bulk_change_request_status(ids, Request.Status.REVIEWING, self.admin)
+        self.assertCountersMatch()
+
+    def test_delete_with_a_stale_instance(self):
+        request_obj = services.create_request(user=self.user, title="t", description="d")
+        stale = Request.objects.get(pk=request_obj.pk)
+        services.change_request_status(request_obj, Request.Status.REVIEWING, self.admin)
+        services.delete_request(stale, self.admin)
+        self.assertCountersMatch()
+
+    def test_deleting_twice_counts_once(self):
+        first = services.create_request(user=self.user, title="t", description="d")
+        services.create_request(user=self.user, title="t2", description="d")
+        services.delete_request(first, self.admin)
+        services.delete_request(first, self.admin)
+        self.assertCountersMatch()
+
+    def test_deleting_an_assignee_unassigns_their_requests(self):
+        request_obj = services.create_request(user=self.user, title="t", description="d")
+        services.assign_request(request_obj, self.admin, self.admin)
+        services.create_request(user=self.admin, title="own", description="d")
+        self.admin.delete()
+        self.assertCountersMatch()
+
+    def test_deleting_an_owner_cascades(self):
+        services.create_request(user=self.user, title="t", description="d")
+        self.user.delete()
+        self.assertCountersMatch()
+        self.assertEqual(Request.objects.count(), 0)
+
+    def test_admin_style_save_and_delete(self):
+        request_obj = Request(user=self.user, title="t", description="d")
+        services.save_request(request_obj)
+        request_obj.status = Request.Status.REVIEWING
+        request_obj.priority = Request.Priority.HIGH
+        request_obj.assigned_to = self.admin
+        services.save_request(request_obj)
+        self.assertCountersMatch()
+        request_obj.delete()
+        self.assertCountersMatch()
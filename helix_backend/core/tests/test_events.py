@@ -0,0 +1,137 @@
+"""Live request events (core.events) and the SSE stream (core.views.event_stream)."""
+
+import asyncio
+from unittest import mock
+
+from django.test import AsyncClient, SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+
+from core import events, services
+from core.events import EventBus
+from core.models import Request, User
+from core.views import _sse_messages
+
+
+class EventBusTests(SimpleTestCase):
+    def test_replay_returns_what_was_missed(self):
+        bus = EventBus(replay_size=3)
+        first, second, third = (bus.publish("request.created", {"id": n}) for n in range(3))
+        self.assertEqual(bus.replay(first.id), [second, third])
+        self.assertEqual(bus.replay(third.id), [])
+
+    def test_unreplayable_ids_need_a_resync(self):
+        bus = EventBus(replay_size=2)
+        first = bus.publish("request.created", {"id": 1})
+        for n in range(3):
+            bus.publish("request.created", {"id": n})
+        self.assertIsNone(bus.replay(first.id))
+        self.assertIsNone(bus.replay("otherprocess-1"))
+        self.assertIsNone(bus.replay("garbage"))
+
+    def test_slow_subscriber_overflows(self):
+        bus = EventBus(queue_size=1)
+
+        async def run():
+            subscription = bus.subscribe()
+            bus.publish("request.created", {"id": 1})
+            bus.publish("request.created", {"id": 2})
+            event = await subscription.get(1)
+            bus.unsubscribe(subscription)
+            return event, subscription.overflowed
+
+        event, overflowed = asyncio.run(run())
+        self.assertEqual(event.data, {"id": 1})
+        self.assertTrue(overflowed)
+        stats = bus.stats()
+        self.assertEqual(
+            (stats["subscribers"], stats["published"], stats["overflows"]), (0, 2, 1)
+        )
+
+
+class PublishOnCommitTests(TestCase):
+    def setUp(self):
+        self.bus = EventBus()
+        patcher = mock.patch.object(events, "bus", self.bus)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.owner = User.objects.create(uid="owner", email="owner@example.com")
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+
+    def test_service_writes_publish_after_commit(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            request_obj = services.create_request(user=self.owner, title="t", description="d")
+        with self.captureOnCommitCallbacks() as callbacks:
+            services.change_request_status(request_obj, Request.Status.REVIEWING, self.admin)
+            self.assertEqual(self.bus.published, 1)
+        for callback in callbacks:
+            callback()
+        created, changed = self.bus.replay(f"{self.bus.token}-0")
+        self.assertEqual((created.type, created.data["owner"]), ("request.created", self.owner.pk))
+        self.assertEqual(
+            (changed.type, changed.data),
+            (
+                "request.status_changed",
+                {"id": request_obj.pk, "owner": self.owner.pk, "from": "PENDING", "to": "REVIEWING"},
+            ),
+        )
+
+    @override_settings(EVENT_STREAM_BACKEND="poll")
+    def test_poll_mode_does_not_publish(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            services.create_request(user=self.owner, title="t", description="d")
+        self.assertEqual(self.bus.published, 0)
+
+
+@override_settings(EVENT_STREAM_BACKEND="memory", EVENT_STREAM_HEARTBEAT_SECONDS=0.05)
+class EventStreamTests(SimpleTestCase):
+    def setUp(self):
+        self.bus = EventBus(replay_size=10)
+        patcher = mock.patch.object(events, "bus", self.bus)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.owner = User(pk=1, uid="owner", email="owner@example.com")
+        self.admin = User(pk=2, uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+
+    def read(self, user, last_event_id=None, publish=(), count=1):
+        """The first `count` messages after the retry line, publishing `publish` once subscribed."""
+
+        async def run():
+            messages = _sse_messages(user, last_event_id)
+            try:
+                self.assertEqual(await anext(messages), "retry: 3000\n\n")
+                for event_type, data in publish:
+                    self.bus.publish(event_type, data)
+                return [await anext(messages) for _ in range(count)]
+            finally:
+                await messages.aclose()
+
+        return asyncio.run(run())
+
+    def test_users_only_see_their_own_requests(self):
+        publish = [
+            ("request.deleted", {"id": 7, "owner": self.admin.pk}),
+            ("request.deleted", {"id": 8, "owner": self.owner.pk}),
+        ]
+        owner_messages = self.read(self.owner, publish=publish)
+        self.assertIn('"id":8', owner_messages[0])
+        self.assertIn("event: request.deleted", owner_messages[0])
+        admin_messages = self.read(self.admin, publish=publish, count=2)
+        self.assertIn('"id":7', admin_messages[0])
+        self.assertEqual(self.bus.subscriber_count, 0)
+
+    def test_reconnect_replays_missed_events_once(self):
+        seen = self.bus.publish("request.deleted", {"id": 1, "owner": 1})
+        missed = self.bus.publish("request.deleted", {"id": 2, "owner": 1})
+        messages = self.read(self.owner, last_event_id=seen.id, count=2)
+        self.assertTrue(messages[0].startswith(f"id: {missed.id}\n"))
+        self.assertEqual(messages[1], ": keepalive\n\n")
+
+    def test_unknown_last_event_id_gets_a_resync(self):
+        self.assertEqual(
+            self.read(self.owner, last_event_id="otherprocess-5"), ["event: resync\ndata: {}\n\n"]
+        )
+
+    def test_requires_asgi_and_a_token(self):
+        url = reverse("event-stream")
+        self.assertEqual(self.client.get(url).status_code, 501)
+        self.assertEqual(asyncio.run(AsyncClient().get(url)).status_code, 401)
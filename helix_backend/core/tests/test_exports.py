@@ -0,0 +1,74 @@
+"""Streaming exports (core.exports) and the export endpoints."""
+
+import csv
+import io
+import json
+
+from asgiref.sync import sync_to_async
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core import services
+from core.exports import REQUEST_COLUMNS, astream_export, escape_formula, stream_export
+from core.models import Request, User
+
+
+class ExportTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(uid="user", email="user@example.com")
+        services.create_request(
+            user=user, title='=HYPERLINK("http://example.com","x")', description="-1+2"
+        )
+        for number in range(4):
+            services.create_request(user=user, title=f"Request {number}", description="plain")
+
+    def test_formula_cells_are_quoted(self):
+        for value in ("=1+1", "+1", "-1", "@SUM(A1)", "\tx", "\rx"):
+            self.assertEqual(escape_formula(value), "'" + value)
+        for value in ("plain", "", 5, None, "a=b"):
+            self.assertEqual(escape_formula(value), value)
+
+    def test_csv_header_then_one_chunk_per_fetch(self):
+        queryset = Request.objects.order_by("id")
+        chunks = list(stream_export(queryset, REQUEST_COLUMNS, "csv", chunk_size=2))
+        self.assertEqual(len(chunks), 1 + 3)
+        rows = list(csv.reader(io.StringIO("".join(chunks))))
+        self.assertEqual(rows[0], [column.name for column in REQUEST_COLUMNS])
+        self.assertEqual(len(rows), 6)
+        self.assertEqual(rows[1][1], '\'=HYPERLINK("http://example.com","x")')
+        self.assertEqual(rows[1][2], "'-1+2")
+
+    def test_jsonl_is_not_escaped(self):
+        text = "".join(stream_export(Request.objects.order_by("id"), REQUEST_COLUMNS, "jsonl"))
+        first = json.loads(text.splitlines()[0])
+        self.assertEqual(first["title"], '=HYPERLINK("http://example.com","x")')
+        self.assertEqual(first["user_email"], "user@example.com")
+
+    async def test_async_stream_matches_the_sync_one(self):
+        queryset = Request.objects.order_by("id")
+        stream = astream_export(queryset, REQUEST_COLUMNS, "csv", chunk_size=2)
+        chunks = [chunk async for chunk in stream]
+        expected = await sync_to_async(list)(
+            stream_export(queryset, REQUEST_COLUMNS, "csv", chunk_size=2)
+        )
+        self.assertEqual(chunks, expected)
+
+
+class ExportEndpointTests(APITestCase):
+    def setUp(self):
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+        services.create_request(user=self.admin, title="=cmd", description="d")
+        self.client.force_authenticate(self.admin)
+
+    def test_streams_an_attachment(self):
+        response = self.client.get(reverse("admin-request-export"), {"output": "csv"})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.streaming)
+        self.assertIn("attachment;", response["Content-Disposition"])
+        self.assertIn("'=cmd", b"".join(response.streaming_content).decode())
+
+    def test_unknown_format_is_rejected(self):
+        response = self.client.get(reverse("admin-request-export"), {"output": "xlsx"})
+        self.assertEqual(response.status_code, 400)
@@ -0,0 +1,126 @@
+"""Local identity provider (core.identity) and the mint_token command."""
+
+import tempfile
+import time
+from io import StringIO
+from pathlib import Path
+
+import jwt
+from cryptography.hazmat.primitives import serialization
+from django.core.exceptions import ImproperlyConfigured
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.urls import reverse
+from rest_framework import exceptions
+from rest_framework.test import APITestCase
+
+from core import authentication
+from core.identity import LocalIdentityProvider, generate_rsa_private_key_pem
+from core.models import User
+
+LOCAL = {
+    "DEBUG": True,
+    "IDENTITY_BACKEND": "local",
+    "IDENTITY_LOCAL_ALGORITHM": "HS256",
+    "IDENTITY_LOCAL_SECRET": "test-secret",
+    "IDENTITY_LOCAL_PRIVATE_KEY_FILE": "",
+    "IDENTITY_LOCAL_PUBLIC_KEY_FILE": "",
+}
+
+
+class LocalIdentityProviderTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.private_pem = generate_rsa_private_key_pem()
+
+    def test_hs256_round_trip(self):
+        provider = LocalIdentityProvider(secret="s")
+        decoded = provider.verify(provider.mint_token("uid-1", email="a@example.com", role="x"))
+        self.assertEqual(
+            (decoded["uid"], decoded["email"], decoded["role"]), ("uid-1", "a@example.com", "x")
+        )
+
+    def test_rs256_round_trip_and_verify_only_provider(self):
+        provider = LocalIdentityProvider(algorithm="RS256", private_key_pem=self.private_pem)
+        token = provider.mint_token("uid-1")
+        self.assertEqual(jwt.get_unverified_header(token)["alg"], "RS256")
+        self.assertEqual(provider.verify(token)["uid"], "uid-1")
+
+        public_pem = provider._verifying_key.public_bytes(
+            serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+        )
+        verifier = LocalIdentityProvider(algorithm="RS256", public_key_pem=public_pem)
+        self.assertEqual(verifier.verify(token)["uid"], "uid-1")
+        with self.assertRaises(ValueError):
+            verifier.mint_token("uid-2")
+
+    def test_rejects_foreign_expired_and_tampered_tokens(self):
+        provider = LocalIdentityProvider(secret="s")
+        cases = {
+            "other key": LocalIdentityProvider(secret="other").mint_token("uid-1"),
+            "other audience": LocalIdentityProvider(secret="s", audience="x").mint_token("uid-1"),
+            "expired": provider.mint_token("uid-1", exp=int(time.time()) - 10),
+            "tampered": provider.mint_token("uid-1")[:-2] + "xx",
+        }
+        for name, token in cases.items():
+            with self.subTest(name), self.assertRaises(exceptions.AuthenticationFailed):
+                provider.verify(token)
+
+
+class FromSettingsTests(SimpleTestCase):
+    def test_refused_when_debug_is_off(self):
+        with override_settings(**{**LOCAL, "DEBUG": False}):
+            with self.assertRaisesMessage(ImproperlyConfigured, "DEBUG=False"):
+                LocalIdentityProvider.from_settings()
+
+    def test_missing_keys_are_improperly_configured(self):
+        for overrides in (
+            {"IDENTITY_LOCAL_SECRET": ""},
+            {"IDENTITY_LOCAL_ALGORITHM": "RS256"},
+            {"IDENTITY_LOCAL_ALGORITHM": "ES256"},
+        ):
+            with self.subTest(overrides), override_settings(**{**LOCAL, **overrides}):
+                with self.assertRaises(ImproperlyConfigured):
+                    LocalIdentityProvider.from_settings()
+
+    def test_rs256_key_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = Path(directory) / "identity.pem"
+            path.write_bytes(generate_rsa_private_key_pem())
+            overrides = {
+                "IDENTITY_LOCAL_ALGORITHM": "RS256",
+                "IDENTITY_LOCAL_PRIVATE_KEY_FILE": str(path),
+            }
+            with override_settings(**{**LOCAL, **overrides}):
+                provider = LocalIdentityProvider.from_settings()
+        self.assertEqual(provider.verify(provider.mint_token("uid-1"))["uid"], "uid-1")
+
+
+@override_settings(**LOCAL)
+class LocalBackendAuthenticationTests(APITestCase):
+    def setUp(self):
+        authentication._verifier = None
+        authentication.token_cache.clear()
+        authentication.user_cache.clear()
+        self.addCleanup(setattr, authentication, "_verifier", None)
+
+    def test_minted_token_signs_in(self):
+        out = StringIO()
+        call_command(
+            "mint_token", "--email", "admin@example.com", "--role", "ADMIN", "--create-user",
+            stdout=out,
+        )
+        token = out.getvalue().strip()
+        response = self.client.get(reverse("auth-me"), HTTP_AUTHORIZATION=f"Bearer {token}")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["email"], "admin@example.com")
+        self.assertEqual(User.objects.get(email="admin@example.com").role, User.Role.ADMIN)
+
+
+class MintTokenCommandTests(TestCase):
+    def test_unconfigured_provider_is_a_command_error(self):
+        with override_settings(**{**LOCAL, "IDENTITY_LOCAL_ALGORITHM": "RS256"}):
+            with self.assertRaisesMessage(CommandError, "IDENTITY_LOCAL_PRIVATE_KEY_FILE"):
+                call_command("mint_token", "--email", "a@example.com", stdout=StringIO())
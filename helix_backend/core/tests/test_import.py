@@ -0,0 +1,119 @@
+"""JSON-lines request import (core.services, AdminRequestImportView, import_requests)."""
+
+import json
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.test import TestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core import services
+from core.models import Request, RequestActivity, User
+
+
+def json_lines(*rows):
+    return "\n".join(row if isinstance(row, str) else json.dumps(row) for row in rows) + "\n"
+
+
+def row(email="owner@example.com", title="Imported", **extra):
+    return {"user_email": email, "title": title, "description": "Imported description", **extra}
+
+
+class ImportViewTests(APITestCase):
+    url = reverse("admin-request-import")
+
+    def setUp(self):
+        self.owner = User.objects.create(uid="owner", email="owner@example.com")
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+        self.client.force_authenticate(self.admin)
+
+    def post(self, body, query=""):
+        return self.client.post(f"{self.url}{query}", data=body, content_type="application/x-ndjson")
+
+    def test_valid_lines_are_created_and_the_rest_reported_by_line(self):
+        body = json_lines(
+            row(priority="HIGH"),
+            "{not json",
+            row(title=""),
+            row(email="nobody@example.com"),
+            "[1, 2]",
+            row(title="second"),
+        )
+        response = self.post(body, "?chunk_size=2")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            (response.data["processed"], response.data["created"], response.data["failed"]), (6, 2, 4)
+        )
+        self.assertEqual(response.data["chunks"], 3)
+        self.assertFalse(response.data["success"])
+        errors = {error["line"]: error["errors"] for error in response.data["errors"]}
+        self.assertEqual(sorted(errors), [2, 3, 4, 5])
+        self.assertIn("title", errors[3])
+        self.assertEqual(errors[4], {"user_email": ["No user with email nobody@example.com."]})
+
+        self.assertEqual(
+            sorted(Request.objects.values_list("title", "priority")),
+            [("Imported", "HIGH"), ("second", "MEDIUM")],
+        )
+        self.assertEqual(
+            RequestActivity.objects.filter(action=RequestActivity.Action.CREATED).count(), 2
+        )
+        stats = services.get_request_stats()
+        self.assertEqual((stats["total"], stats["by_priority"]["HIGH"]), (2, 1))
+
+    def test_dry_run_writes_nothing(self):
+        body = json_lines(row(), row(email="new@example.com"))
+        response = self.post(body, "?dry_run=1&create_users=1")
+        self.assertEqual((response.data["created"], response.data["failed"]), (2, 0))
+        self.assertTrue(response.data["dry_run"])
+        self.assertFalse(Request.objects.exists())
+        self.assertFalse(User.objects.filter(email="new@example.com").exists())
+
+    def test_create_users_adds_placeholder_users(self):
+        body = json_lines(row(email="new@example.com"), row(email="new@example.com"))
+        response = self.post(body, "?create_users=1")
+        self.assertEqual(response.data["created"], 2)
+        user = User.objects.get(email="new@example.com")
+        self.assertTrue(user.uid.startswith("imported:"))
+        self.assertEqual(Request.objects.filter(user=user).count(), 2)
+
+    def test_chunk_size_is_validated(self):
+        for query in ("?chunk_size=0", "?chunk_size=10001", "?chunk_size=many"):
+            with self.subTest(query):
+                self.assertEqual(self.post(json_lines(row()), query).status_code, 400)
+        self.assertFalse(Request.objects.exists())
+
+    def test_non_admins_are_forbidden(self):
+        self.client.force_authenticate(self.owner)
+        self.assertEqual(self.post(json_lines(row())).status_code, 403)
+
+
+class ImportCommandTests(TestCase):
+    def setUp(self):
+        User.objects.create(uid="owner", email="owner@example.com")
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.directory = Path(directory.name)
+
+    def test_imports_a_file_and_writes_the_errors_file(self):
+        path = self.directory / "requests.jsonl"
+        path.write_text(json_lines(row(), "oops", row(title="second")))
+        errors_file = self.directory / "errors.jsonl"
+        out = StringIO()
+        call_command(
+            "import_requests", str(path), "--chunk-size", "1", "--errors-file", str(errors_file),
+            stdout=out, stderr=StringIO(),
+        )
+        self.assertIn("Imported 2 request(s), 1 failed", out.getvalue())
+        self.assertEqual(Request.objects.count(), 2)
+        self.assertEqual([json.loads(line)["line"] for line in errors_file.read_text().splitlines()], [2])
+
+    def test_bad_arguments_are_command_errors(self):
+        with self.assertRaisesMessage(CommandError, "--chunk-size"):
+            call_command("import_requests", "-", "--chunk-size", "0")
+        with self.assertRaisesMessage(CommandError, "Cannot open"):
+            call_command("import_requests", str(self.directory / "missing.jsonl"))
@@ -0,0 +1,75 @@
+"""Signing key store (core.keystore)."""
+
+import json
+import tempfile
+import time
+from pathlib import Path
+from unittest import mock
+
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from django.test import SimpleTestCase
+
+from core.keystore import SigningKeyStore, parse_max_age
+
+
+def public_pem():
+    key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    return key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    ).decode("ascii")
+
+
+class SigningKeyStoreTests(SimpleTestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.pems = {"old": public_pem(), "new": public_pem()}
+
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = Path(directory.name) / "keys.json"
+        self.write_keys("old")
+        self.store = SigningKeyStore(source="file", path=self.path, min_refresh_interval=60)
+        # Refreshes are driven by the tests
+        patcher = mock.patch.object(self.store, "start_background_refresh")
+        self.start_background_refresh = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def write_keys(self, *kids):
+        self.path.write_text(json.dumps({kid: self.pems[kid] for kid in kids}))
+
+    def test_first_use_loads_the_keys(self):
+        self.assertIsNotNone(self.store.get_key("old"))
+        self.assertEqual(self.store.kids(), ["old"])
+        self.start_background_refresh.assert_called_once()
+
+    def test_unknown_kid_refreshes_once_per_interval(self):
+        self.store.get_key("old")
+        self.write_keys("old", "new")
+        self.store._last_refresh -= 60
+        with mock.patch.object(self.store, "_load", wraps=self.store._load) as load:
+            self.assertIsNotNone(self.store.get_key("new"))
+            self.assertIsNone(self.store.get_key("rotated-away"))
+        self.assertEqual(load.call_count, 1)
+
+    def test_expired_keys_are_served_while_refreshing_in_the_background(self):
+        self.store.get_key("old")
+        self.store._expires_at = time.time() - 1
+        self.store._last_refresh -= 60
+        with mock.patch.object(self.store, "_load") as load:
+            self.assertIsNotNone(self.store.get_key("old"))
+        load.assert_not_called()
+        self.assertTrue(self.store._wakeup.is_set())
+
+    def test_failed_refresh_keeps_the_previous_keys(self):
+        self.store.get_key("old")
+        self.path.write_text("not json")
+        self.assertFalse(self.store.refresh())
+        self.assertIsNotNone(self.store.get_key("old"))
+
+    def test_max_age_is_read_from_cache_control(self):
+        self.assertEqual(parse_max_age("public, max-age=19870, must-revalidate"), 19870)
+        self.assertIsNone(parse_max_age("no-cache"))
+        self.assertIsNone(parse_max_age(None))
@@ -0,0 +1,54 @@
+"""List validators (ETag / If-None-Match, core.views.ConditionalListMixin)."""
+
+from django.core.cache import cache
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core import services
+from core.models import Request, User
+
+
+class ListTestCase(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(uid="user", email="user@example.com")
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.request_obj = services.create_request(user=self.user, title="t", description="d")
+
+    def get(self, user, url, **headers):
+        self.client.force_authenticate(user)
+        return self.client.get(url, **headers)
+
+
+class ListValidatorTests(ListTestCase):
+    def test_matching_etag_is_not_modified(self):
+        etag = self.get(self.user, reverse("user-requests"))["ETag"]
+        response = self.get(self.user, reverse("user-requests"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_etag_is_per_user_and_url(self):
+        etag = self.get(self.user, reverse("user-requests"))["ETag"]
+        self.assertNotEqual(etag, self.get(self.admin, reverse("user-requests"))["ETag"])
+        filtered = self.get(self.user, reverse("user-requests") + "?status=PENDING")
+        self.assertNotEqual(etag, filtered["ETag"])
+
+    def test_etag_changes_on_writes(self):
+        etag = self.get(self.admin, reverse("admin-requests"))["ETag"]
+        services.change_request_status(self.request_obj, Request.Status.REVIEWING, self.admin)
+        response = self.get(self.admin, reverse("admin-requests"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_etag_changes_when_a_listed_email_changes(self):
+        etag = self.get(self.admin, reverse("admin-requests"))["ETag"]
+        self.user.email = "renamed@example.com"
+        self.user.save()
+        response = self.get(self.admin, reverse("admin-requests"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["results"][0]["user_email"], "renamed@example.com")
+
+    def test_validation_reads_no_request_rows(self):
+        etag = self.get(self.admin, reverse("admin-requests"))["ETag"]
+        with self.assertNumQueries(1):  # the ChangeSequence row
+            response = self.get(self.admin, reverse("admin-requests"), HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
@@ -0,0 +1,172 @@
+"""Keyset cursors and page-number counts (core.pagination)."""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import OperationalError, connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework.test import APITestCase
+
+from core import pagination, services
+from core.db.timeouts import statement_timeout
+from core.models import Request, User
+from core.pagination import CountStrategy
+
+
+class KeysetPaginationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+        for number in range(45):
+            services.create_request(user=cls.admin, title=f"Request {number}", description="d")
+        # Ties on the ordering field must be broken by id
+        tied = timezone.now() - timedelta(days=1)
+        Request.objects.filter(pk__in=Request.objects.order_by("id").values("id")[10:30]).update(
+            created_at=tied
+        )
+        cls.expected = list(Request.objects.order_by("-created_at", "-id").values_list("id", flat=True))
+
+    def setUp(self):
+        self.client.force_authenticate(self.admin)
+
+    def walk(self, url):
+        ids, pages = [], []
+        while url:
+            response = self.client.get(url)
+            self.assertEqual(response.status_code, 200)
+            pages.append(response.data)
+            ids.extend(row["id"] for row in response.data["results"])
+            url = response.data["next"]
+        return ids, pages
+
+    def test_next_links_visit_every_row_once_in_order(self):
+        ids, pages = self.walk(reverse("admin-requests"))
+        self.assertEqual(ids, self.expected)
+        self.assertEqual([len(page["results"]) for page in pages], [20, 20, 5])
+        self.assertIsNone(pages[0]["previous"])
+        self.assertNotIn("count", pages[0])
+
+    def test_previous_link_returns_the_previous_page(self):
+        first = self.client.get(reverse("admin-requests")).data
+        second = self.client.get(first["next"]).data
+        back = self.client.get(second["previous"]).data
+        self.assertEqual(
+            [row["id"] for row in back["results"]], [row["id"] for row in first["results"]]
+        )
+        self.assertIsNotNone(back["next"])
+
+    def test_cursor_follows_the_requested_ordering(self):
+        ids, pages = self.walk(reverse("admin-requests") + "?ordering=created_at")
+        self.assertEqual(
+            ids, list(Request.objects.order_by("created_at", "id").values_list("id", flat=True))
+        )
+
+    def test_rows_written_after_the_cursor_do_not_shift_the_page(self):
+        first = self.client.get(reverse("admin-requests")).data
+        services.create_request(user=self.admin, title="Newest", description="d")
+        second = self.client.get(first["next"]).data
+        self.assertEqual([row["id"] for row in second["results"]], self.expected[20:40])
+
+    def test_invalid_cursor_is_not_found(self):
+        for cursor in ("garbage", "eyJwIjpbMV19"):  # second: wrong number of values
+            response = self.client.get(reverse("admin-requests"), {"cursor": cursor})
+            self.assertEqual(response.status_code, 404)
+
+    def test_page_param_opts_into_page_numbers(self):
+        response = self.client.get(reverse("admin-requests"), {"page": 3})
+        self.assertEqual(response.data["count"], 45)
+        self.assertTrue(response.data["count_exact"])
+        self.assertEqual(
+            [row["id"] for row in response.data["results"]], self.expected[40:]
+        )
+
+    @override_settings(LIST_EXACT_COUNT_THRESHOLD=5)
+    def test_large_totals_come_from_the_counters(self):
+        response = self.client.get(reverse("admin-requests"), {"page": 1})
+        self.assertEqual(response.data["count"], 45)
+        self.assertFalse(response.data["count_exact"])
+
+
+class CountStrategyTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        user = User.objects.create(uid="user", email="user@example.com")
+        for number in range(12):
+            services.create_request(user=user, title=f"Request {number}", description="d")
+
+    def test_exact_below_the_threshold(self):
+        result = CountStrategy(exact_threshold=20).count(Request.objects.all())
+        self.assertEqual(result, (12, True))
+
+    @mock.patch("core.pagination.refresh_count_in_background")
+    def test_cache_miss_returns_a_lower_bound_and_refreshes(self, refresh):
+        strategy = CountStrategy(exact_threshold=5)
+        result = strategy.count(Request.objects.all(), rows_needed=10)
+        self.assertEqual(result, (11, False))
+        refresh.assert_called_once()
+
+    @mock.patch("core.pagination.refresh_count_in_background")
+    def test_cache_hit_is_served_without_refreshing(self, refresh):
+        strategy = CountStrategy(exact_threshold=5)
+        queryset = Request.objects.filter(priority=Request.Priority.MEDIUM)
+        with mock.patch("core.pagination.cache.get", return_value=1234):
+            result = strategy.count(queryset)
+        self.assertEqual(result, (1234, False))
+        refresh.assert_not_called()
+
+
+@override_settings(LIST_COUNT_MAX_QUEUED=2)
+class BackgroundCountTests(TransactionTestCase):
+    def setUp(self):
+        cache.clear()
+        user = User.objects.create(uid="user", email="user@example.com")
+        for number in range(3):
+            services.create_request(user=user, title=f"Request {number}", description="d")
+
+    def tearDown(self):
+        pagination._refreshing.clear()
+
+    def wait_for_counts(self):
+        # One worker, first in first out
+        pagination._count_executor.submit(lambda: None).result()
+
+    def test_count_is_cached_in_the_background(self):
+        self.assertTrue(pagination.refresh_count_in_background("count:a", Request.objects.all(), 60))
+        self.wait_for_counts()
+        self.assertEqual(cache.get("count:a"), 3)
+        self.assertEqual(pagination._refreshing, set())
+
+    def test_queue_is_bounded_and_deduplicated(self):
+        with mock.patch.object(pagination, "_count_executor") as executor:
+            queued = [
+                pagination.refresh_count_in_background(key, Request.objects.all(), 60)
+                for key in ("count:a", "count:a", "count:b", "count:c")
+            ]
+        self.assertEqual(queued, [True, False, True, False])
+        self.assertEqual(executor.submit.call_count, 2)
+
+    def test_count_running_in_another_process_is_not_repeated(self):
+        cache.add("count:a:refreshing", 1)
+        with mock.patch.object(pagination, "_count_executor") as executor:
+            queued = pagination.refresh_count_in_background("count:a", Request.objects.all(), 60)
+        self.assertFalse(queued)
+        executor.submit.assert_not_called()
+        self.assertEqual(pagination._refreshing, set())
+
+
+class StatementTimeoutTests(TestCase):
+    def test_long_statement_is_interrupted(self):
+        if connection.vendor != "sqlite":
+            self.skipTest("SQLite progress handler")
+        slow = (
+            "WITH RECURSIVE n(x) AS (SELECT 1 UNION ALL SELECT x + 1 FROM n WHERE x < 100000000) "
+            "SELECT COUNT(*) FROM n"
+        )
+        with self.assertRaises(OperationalError), transaction.atomic():
+            with statement_timeout("default", 0.05), connection.cursor() as cursor:
+                cursor.execute(slow)
+        with statement_timeout("default", 5), connection.cursor() as cursor:
+            cursor.execute("SELECT 1")
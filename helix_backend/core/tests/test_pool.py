@@ -0,0 +1,145 @@
+"""Database connection pool (core.db.pool) and the pooled SQLite backend."""
+
+import tempfile
+import threading
+import time
+from pathlib import Path
+from unittest import mock
+
+from django.db import connection
+from django.test import SimpleTestCase
+
+from core.db import pool
+from core.db.backends.sqlite3.base import DatabaseWrapper
+from core.db.pool import ConnectionPool, PoolTimeout
+
+
+class FakeConnection:
+    def __init__(self):
+        self.closed = False
+        self.alive = True
+
+    def close(self):
+        self.closed = True
+
+
+def ping(raw):
+    if not raw.alive:
+        raise OSError("server closed the connection")
+
+
+def make_pool(**options):
+    return ConnectionPool("test", ping=ping, reset=mock.Mock(), **options)
+
+
+class ConnectionPoolTests(SimpleTestCase):
+    def test_released_connections_are_reused_and_reset(self):
+        connections = make_pool()
+        raw = connections.acquire(FakeConnection)
+        connections.release(raw)
+        self.assertIs(connections.acquire(FakeConnection), raw)
+        connections.reset.assert_called_once_with(raw)
+        stats = connections.stats()
+        self.assertEqual((stats["opened"], stats["acquired"], stats["in_use"]), (1, 2, 1))
+
+    def test_full_pool_times_out(self):
+        connections = make_pool(max_size=1, timeout=0.05)
+        connections.acquire(FakeConnection)
+        with self.assertRaises(PoolTimeout):
+            connections.acquire(FakeConnection)
+        stats = connections.stats()
+        self.assertEqual((stats["timeouts"], stats["opened"]), (1, 1))
+
+    def test_waiting_thread_gets_the_released_connection(self):
+        connections = make_pool(max_size=1, timeout=5)
+        raw = connections.acquire(FakeConnection)
+        acquired = []
+        waiter = threading.Thread(target=lambda: acquired.append(connections.acquire(FakeConnection)))
+        waiter.start()
+        while not connections._waiters:
+            time.sleep(0.001)
+        connections.release(raw)
+        waiter.join()
+        self.assertEqual(acquired, [raw])
+        self.assertEqual(connections.stats()["waits"], 1)
+
+    def test_failed_connect_frees_its_slot(self):
+        connections = make_pool(max_size=1, timeout=0.05)
+        with self.assertRaises(OSError):
+            connections.acquire(mock.Mock(side_effect=OSError("refused")))
+        self.assertIsInstance(connections.acquire(FakeConnection), FakeConnection)
+
+    def test_dead_connections_are_replaced(self):
+        connections = make_pool(health_check_after=0)
+        raw = connections.acquire(FakeConnection)
+        connections.release(raw)
+        raw.alive = False
+        with self.assertLogs("core.db.pool", "WARNING"):
+            replacement = connections.acquire(FakeConnection)
+        self.assertIsNot(replacement, raw)
+        self.assertTrue(raw.closed)
+
+        replacement.alive = False
+        with self.assertLogs("core.db.pool", "WARNING"):
+            connections.release(replacement, check=True)
+        self.assertTrue(replacement.closed)
+        stats = connections.stats()
+        self.assertEqual((stats["health_check_failures"], stats["idle"]), (2, 0))
+
+    def test_expired_and_discarded_connections_are_closed(self):
+        connections = make_pool(max_lifetime=0)
+        raw = connections.acquire(FakeConnection)
+        connections.release(raw)
+        self.assertTrue(raw.closed)
+
+        connections = make_pool(max_idle=60)
+        raw = connections.acquire(FakeConnection)
+        connections.release(raw)
+        connections._idle[0].released_at -= 60
+        self.assertIsNot(connections.acquire(FakeConnection), raw)
+        self.assertTrue(raw.closed)
+
+        raw = connections.acquire(FakeConnection)
+        connections.release(raw, discard=True)
+        self.assertTrue(raw.closed)
+
+    def test_pools_are_per_process(self):
+        with mock.patch.dict(pool._pools, clear=True):
+            first = pool.get_pool("key", make_pool)
+            self.assertIs(pool.get_pool("key", make_pool), first)
+            self.assertEqual(list(pool.pool_stats()), ["test"])
+
+            first.pid -= 1  # as if inherited across fork()
+            self.assertIsNot(pool.get_pool("key", make_pool), first)
+
+
+class PooledSQLiteBackendTests(SimpleTestCase):
+    def setUp(self):
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        patcher = mock.patch.dict(pool._pools, clear=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        settings_dict = {
+            **connection.settings_dict,
+            "ENGINE": "core.db.backends.sqlite3",
+            "NAME": str(Path(directory.name) / "pooled.sqlite3"),
+            "POOL": {"MAX_SIZE": 2},
+        }
+        self.wrapper = DatabaseWrapper(settings_dict, alias="pooled")
+        self.addCleanup(lambda: self.wrapper.connection_pool.close_idle())
+
+    def test_closing_returns_the_connection_to_the_pool(self):
+        self.wrapper.ensure_connection()
+        raw = self.wrapper.connection
+        raw.execute("CREATE TABLE t (x)")
+        raw.execute("BEGIN")
+        raw.execute("INSERT INTO t VALUES (1)")
+        self.wrapper.close()
+
+        self.wrapper.ensure_connection()
+        self.assertIs(self.wrapper.connection, raw)
+        self.assertFalse(raw.in_transaction)
+        self.assertEqual(raw.execute("SELECT count(*) FROM t").fetchone(), (0,))
+        self.wrapper.close()
+        self.assertEqual(pool.pool_stats()["pooled"]["idle"], 1)
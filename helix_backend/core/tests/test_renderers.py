@@ -0,0 +1,67 @@
+"""FastJSONRenderer and the JSON parsers (core.renderers, core.parsers)."""
+
+import io
+import uuid
+from datetime import date, datetime, timezone
+from decimal import Decimal
+from unittest import skipIf
+
+from django.test import SimpleTestCase, override_settings
+from django.utils.translation import gettext_lazy
+from rest_framework.exceptions import ParseError
+from rest_framework.renderers import JSONRenderer
+
+from core import renderers
+from core.parsers import FastJSONParser, JSONLinesParser
+
+SAMPLE = {
+    "when": datetime(2026, 10, 17, 12, 30, 15, 123456, tzinfo=timezone.utc),
+    "day": date(2026, 10, 17),
+    "amount": Decimal("12.50"),
+    "uid": uuid.UUID("12345678-1234-5678-1234-567812345678"),
+    "label": gettext_lazy("Pending"),
+    "text": "quote \" backslash \\ separators    ü",
+    "nested": [1, 2.5, None, True, {"1": "a"}],
+    "huge": 2**70,
+}
+
+
+@skipIf(renderers.orjson is None, "orjson is not installed")
+class FastJSONRendererTests(SimpleTestCase):
+    def test_same_bytes_as_drf(self):
+        self.assertEqual(renderers.FastJSONRenderer().render(SAMPLE), JSONRenderer().render(SAMPLE))
+
+    def test_uses_orjson_unless_disabled(self):
+        self.assertIs(renderers.FastJSONRenderer().backend, renderers.orjson)
+        with override_settings(JSON_BACKEND="stdlib"):
+            self.assertIsNone(renderers.FastJSONRenderer().backend)
+
+    def test_indented_output_falls_back_to_drf(self):
+        context = {"indent": 4}
+        self.assertEqual(
+            renderers.FastJSONRenderer().render(SAMPLE, renderer_context=context),
+            JSONRenderer().render(SAMPLE, renderer_context=context),
+        )
+
+    def test_none_renders_nothing(self):
+        self.assertEqual(renderers.FastJSONRenderer().render(None), b"")
+
+
+class ParserTests(SimpleTestCase):
+    def test_json_body(self):
+        data = FastJSONParser().parse(io.BytesIO('{"title": "ü", "n": [1, 2]}'.encode()))
+        self.assertEqual(data, {"title": "ü", "n": [1, 2]})
+
+    def test_invalid_json_and_nan_are_rejected(self):
+        for body in (b"{", b'{"n": NaN}'):
+            with self.subTest(body=body), self.assertRaises(ParseError):
+                FastJSONParser().parse(io.BytesIO(body))
+
+    def test_json_lines_report_bad_lines_and_skip_blank_ones(self):
+        body = io.BytesIO(b'{"title": "a"}\n\nnot json\n{"title": "b"}\n\xff\n')
+        rows = list(JSONLinesParser().parse(body))
+        self.assertEqual([(number, obj) for number, obj, error in rows if error is None], [
+            (1, {"title": "a"}),
+            (4, {"title": "b"}),
+        ])
+        self.assertEqual([number for number, obj, error in rows if error], [3, 5])
@@ -0,0 +1,95 @@
+"""Server-side response cache for lists (core.response_cache, core.checks)."""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import SimpleTestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core import response_cache, services
+from core.checks import check_shared_cache
+from core.db import routers
+from core.models import Request, User
+
+
+@override_settings(RESPONSE_CACHE_TTL=60)
+class ResponseCacheTests(APITestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create(uid="user", email="user@example.com")
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.request_obj = services.create_request(user=self.user, title="t", description="d")
+
+    def get(self, user, url, **headers):
+        self.client.force_authenticate(user)
+        return self.client.get(url, **headers)
+
+    def test_second_read_is_served_from_the_cache(self):
+        first = self.get(self.admin, reverse("admin-requests"))
+        with self.assertNumQueries(0):
+            second = self.get(self.admin, reverse("admin-requests"))
+        self.assertEqual(second.data, first.data)
+        self.assertEqual(second["ETag"], first["ETag"])
+
+    def test_service_write_invalidates_on_commit(self):
+        self.get(self.admin, reverse("admin-requests"))
+        with self.captureOnCommitCallbacks(execute=True):
+            services.change_request_status(self.request_obj, Request.Status.REVIEWING, self.admin)
+        response = self.get(self.admin, reverse("admin-requests"))
+        self.assertEqual(response.data["results"][0]["status"], Request.Status.REVIEWING)
+
+    def test_write_outside_the_service_layer_invalidates(self):
+        self.get(self.user, reverse("user-requests"))
+        with self.captureOnCommitCallbacks(execute=True):
+            Request.objects.filter(pk=self.request_obj.pk).first().delete()
+        self.assertEqual(self.get(self.user, reverse("user-requests")).data["results"], [])
+
+    def test_uncommitted_write_keeps_the_data_version(self):
+        version = response_cache.get_data_version()
+        with self.captureOnCommitCallbacks(execute=False):
+            services.change_request_status(self.request_obj, Request.Status.REVIEWING, self.admin)
+        self.assertEqual(response_cache.get_data_version(), version)
+
+    def test_per_user_lists_are_not_shared(self):
+        self.get(self.user, reverse("user-requests"))
+        response = self.get(self.admin, reverse("user-requests"))
+        self.assertEqual(response.data["results"], [])
+
+    def test_query_string_order_does_not_matter(self):
+        url = reverse("admin-requests")
+        self.get(self.admin, f"{url}?status=PENDING&priority=MEDIUM")
+        with self.assertNumQueries(0):
+            self.get(self.admin, f"{url}?priority=MEDIUM&status=PENDING")
+
+
+class SharedCacheCheckTests(SimpleTestCase):
+    locmem = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+    filebased = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": "/tmp/helix-check",
+        }
+    }
+
+    def error_ids(self, replica=False):
+        with mock.patch.object(routers, "replica_configured", return_value=replica):
+            return [error.id for error in check_shared_cache(None)]
+
+    def test_response_cache_needs_a_shared_backend(self):
+        with override_settings(CACHES=self.locmem, RESPONSE_CACHE_TTL=60):
+            self.assertEqual(self.error_ids(), ["core.E001"])
+        with override_settings(CACHES=self.locmem, RESPONSE_CACHE_TTL=0):
+            self.assertEqual(self.error_ids(), [])
+        with override_settings(CACHES=self.filebased, RESPONSE_CACHE_TTL=60):
+            self.assertEqual(self.error_ids(), [])
+
+    def test_replica_stickiness_needs_a_shared_backend(self):
+        with override_settings(
+            CACHES=self.locmem, RESPONSE_CACHE_TTL=0, READ_REPLICA_STICKY_SECONDS=5
+        ):
+            self.assertEqual(self.error_ids(replica=True), ["core.E002"])
+            self.assertEqual(self.error_ids(replica=False), [])
+        with override_settings(CACHES=self.filebased, READ_REPLICA_STICKY_SECONDS=5):
+            self.assertEqual(self.error_ids(replica=True), [])
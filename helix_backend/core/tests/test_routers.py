@@ -0,0 +1,105 @@
+"""Read-replica routing and read-your-writes stickiness (core.db.routers)."""
+
+from unittest import mock
+
+from django.core.cache import cache
+from django.db import transaction
+from django.test import TestCase, override_settings
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core import services
+from core.db import routers
+from core.db.routers import ReplicaRouter
+from core.models import Request, User
+
+
+class ReplicaTestMixin:
+    def setUp(self):
+        super().setUp()
+        cache.clear()
+        self.addCleanup(cache.clear)
+        patcher = mock.patch.object(routers, "replica_configured", return_value=True)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.owner = User.objects.create(uid="owner", email="owner@example.com")
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+
+
+@override_settings(READ_REPLICA_STICKY_SECONDS=5)
+class StickinessTests(ReplicaTestMixin, TestCase):
+    def test_write_sticks_the_actor_once_committed(self):
+        request_obj = services.create_request(user=self.owner, title="t", description="d")
+        with self.captureOnCommitCallbacks(execute=True):
+            services.change_request_status(request_obj, Request.Status.REVIEWING, self.admin)
+            self.assertFalse(routers.is_sticky(self.admin))
+        self.assertTrue(routers.is_sticky(self.admin))
+        self.assertFalse(routers.is_sticky(self.owner))
+        self.assertIsNone(routers.start_replica_reads(self.admin))
+
+        token = routers.start_replica_reads(self.owner)
+        self.addCleanup(routers.stop_replica_reads, token)
+        self.assertTrue(routers.reading_from_replica())
+
+    def test_rolled_back_write_does_not_stick(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            with self.assertRaises(RuntimeError), transaction.atomic():
+                services.create_request(user=self.owner, title="t", description="d")
+                raise RuntimeError
+        self.assertFalse(routers.is_sticky(self.owner))
+
+    def test_no_stickiness_without_a_replica_or_with_a_zero_window(self):
+        with override_settings(READ_REPLICA_STICKY_SECONDS=0):
+            with self.captureOnCommitCallbacks(execute=True):
+                routers.stick_to_primary(self.owner)
+        routers.replica_configured.return_value = False
+        with self.captureOnCommitCallbacks(execute=True):
+            routers.stick_to_primary(self.owner)
+        self.assertFalse(routers.is_sticky(self.owner))
+        self.assertIsNone(routers.start_replica_reads(self.owner))
+
+
+@override_settings(READ_REPLICA_STICKY_SECONDS=5)
+class ReplicaReadViewTests(ReplicaTestMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.client.force_authenticate(self.owner)
+        self.routed = []
+        start_replica_reads = routers.start_replica_reads
+
+        def record(user):
+            token = start_replica_reads(user)
+            self.routed.append(routers.reading_from_replica())
+            return token
+
+        patcher = mock.patch.object(routers, "start_replica_reads", side_effect=record)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_reads_stay_on_the_primary_after_a_write(self):
+        url = reverse("user-requests")
+        self.client.get(url)
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post(
+                url, {"title": "t", "description": "long enough"}, format="json"
+            )
+        self.assertEqual(response.status_code, 201)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.routed, [True, False])
+        self.assertFalse(routers.reading_from_replica())
+
+
+class ReplicaRouterTests(TestCase):
+    def test_routing(self):
+        router = ReplicaRouter()
+        self.assertEqual(router.db_for_read(Request), "default")
+        token = routers._replica_reads.set(True)
+        self.addCleanup(routers._replica_reads.reset, token)
+        # TestCase wraps each test in a transaction on "default"
+        self.assertEqual(router.db_for_read(Request), "default")
+        with mock.patch.object(routers.connections["default"], "in_atomic_block", False):
+            self.assertEqual(router.db_for_read(Request), "replica")
+        self.assertEqual(router.db_for_write(Request), "default")
+        self.assertTrue(router.allow_migrate("default", "core"))
+        self.assertFalse(router.allow_migrate("replica", "core"))
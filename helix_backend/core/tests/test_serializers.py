@@ -0,0 +1,50 @@
+"""RequestListSerializer against RequestSerializer (core.serializers)."""
+
+from django.test import TestCase
+from rest_framework.renderers import JSONRenderer
+from rest_framework.test import APIRequestFactory
+
+from core import services
+from core.models import Request, User
+from core.serializers import RequestListSerializer, RequestSerializer
+
+
+class RequestListSerializerTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = User.objects.create(uid="user", email="user@example.com")
+        cls.admin = User.objects.create(uid="admin", email="admin@example.com", role=User.Role.ADMIN)
+        statuses = [Request.Status.PENDING, Request.Status.REVIEWING, Request.Status.REJECTED]
+        for number, status in enumerate(statuses):
+            request_obj = services.create_request(
+                user=cls.user, title=f"Ünïcode {number}", description="line\nbreak"
+            )
+            if status != Request.Status.PENDING:
+                services.change_request_status(request_obj, status, cls.admin)
+            if number == 1:
+                services.assign_request(request_obj, cls.admin, cls.admin)
+
+    def render_both(self, viewer):
+        request = APIRequestFactory().get("/")
+        request.user = viewer
+        context = {"request": request}
+        queryset = Request.objects.order_by("id")
+        full = RequestSerializer(
+            queryset.select_related("user", "assigned_to"), many=True, context=context
+        )
+        fast = RequestListSerializer(
+            queryset.values(*RequestListSerializer.values_fields), many=True, context=context
+        )
+        return JSONRenderer().render(full.data), JSONRenderer().render(fast.data)
+
+    def test_output_is_byte_identical_for_each_role(self):
+        for viewer in (self.user, self.admin):
+            with self.subTest(role=viewer.role):
+                full, fast = self.render_both(viewer)
+                self.assertEqual(fast, full)
+
+    def test_without_a_viewer_no_transitions_are_offered(self):
+        fast = RequestListSerializer(
+            Request.objects.values(*RequestListSerializer.values_fields), many=True
+        ).data
+        self.assertTrue(all(not row["next_statuses"] for row in fast))
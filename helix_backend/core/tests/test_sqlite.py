@@ -0,0 +1,70 @@
+"""SQLite profile and lock retries (core.db.sqlite)."""
+
+import os
+import sqlite3
+import tempfile
+from types import SimpleNamespace
+from unittest import mock, skipUnless
+
+from django.db import DEFAULT_DB_ALIAS, OperationalError, connection, connections
+from django.test import SimpleTestCase, override_settings
+
+from core.db import sqlite
+from core.models import Request
+
+
+class ApplyPragmasTests(SimpleTestCase):
+    def test_profile_is_applied_to_the_connection(self):
+        with tempfile.TemporaryDirectory() as directory:
+            raw = sqlite3.connect(os.path.join(directory, "db.sqlite3"))
+            try:
+                sqlite.apply_pragmas(SimpleNamespace(connection=raw))
+                self.assertEqual(raw.execute("PRAGMA journal_mode").fetchone()[0], "wal")
+                self.assertEqual(raw.execute("PRAGMA synchronous").fetchone()[0], 1)  # NORMAL
+                self.assertEqual(raw.execute("PRAGMA busy_timeout").fetchone()[0], 5000)
+            finally:
+                raw.close()
+
+
+@skipUnless(connection.vendor == "sqlite", "SQLite only")
+@override_settings(SQLITE_LOCK_RETRIES=3, SQLITE_LOCK_BACKOFF=0)
+class RetryOnLockedTests(SimpleTestCase):
+    def locked_then(self, result, failures):
+        calls = []
+
+        @sqlite.retry_on_locked
+        def write(request_obj):
+            calls.append(request_obj.title)
+            request_obj.title = "changed"
+            if len(calls) <= failures:
+                raise OperationalError("database is locked")
+            return result
+
+        return write, calls
+
+    def test_retries_until_the_lock_is_free(self):
+        write, calls = self.locked_then("done", failures=2)
+        self.assertEqual(write(Request(title="original")), "done")
+        # Each attempt started from the instance as it was passed in
+        self.assertEqual(calls, ["original"] * 3)
+
+    def test_gives_up_and_restores_the_instance(self):
+        write, calls = self.locked_then("done", failures=10)
+        request_obj = Request(title="original")
+        with self.assertRaises(OperationalError):
+            write(request_obj)
+        self.assertEqual(len(calls), 4)
+        self.assertEqual(request_obj.title, "original")
+
+    def test_other_errors_are_not_retried(self):
+        func = mock.Mock(side_effect=OperationalError("no such table"), __name__="func")
+        with self.assertRaises(OperationalError):
+            sqlite.retry_on_locked(func)()
+        func.assert_called_once()
+
+    def test_not_retried_inside_an_outer_transaction(self):
+        write, calls = self.locked_then("done", failures=1)
+        with mock.patch.object(connections[DEFAULT_DB_ALIAS], "in_atomic_block", True):
+            with self.assertRaises(OperationalError):
+                write(Request(title="original"))
+        self.assertEqual(len(calls), 1)
@@ -0,0 +1,66 @@
+"""Lazy Firebase SDK import (core.firebase) and profile_imports."""
+
+import os
+import subprocess
+import sys
+from io import StringIO
+from unittest import mock
+
+from django.conf import settings
+from django.core.management import call_command
+from django.test import SimpleTestCase
+
+from core import firebase
+from core.management.commands.profile_imports import parse_importtime
+
+IMPORTTIME = """\
+import time: self [us] | cumulative | imported package
+import time:       120 |        120 | _io
+import time:       300 |        900 | json
+import time:        50 |        600 |   json.decoder
+"""
+
+
+class LazyFirebaseImportTests(SimpleTestCase):
+    def test_worker_boot_does_not_import_the_sdk(self):
+        code = (
+            "import sys, django; django.setup(); import helix_backend.wsgi; "
+            "from django.urls import get_resolver; get_resolver().url_patterns; "
+            "print(sorted(m for m in sys.modules if m.startswith(('firebase_admin', 'google'))))"
+        )
+        env = {**os.environ, "DJANGO_SETTINGS_MODULE": "helix_backend.settings"}
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            env=env,
+            cwd=settings.BASE_DIR,
+        )
+        self.assertEqual(result.returncode, 0, result.stderr)
+        self.assertEqual(result.stdout.strip().splitlines()[-1], "[]")
+
+    def test_sdk_is_initialized_once_on_first_use(self):
+        auth_module = mock.Mock()
+        with mock.patch.object(firebase, "_auth_module", None), mock.patch.object(
+            firebase, "initialize_firebase"
+        ) as initialize, mock.patch.dict(
+            sys.modules, {"firebase_admin": mock.Mock(auth=auth_module)}
+        ):
+            self.assertIs(firebase.get_auth(), auth_module)
+            self.assertIs(firebase.get_auth(), auth_module)
+        initialize.assert_called_once()
+
+
+class ProfileImportsTests(SimpleTestCase):
+    def test_parse_importtime(self):
+        self.assertEqual(
+            parse_importtime(IMPORTTIME),
+            [("_io", 120, 120, 0), ("json", 300, 900, 0), ("json.decoder", 50, 600, 1)],
+        )
+
+    def test_reports_the_matching_modules(self):
+        out = StringIO()
+        call_command("profile_imports", "--target", "setup", "--match", "django.conf", stdout=out)
+        lines = out.getvalue().splitlines()
+        self.assertIn("django.conf", "\n".join(lines[1:-1]))
+        self.assertIn("Total import time for target 'setup'", lines[-1])
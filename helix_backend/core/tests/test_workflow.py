@@ -0,0 +1,75 @@
+"""Workflow rules (core.workflow) and the cancel endpoint."""
+
+from django.core.exceptions import ValidationError
+from django.test import SimpleTestCase
+from django.urls import reverse
+from rest_framework.test import APITestCase
+
+from core import services
+from core.models import Request, User
+from core.workflow import Rule, Workflow, workflow
+
+Status = Request.Status
+ADMIN = User.Role.ADMIN
+USER = User.Role.USER
+
+
+class WorkflowRulesTests(SimpleTestCase):
+    def test_admin_transitions(self):
+        self.assertTrue(workflow.can(Status.PENDING, Status.REVIEWING, ADMIN))
+        self.assertTrue(workflow.can(Status.IN_PROGRESS, Status.CANCELLED, ADMIN))
+        self.assertFalse(workflow.can(Status.PENDING, Status.COMPLETED, ADMIN))
+
+    def test_owner_may_only_cancel_early(self):
+        self.assertEqual(workflow.next_statuses(USER)[Status.PENDING], (Status.CANCELLED,))
+        self.assertEqual(workflow.next_statuses(USER)[Status.REVIEWING], (Status.CANCELLED,))
+        self.assertEqual(workflow.next_statuses(USER)[Status.IN_PROGRESS], ())
+        self.assertIn("Your role cannot", workflow.check(Status.IN_PROGRESS, Status.CANCELLED, USER))
+
+    def test_terminal_statuses(self):
+        self.assertEqual(
+            workflow.terminal,
+            {Status.CLOSED, Status.REJECTED, Status.CANCELLED},
+        )
+        with self.assertRaisesMessage(ValidationError, "none (terminal state)"):
+            workflow.validate(Status.CLOSED, Status.PENDING, ADMIN)
+
+    def test_unknown_role_has_no_transitions(self):
+        self.assertFalse(workflow.can(Status.PENDING, Status.CANCELLED, "GUEST"))
+        self.assertEqual(workflow.next_statuses("GUEST")[Status.PENDING], ())
+
+    def test_rules_must_use_known_statuses(self):
+        with self.assertRaises(ValueError):
+            Workflow(["A", "B"], [Rule("A", "C", frozenset({ADMIN}))], [ADMIN])
+
+
+class CancelEndpointTests(APITestCase):
+    def setUp(self):
+        self.owner = User.objects.create(uid="owner", email="owner@example.com")
+        self.admin = User.objects.create(uid="admin", email="admin@example.com", role=ADMIN)
+        self.request_obj = services.create_request(user=self.owner, title="t", description="d")
+        self.url = reverse("user-request-cancel", args=[self.request_obj.pk])
+        self.client.force_authenticate(self.owner)
+
+    def test_owner_cancels_a_pending_request(self):
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["request"]["status"], Status.CANCELLED)
+        self.assertEqual(response.json()["request"]["next_statuses"], [])
+
+    def test_owner_cannot_cancel_work_in_progress(self):
+        services.change_request_status(self.request_obj, Status.REVIEWING, self.admin)
+        services.change_request_status(self.request_obj, Status.IN_PROGRESS, self.admin)
+        response = self.client.post(self.url)
+        self.assertEqual(response.status_code, 400)
+        self.request_obj.refresh_from_db()
+        self.assertEqual(self.request_obj.status, Status.IN_PROGRESS)
+
+    def test_cancelling_twice_is_rejected(self):
+        self.assertEqual(self.client.post(self.url).status_code, 200)
+        self.assertEqual(self.client.post(self.url).status_code, 400)
+
+    def test_other_users_requests_are_not_found(self):
+        other = User.objects.create(uid="other", email="other@example.com")
+        self.client.force_authenticate(other)
+        self.assertEqual(self.client.post(self.url).status_code, 404)
@@ -8,41 +8,130 @@ User endpoints:
     POST /api/requests/                         → create request
     GET  /api/requests/                         → list own requests
     GET  /api/requests/<id>/activities/          → activity log for own request
+    POST /api/requests/<id>/cancel/              → cancel own request
+    GET  /api/requests/changes/                 → change feed for own requests
+    GET  /api/events/                           → live request events (SSE, ASGI only)
 
 Admin endpoints:
     GET    /api/admin/requests/                 → list all requests
+    GET    /api/admin/requests/stats/           → counts by status/priority/assignee
+    GET    /api/admin/requests/changes/         → change feed for all requests
+    POST   /api/admin/requests/bulk-status/     → change status of many requests
+    POST   /api/admin/requests/import/          → bulk import (JSON lines)
+    GET    /api/admin/requests/export/          → stream requests as CSV / JSON lines
+    GET    /api/admin/activities/export/        → stream activity history
     PATCH  /api/admin/requests/<id>/            → update workflow status
     DELETE /api/admin/requests/<id>/            → delete request
     POST   /api/admin/requests/<id>/assign/     → assign to admin
+    POST   /api/admin/requests/bulk-assign/     → assign many requests to admin
     GET    /api/admin/requests/<id>/activities/  → activity log (admin)
+    GET    /api/admin/metrics/                  → in-process cache and pool statistics
+
+With ASYNC_VIEWS=True (ASGI only) the auth, request list and activity
+endpoints are served by the async views in core.async_views.
 """
 
+from django.conf import settings
 from django.urls import path
 
 from core.views import (
     AuthMeView,
     UserRequestListCreateView,
     UserRequestActivitiesView,
+    UserRequestCancelView,
+    UserChangeFeedView,
     AdminRequestListView,
+    AdminRequestStatsView,
+    AdminChangeFeedView,
     AdminRequestDetailView,
+    AdminBulkStatusView,
+    AdminRequestImportView,
+    AdminRequestExportView,
+    AdminActivityExportView,
     AdminAssignView,
+    AdminBulkAssignView,
     AdminRequestActivitiesView,
+    AdminMetricsView,
+    event_stream,
 )
 
+if settings.ASYNC_VIEWS:
+    from core.async_views import (
+        AsyncAuthMeView,
+        AsyncUserRequestListView,
+        AsyncUserRequestActivitiesView,
+        AsyncAdminRequestListView,
+        AsyncAdminRequestActivitiesView,
+    )
+
+    auth_me_view = AsyncAuthMeView.as_view()
+    user_requests_view = AsyncUserRequestListView.as_view()
+    user_request_activities_view = AsyncUserRequestActivitiesView.as_view()
+    admin_requests_view = AsyncAdminRequestListView.as_view()
+    admin_request_activities_view = AsyncAdminRequestActivitiesView.as_view()
+else:
+    auth_me_view = AuthMeView.as_view()
+    user_requests_view = UserRequestListCreateView.as_view()
+    user_request_activities_view = UserRequestActivitiesView.as_view()
+    admin_requests_view = AdminRequestListView.as_view()
+    admin_request_activities_view = AdminRequestActivitiesView.as_view()
+
 urlpatterns = [
     # ── Auth endpoint ────────────────────────────────────────────
-    path("auth/me/", AuthMeView.as_view(), name="auth-me"),
+    path("auth/me/", auth_me_view, name="auth-me"),
 
     # ── User endpoints ───────────────────────────────────────────
-    path("requests/", UserRequestListCreateView.as_view(), name="user-requests"),
+    path("requests/", user_requests_view, name="user-requests"),
+    path("requests/changes/", UserChangeFeedView.as_view(), name="user-request-changes"),
+    path("events/", event_stream, name="event-stream"),
     path(
         "requests/<int:pk>/activities/",
-        UserRequestActivitiesView.as_view(),
+        user_request_activities_view,
         name="user-request-activities",
     ),
+    path(
+        "requests/<int:pk>/cancel/",
+        UserRequestCancelView.as_view(),
+        name="user-request-cancel",
+    ),
 
     # ── Admin endpoints ──────────────────────────────────────────
-    path("admin/requests/", AdminRequestListView.as_view(), name="admin-requests"),
+    path("admin/requests/", admin_requests_view, name="admin-requests"),
+    path(
+        "admin/requests/changes/",
+        AdminChangeFeedView.as_view(),
+        name="admin-request-changes",
+    ),
+    path(
+        "admin/requests/stats/",
+        AdminRequestStatsView.as_view(),
+        name="admin-request-stats",
+    ),
+    path(
+        "admin/requests/bulk-status/",
+        AdminBulkStatusView.as_view(),
+        name="admin-request-bulk-status",
+    ),
+    path(
+        "admin/requests/import/",
+        AdminRequestImportView.as_view(),
+        name="admin-request-import",
+    ),
+    path(
+        "admin/requests/export/",
+        AdminRequestExportView.as_view(),
+        name="admin-request-export",
+    ),
+    path(
+        "admin/activities/export/",
+        AdminActivityExportView.as_view(),
+        name="admin-activity-export",
+    ),
+    path(
+        "admin/requests/bulk-assign/",
+        AdminBulkAssignView.as_view(),
+        name="admin-request-bulk-assign",
+    ),
     path(
         "admin/requests/<int:pk>/",
         AdminRequestDetailView.as_view(),
@@ -55,7 +144,8 @@ urlpatterns = [
     ),
     path(
         "admin/requests/<int:pk>/activities/",
-        AdminRequestActivitiesView.as_view(),
+        admin_request_activities_view,
         name="admin-request-activities",
     ),
+    path("admin/metrics/", AdminMetricsView.as_view(), name="admin-metrics"),
 ]
@@ -8,20 +8,43 @@ User endpoints:
     POST /api/requests/                        → create a request
     GET  /api/requests/                        → list own requests
     GET  /api/requests/<id>/activities/         → activity log for own request
+    POST /api/requests/<id>/cancel/             → cancel own request
+    GET  /api/requests/changes/                → change feed for own requests
+    GET  /api/events/                          → live request events (SSE, ASGI only)
 
 Admin endpoints:
     GET    /api/admin/requests/                → list ALL requests
+    GET    /api/admin/requests/stats/          → counts by status/priority/assignee
+    GET    /api/admin/requests/changes/        → change feed for all requests
+    POST   /api/admin/requests/bulk-status/    → change status of many requests
+    POST   /api/admin/requests/import/         → bulk import (JSON lines)
+    GET    /api/admin/requests/export/         → stream requests as CSV / JSON lines
+    GET    /api/admin/activities/export/       → stream activity history
     PATCH  /api/admin/requests/<id>/           → update request status
     DELETE /api/admin/requests/<id>/           → delete a request
     POST   /api/admin/requests/<id>/assign/    → assign request to admin
+    POST   /api/admin/requests/bulk-assign/    → assign many requests to admin
     GET    /api/admin/requests/<id>/activities/ → activity log (admin)
+    GET    /api/admin/metrics/                 → in-process cache and pool statistics
 """
 
+import asyncio
+import hashlib
+import json
 import logging
+from abc import ABCMeta, abstractmethod
 
+from asgiref.sync import sync_to_async
+
+from django.conf import settings
 from django.core.exceptions import ValidationError as DjangoValidationError
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, StreamingHttpResponse
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control, patch_vary_headers
+from django.utils.http import http_date, quote_etag
 
-from rest_framework import status
+from rest_framework import exceptions, status
 from rest_framework.generics import ListCreateAPIView, ListAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.response import Response
@@ -29,26 +52,71 @@ from rest_framework.views import APIView
 from django_filters.rest_framework import DjangoFilterBackend
 from rest_framework.filters import OrderingFilter
 
-from core.models import Request, RequestActivity, User
+from core.models import ChangeSequence, Request, RequestActivity, RequestTombstone
 from core.serializers import (
     RequestCreateSerializer,
     RequestSerializer,
+    RequestListSerializer,
     RequestStatusSerializer,
+    BulkStatusSerializer,
     RequestAssignSerializer,
+    BulkAssignSerializer,
     RequestActivitySerializer,
 )
+from core.changes import ChangeFeed, CursorExpired, InvalidCursor
+from core.exports import (
+    ACTIVITY_COLUMNS,
+    EXPORT_FORMATS,
+    REQUEST_COLUMNS,
+    astream_export,
+    stream_export,
+)
+from core.parsers import JSONLinesParser, JSONLParser
+from core.pagination import AdminRequestPagination, RequestCounterCountStrategy
 from core.permissions import IsAdminUser
-from core import services
+from core.authentication import (
+    FirebaseAuthentication,
+    get_token_verifier,
+    token_cache,
+    user_cache,
+)
+from core import activity_log, events, response_cache, services
+from core.db import pool as db_pool, routers, sqlite as db_sqlite
 
 logger = logging.getLogger(__name__)
 
 
+# ═══════════════════════════════════════════════════════════════════
+#  Read Replica
+# ═══════════════════════════════════════════════════════════════════
+
+
+class ReplicaReadMixin:
+    """
+    Handles GET on the read replica when one is configured (see
+    core.db.routers), unless the user wrote recently. Authentication and
+    permission checks run before and stay on the primary.
+    """
+
+    replica_reads = True
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        if self.replica_reads and request.method in ("GET", "HEAD"):
+            self.replica_token = routers.start_replica_reads(request.user)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        routers.stop_replica_reads(getattr(self, "replica_token", None))
+        self.replica_token = None
+        return super().finalize_response(request, response, *args, **kwargs)
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  Auth Endpoint
 # ═══════════════════════════════════════════════════════════════════
 
 
-class AuthMeView(APIView):
+class AuthMeView(ReplicaReadMixin, APIView):
     """
     GET /api/auth/me/  → current authenticated user profile
 
@@ -73,12 +141,181 @@ class AuthMeView(APIView):
         )
 
 
+# ═══════════════════════════════════════════════════════════════════
+#  Shared
+# ═══════════════════════════════════════════════════════════════════
+
+
+class RequestListMixin:
+    """
+    Serves GET lists of requests from values() rows through
+    RequestListSerializer (same output as RequestSerializer, a fraction
+    of the CPU). Filtering, ordering and pagination are unchanged.
+    """
+
+    def list(self, request, *args, **kwargs):
+        queryset = self.filter_queryset(self.get_queryset())
+        queryset = queryset.values(*RequestListSerializer.values_fields)
+
+        context = self.get_serializer_context()
+        page = self.paginate_queryset(queryset)
+        if page is not None:
+            return self.get_paginated_response(
+                RequestListSerializer(page, many=True, context=context).data
+            )
+        return Response(RequestListSerializer(queryset, many=True, context=context).data)
+
+
+class ConditionalListMixin:
+    """
+    ETag / Last-Modified validators for GET lists.
+
+    The validators come from the ChangeSequence row (core.models), read
+    by primary key from the database the list is read from, and hashed
+    with the user, role and full URL. Every committed write to a request,
+    activity or user moves the sequence, so any change that can affect a
+    list, including a joined email, changes the ETag; the sequence lives
+    in the database, so every worker agrees on it. A matching
+    If-None-Match returns 304 before anything is paginated or serialized.
+
+    Last-Modified is the time of the last write anywhere, not of the rows
+    in the list.
+    """
+
+    def get_list_validators(self, queryset):
+        """Return (etag, Last-Modified header value or None) for the filtered queryset."""
+        version = (
+            ChangeSequence.objects.using(queryset.db)
+            .filter(pk=1)
+            .values_list("value", "updated_at")
+            .first()
+        )
+        return self.make_list_validators(version)
+
+    def make_list_validators(self, version):
+        """Validators from the (value, updated_at) ChangeSequence row, or None."""
+        value, last_modified = version or (0, None)
+        fingerprint = "|".join(
+            [
+                str(self.request.user.pk),
+                self.request.user.role,
+                self.request.get_full_path(),
+                str(value),
+            ]
+        )
+        etag = quote_etag(hashlib.sha1(fingerprint.encode("utf-8")).hexdigest())
+        return etag, http_date(last_modified.timestamp()) if last_modified else None
+
+    def list(self, request, *args, **kwargs):
+        etag, last_modified = self.get_list_validators(self.filter_queryset(self.get_queryset()))
+        response = get_conditional_response(request, etag=etag)
+        if response is None:
+            response = super().list(request, *args, **kwargs)
+        return self.set_validator_headers(response, etag, last_modified)
+
+    def set_validator_headers(self, response, etag, last_modified):
+        response["ETag"] = etag
+        if last_modified:
+            response["Last-Modified"] = last_modified
+        # Per-user data: browsers may keep it but must revalidate each time
+        patch_cache_control(response, private=True, no_cache=True)
+        patch_vary_headers(response, ["Authorization"])
+        return response
+
+
+class ResponseCacheMixin:
+    """
+    Serves GET lists from core.response_cache (see that module for how
+    keys are versioned). Goes before ConditionalListMixin so a cached
+    entry also answers If-None-Match without touching the database.
+
+    Lists visible to every user of a role set `response_cache_shared`;
+    otherwise entries are scoped to the requesting user.
+    """
+
+    response_cache_shared = False
+
+    def get_response_cache_scope(self, request):
+        if self.response_cache_shared:
+            return f"{type(self).__name__}:role:{request.user.role}"
+        return f"{type(self).__name__}:user:{request.user.pk}"
+
+    def list(self, request, *args, **kwargs):
+        if settings.RESPONSE_CACHE_TTL <= 0:
+            return super().list(request, *args, **kwargs)
+
+        key = response_cache.make_key(request, self.get_response_cache_scope(request))
+        entry = response_cache.get_entry(key)
+        if entry is not None:
+            etag, last_modified, data = entry
+            response = get_conditional_response(request, etag=etag) or Response(data)
+            return self.set_validator_headers(response, etag, last_modified)
+
+        response = super().list(request, *args, **kwargs)
+        if response.status_code == status.HTTP_200_OK:
+            response_cache.store_entry(
+                key, (response["ETag"], response.get("Last-Modified"), response.data)
+            )
+        return response
+
+
+class ChangeFeedView(APIView, metaclass=ABCMeta):
+    """
+    Base view for the change feed (see core.changes). Subclasses define
+    get_feed_querysets().
+
+    Query params:
+        since=<cursor>   cursor from the previous response (omit for a full sync)
+        limit=500        max rows per stream (at most CHANGE_FEED_LIMIT)
+
+    400 for a malformed cursor, 410 when the cursor is older than the
+    tombstone retention period (or predates change sequences) and the
+    client has to reload.
+    """
+
+    @abstractmethod
+    def get_feed_querysets(self, request):
+        """Return (requests, activities, tombstones) visible to the caller."""
+
+    def get(self, request):
+        try:
+            limit = int(request.query_params.get("limit", settings.CHANGE_FEED_LIMIT))
+        except ValueError:
+            limit = 0
+        if not 1 <= limit <= settings.CHANGE_FEED_LIMIT:
+            return Response(
+                {
+                    "success": False,
+                    "message": f"limit must be between 1 and {settings.CHANGE_FEED_LIMIT}.",
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        feed = ChangeFeed(
+            *self.get_feed_querysets(request),
+            limit=limit,
+            retention_days=settings.CHANGE_FEED_TOMBSTONE_DAYS,
+        )
+        try:
+            changes = feed.read(request.query_params.get("since"), context={"request": request})
+        except InvalidCursor as e:
+            return Response(
+                {"success": False, "message": str(e)}, status=status.HTTP_400_BAD_REQUEST
+            )
+        except CursorExpired as e:
+            return Response({"success": False, "message": str(e)}, status=status.HTTP_410_GONE)
+
+        return Response(changes, status=status.HTTP_200_OK)
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  User Endpoints
 # ═══════════════════════════════════════════════════════════════════
 
 
-class UserRequestListCreateView(ListCreateAPIView):
+class UserRequestListCreateView(
+    ReplicaReadMixin, ResponseCacheMixin, ConditionalListMixin, RequestListMixin, ListCreateAPIView
+):
     """
     GET  /api/requests/  → list the authenticated user's requests
     POST /api/requests/  → create a new request
@@ -86,7 +323,9 @@ class UserRequestListCreateView(ListCreateAPIView):
     Supports:
         - Filtering by status:  ?status=PENDING
         - Ordering:             ?ordering=-created_at  (default)
-        - Pagination:           automatic via settings
+        - Pagination:           ?cursor=<opaque> (default), ?page=N opts in
+                                to page numbers + count
+        - Conditional GET:      If-None-Match: <ETag> → 304 when unchanged
     """
 
     permission_classes = [IsAuthenticated]
@@ -122,13 +361,13 @@ class UserRequestListCreateView(ListCreateAPIView):
             {
                 "success": True,
                 "message": "Request created successfully.",
-                "request": RequestSerializer(req).data,
+                "request": RequestSerializer(req, context={"request": request}).data,
             },
             status=status.HTTP_201_CREATED,
         )
 
 
-class UserRequestActivitiesView(ListAPIView):
+class UserRequestActivitiesView(ReplicaReadMixin, ConditionalListMixin, ListAPIView):
     """
     GET /api/requests/<id>/activities/  → activity log for own request
 
@@ -145,12 +384,74 @@ class UserRequestActivitiesView(ListAPIView):
         ).select_related("performed_by")
 
 
+class UserRequestCancelView(APIView):
+    """
+    POST /api/requests/<id>/cancel/  → cancel own request
+
+    Allowed while the workflow lets the owner cancel (see core.workflow).
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def post(self, request, pk):
+        try:
+            req = Request.objects.select_related("user", "assigned_to").get(
+                pk=pk, user=request.user
+            )
+        except Request.DoesNotExist:
+            return Response(
+                {"success": False, "message": "Request not found."},
+                status=status.HTTP_404_NOT_FOUND,
+            )
+
+        try:
+            req = services.change_request_status(
+                request_obj=req,
+                new_status=Request.Status.CANCELLED,
+                changed_by=request.user,
+            )
+        except DjangoValidationError as e:
+            return Response(
+                {"success": False, "message": e.message},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        return Response(
+            {
+                "success": True,
+                "message": "Request cancelled.",
+                "request": RequestSerializer(req, context={"request": request}).data,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class UserChangeFeedView(ChangeFeedView):
+    """
+    GET /api/requests/changes/?since=<cursor>  → changes to own requests
+
+    Own requests created or updated, their new activities and
+    deletions, after the cursor.
+    """
+
+    permission_classes = [IsAuthenticated]
+
+    def get_feed_querysets(self, request):
+        return (
+            Request.objects.filter(user=request.user),
+            RequestActivity.objects.filter(request__user=request.user),
+            RequestTombstone.objects.filter(owner_id=request.user.pk),
+        )
+
+
 # ═══════════════════════════════════════════════════════════════════
 #  Admin Endpoints
 # ═══════════════════════════════════════════════════════════════════
 
 
-class AdminRequestListView(ListAPIView):
+class AdminRequestListView(
+    ReplicaReadMixin, ResponseCacheMixin, ConditionalListMixin, RequestListMixin, ListAPIView
+):
     """
     GET /api/admin/requests/  → list ALL requests (admin only)
 
@@ -158,11 +459,18 @@ class AdminRequestListView(ListAPIView):
         - Filtering by status:  ?status=PENDING
         - Filtering by priority: ?priority=HIGH
         - Ordering:             ?ordering=-created_at
-        - Pagination:           automatic via settings
+        - Pagination:           ?cursor=<opaque> (default), ?page=N opts in
+                                to page numbers + count (exact below
+                                LIST_EXACT_COUNT_THRESHOLD, else from the
+                                counters table or cache; see count_exact)
+        - Conditional GET:      If-None-Match: <ETag> → 304 when unchanged
     """
 
     permission_classes = [IsAuthenticated, IsAdminUser]
     serializer_class = RequestSerializer
+    pagination_class = AdminRequestPagination
+    count_strategy_class = RequestCounterCountStrategy
+    response_cache_shared = True
     filter_backends = [DjangoFilterBackend, OrderingFilter]
     filterset_fields = ["status", "priority", "assigned_to"]
     ordering_fields = ["created_at", "updated_at", "priority"]
@@ -171,6 +479,104 @@ class AdminRequestListView(ListAPIView):
     def get_queryset(self):
         return Request.objects.all().select_related("user", "assigned_to")
 
+    def get_count_strategy(self):
+        """Built per request, so it follows the current settings."""
+        return self.count_strategy_class.from_settings()
+
+
+class AdminRequestExportView(AdminRequestListView):
+    """
+    GET /api/admin/requests/export/  → stream all matching requests (admin only)
+
+    Accepts the same filters and ordering as /api/admin/requests/, plus:
+        - Output format:        ?output=csv (default) | jsonl
+
+    Rows are streamed in EXPORT_CHUNK_SIZE batches without pagination.
+    """
+
+    columns = REQUEST_COLUMNS
+    export_name = "requests"
+    # Rows are streamed after the handler returns, outside the replica context
+    replica_reads = False
+
+    def get_queryset(self):
+        return Request.objects.all()
+
+    def get_export_queryset(self):
+        return self.filter_queryset(self.get_queryset())
+
+    def get(self, request, *args, **kwargs):
+        output = request.query_params.get("output", "csv")
+        if output not in EXPORT_FORMATS:
+            return Response(
+                {"success": False, "message": f"output must be one of: {', '.join(EXPORT_FORMATS)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        queryset = self.get_export_queryset()
+        logger.info(f"[ADMIN] {self.export_name} export ({output}) by {request.user.email}")
+
+        # Under ASGI a sync iterator would be buffered whole before sending
+        stream = astream_export if isinstance(request._request, ASGIRequest) else stream_export
+        response = StreamingHttpResponse(
+            stream(queryset, self.columns, output, settings.EXPORT_CHUNK_SIZE),
+            content_type=EXPORT_FORMATS[output],
+        )
+        stamp = timezone.now().strftime("%Y%m%dT%H%M%SZ")
+        response["Content-Disposition"] = f'attachment; filename="{self.export_name}-{stamp}.{output}"'
+        # Let reverse proxies pass chunks through instead of buffering the file
+        response["X-Accel-Buffering"] = "no"
+        return response
+
+
+class AdminActivityExportView(AdminRequestExportView):
+    """
+    GET /api/admin/activities/export/  → stream activity history (admin only)
+
+    Exports the activities of the requests matched by the request list
+    filters (?status=, ?priority=, ?assigned_to=), optionally narrowed by:
+        - Action:               ?action=STATUS_CHANGED
+        - Output format:        ?output=csv (default) | jsonl
+
+    Ordered by request, then time.
+    """
+
+    columns = ACTIVITY_COLUMNS
+    export_name = "activities"
+
+    def get_export_queryset(self):
+        requests = self.filter_queryset(self.get_queryset()).order_by().values("pk")
+        queryset = RequestActivity.objects.filter(request__in=requests)
+        action = self.request.query_params.get("action")
+        if action:
+            queryset = queryset.filter(action=action)
+        return queryset.order_by("request_id", "timestamp", "id")
+
+
+class AdminChangeFeedView(ChangeFeedView):
+    """
+    GET /api/admin/requests/changes/?since=<cursor>  → changes to all requests (admin only)
+    """
+
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def get_feed_querysets(self, request):
+        return Request.objects.all(), RequestActivity.objects.all(), RequestTombstone.objects.all()
+
+
+class AdminRequestStatsView(APIView):
+    """
+    GET /api/admin/requests/stats/  → request counts (admin only)
+
+    Read from the RequestCounter table, so the cost does not depend on
+    the number of requests.
+    """
+
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def get(self, request):
+        return Response(services.get_request_stats(), status=status.HTTP_200_OK)
+
 
 class AdminRequestDetailView(APIView):
     """
@@ -218,21 +624,17 @@ class AdminRequestDetailView(APIView):
         # Handle priority change
         new_priority = request.data.get("priority")
         if new_priority:
-            valid_priorities = [c[0] for c in Request.Priority.choices]
-            if new_priority not in valid_priorities:
+            try:
+                req = services.change_request_priority(
+                    request_obj=req,
+                    new_priority=new_priority,
+                    changed_by=request.user,
+                )
+            except DjangoValidationError as e:
                 return Response(
-                    {"success": False, "message": f"Invalid priority. Must be one of: {', '.join(valid_priorities)}"},
+                    {"success": False, "message": e.message},
                     status=status.HTTP_400_BAD_REQUEST,
                 )
-            old_priority = req.priority
-            req.priority = new_priority
-            req.save(update_fields=["priority", "updated_at"])
-            services.log_activity(
-                request_obj=req,
-                action=RequestActivity.Action.STATUS_CHANGED,
-                performed_by=request.user,
-                detail=f"Priority changed from {old_priority} to {new_priority}",
-            )
             messages.append(f"Priority updated to {new_priority}")
 
         if not messages:
@@ -245,7 +647,7 @@ class AdminRequestDetailView(APIView):
             {
                 "success": True,
                 "message": ". ".join(messages) + ".",
-                "request": RequestSerializer(req).data,
+                "request": RequestSerializer(req, context={"request": request}).data,
             },
             status=status.HTTP_200_OK,
         )
@@ -259,10 +661,7 @@ class AdminRequestDetailView(APIView):
                 status=status.HTTP_404_NOT_FOUND,
             )
 
-        req_id = req.id
-        req.delete()
-
-        logger.info(f"[ADMIN] Request id={req_id} deleted by {request.user.email}")
+        services.delete_request(request_obj=req, deleted_by=request.user)
 
         return Response(
             {"success": True, "message": "Request deleted successfully."},
@@ -270,6 +669,96 @@ class AdminRequestDetailView(APIView):
         )
 
 
+class AdminBulkStatusView(APIView):
+    """
+    POST /api/admin/requests/bulk-status/  → change status of many requests
+
+    Body: {"ids": [1, 2, 3], "status": "REVIEWING"}
+
+    Valid transitions are applied; the rest are reported per id:
+        {"success": false, "updated": 2, "failed": 1,
+         "results": [{"id": 1, "success": true, "message": "..."}, ...]}
+    """
+
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def post(self, request):
+        serializer = BulkStatusSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        results = services.bulk_change_request_status(
+            request_ids=serializer.validated_data["ids"],
+            new_status=serializer.validated_data["status"],
+            changed_by=request.user,
+        )
+        updated = sum(1 for result in results if result["success"])
+        failed = len(results) - updated
+
+        return Response(
+            {
+                "success": failed == 0,
+                "message": f"{updated} request(s) updated, {failed} failed.",
+                "updated": updated,
+                "failed": failed,
+                "results": results,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class AdminRequestImportView(APIView):
+    """
+    POST /api/admin/requests/import/  → bulk import requests (admin only)
+
+    Body: JSON lines (Content-Type: application/x-ndjson), one request per line:
+        {"user_email": "a@b.com", "title": "...", "description": "...", "priority": "HIGH"}
+
+    Query params:
+        chunk_size=1000   rows per transaction (max 10000)
+        create_users=1    create missing users with a placeholder uid
+        dry_run=1         validate only
+
+    The body is streamed and inserted chunk by chunk; the response is the
+    import report (counts, rows/s and per-line errors).
+    """
+
+    permission_classes = [IsAuthenticated, IsAdminUser]
+    parser_classes = [JSONLinesParser, JSONLParser]
+    max_chunk_size = 10000
+
+    def post(self, request):
+        try:
+            chunk_size = int(request.query_params.get("chunk_size", 1000))
+        except ValueError:
+            chunk_size = 0
+        if not 1 <= chunk_size <= self.max_chunk_size:
+            return Response(
+                {"success": False, "message": f"chunk_size must be between 1 and {self.max_chunk_size}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        report = services.bulk_import_requests(
+            rows=request.data,
+            chunk_size=chunk_size,
+            create_users=request.query_params.get("create_users") in ("1", "true"),
+            dry_run=request.query_params.get("dry_run") in ("1", "true"),
+            imported_by=request.user,
+        )
+        logger.info(
+            f"[ADMIN] Import by {request.user.email}: "
+            f"{report['created']} created, {report['failed']} failed"
+        )
+
+        return Response(
+            {
+                "success": report["failed"] == 0,
+                "message": f"{report['created']} request(s) imported, {report['failed']} failed.",
+                **report,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
 class AdminAssignView(APIView):
     """
     POST /api/admin/requests/<id>/assign/  → assign request to admin user
@@ -291,10 +780,7 @@ class AdminAssignView(APIView):
         serializer = RequestAssignSerializer(data=request.data)
         serializer.is_valid(raise_exception=True)
 
-        assigned_to_id = serializer.validated_data.get("assigned_to")
-        admin_user = None
-        if assigned_to_id is not None:
-            admin_user = User.objects.get(pk=assigned_to_id)
+        admin_user = serializer.validated_data.get("assigned_to")
 
         try:
             req = services.assign_request(
@@ -312,13 +798,51 @@ class AdminAssignView(APIView):
             {
                 "success": True,
                 "message": f"Request assigned to {admin_user.email if admin_user else 'nobody'}.",
-                "request": RequestSerializer(req).data,
+                "request": RequestSerializer(req, context={"request": request}).data,
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+class AdminBulkAssignView(APIView):
+    """
+    POST /api/admin/requests/bulk-assign/  → assign many requests to admin user
+
+    Body: {"ids": [1, 2, 3], "assigned_to": <user_id>}  or  "assigned_to": null
+    to unassign. Terminal/missing requests are reported per id.
+    """
+
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def post(self, request):
+        serializer = BulkAssignSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        admin_user = serializer.validated_data.get("assigned_to")
+        results = services.bulk_assign_requests(
+            request_ids=serializer.validated_data["ids"],
+            admin_user=admin_user,
+            assigned_by=request.user,
+        )
+        updated = sum(1 for result in results if result["success"])
+        failed = len(results) - updated
+
+        return Response(
+            {
+                "success": failed == 0,
+                "message": (
+                    f"{updated} request(s) assigned to "
+                    f"{admin_user.email if admin_user else 'nobody'}, {failed} failed."
+                ),
+                "updated": updated,
+                "failed": failed,
+                "results": results,
             },
             status=status.HTTP_200_OK,
         )
 
 
-class AdminRequestActivitiesView(ListAPIView):
+class AdminRequestActivitiesView(ReplicaReadMixin, ConditionalListMixin, ListAPIView):
     """
     GET /api/admin/requests/<id>/activities/  → activity log (admin only)
     """
@@ -330,3 +854,127 @@ class AdminRequestActivitiesView(ListAPIView):
         return RequestActivity.objects.filter(
             request_id=self.kwargs["pk"],
         ).select_related("performed_by")
+
+
+class AdminMetricsView(APIView):
+    """
+    GET /api/admin/metrics/  → in-process cache and pool statistics (admin only)
+
+    Counters are per worker process and reset on restart.
+    """
+
+    permission_classes = [IsAuthenticated, IsAdminUser]
+
+    def get(self, request):
+        return Response(
+            {
+                "auth": {
+                    "token_cache": token_cache.stats(),
+                    "user_cache": user_cache.stats(),
+                    "verifier": get_token_verifier().stats(),
+                },
+                "response_cache": response_cache.stats.as_dict(),
+                "events": events.bus.stats(),
+                "activity_log": activity_log.writer.stats(),
+                "db_pools": db_pool.pool_stats(),
+                "sqlite": db_sqlite.stats(),
+            },
+            status=status.HTTP_200_OK,
+        )
+
+
+# ═══════════════════════════════════════════════════════════════════
+#  Live Events (Server-Sent Events)
+# ═══════════════════════════════════════════════════════════════════
+
+
+async def event_stream(request):
+    """
+    GET /api/events/?token=<id token>  → live request events (ASGI only)
+
+    EventSource cannot set headers, so the token may be passed as ?token=
+    as well as in the usual Authorization: Bearer header. Keep query
+    strings out of access logs when using it.
+
+    Users receive events for their own requests, admins for all of them
+    (event types in core.events). The stream sends a keepalive comment
+    every EVENT_STREAM_HEARTBEAT_SECONDS and ends after
+    EVENT_STREAM_MAX_SECONDS; EventSource then reconnects with
+    Last-Event-ID and is sent what it missed, or a "resync" event when
+    that is not possible (reload the lists, or use the change feed).
+    """
+    if request.method != "GET":
+        return JsonResponse({"detail": f'Method "{request.method}" not allowed.'}, status=405)
+    if not isinstance(request, ASGIRequest):
+        return JsonResponse(
+            {"success": False, "message": "The event stream requires an ASGI server."},
+            status=501,
+        )
+
+    token = request.GET.get("token")
+    if not token:
+        parts = request.headers.get("Authorization", "").split()
+        if len(parts) == 2 and parts[0].lower() == "bearer":
+            token = parts[1]
+    if not token:
+        return JsonResponse(
+            {"detail": "Authentication credentials were not provided."}, status=401
+        )
+    try:
+        user, _ = await sync_to_async(FirebaseAuthentication().authenticate_credentials)(token)
+    except exceptions.AuthenticationFailed as e:
+        return JsonResponse({"detail": str(e.detail)}, status=401)
+
+    last_event_id = request.headers.get("Last-Event-ID") or request.GET.get("last_event_id")
+    response = StreamingHttpResponse(
+        _sse_messages(user, last_event_id), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+def _sse_message(event_type, data, event_id=None):
+    lines = [f"id: {event_id}"] if event_id else []
+    lines += [f"event: {event_type}", f"data: {json.dumps(data, separators=(',', ':'))}"]
+    return "\n".join(lines) + "\n\n"
+
+
+async def _sse_messages(user, last_event_id):
+    """Yield SSE messages for `user` until EVENT_STREAM_MAX_SECONDS pass."""
+    is_admin = user.is_admin()
+
+    def visible(event):
+        return is_admin or event.data.get("owner") == user.pk
+
+    # Subscribe before replaying so nothing published in between is lost
+    subscription = events.bus.subscribe()
+    if settings.EVENT_STREAM_BACKEND == "poll":
+        events.poller.ensure_running()
+    try:
+        yield "retry: 3000\n\n"
+
+        replayed_up_to = 0
+        if last_event_id:
+            backlog = events.bus.replay(last_event_id)
+            if backlog is None:
+                yield _sse_message("resync", {})
+            else:
+                for event in backlog:
+                    replayed_up_to = event.seq
+                    if visible(event):
+                        yield _sse_message(event.type, event.data, event.id)
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + settings.EVENT_STREAM_MAX_SECONDS
+        while (remaining := deadline - loop.time()) > 0:
+            event = await subscription.get(min(settings.EVENT_STREAM_HEARTBEAT_SECONDS, remaining))
+            if subscription.overflowed:
+                yield _sse_message("resync", {})
+                return
+            if event is None:
+                yield ": keepalive\n\n"
+            elif event.seq > replayed_up_to and visible(event):
+                yield _sse_message(event.type, event.data, event.id)
+    finally:
+        events.bus.unsubscribe(subscription)
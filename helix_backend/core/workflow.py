@@ -0,0 +1,139 @@
+"""
+Request workflow for Helix backend.
+
+The workflow is declared once in RULES and compiled into `workflow`, the
+single source of truth for services, serializers, views and admin:
+
+    PENDING → REVIEWING → IN_PROGRESS → COMPLETED → DELIVERED → CLOSED
+       ↘ REJECTED ↙
+    CANCELLED: by an admin from any non-terminal state, by the owner
+               while the request is PENDING or REVIEWING
+
+Each rule names the roles that may take it; USER rules apply to the
+owner of the request only. Statuses with no outgoing rule are terminal.
+
+Compiled lookups are frozensets and tuples built at import, so checking
+a transition or listing the next statuses of a row is one dict lookup:
+
+    workflow.check(current, target, role)   → error message or None
+    workflow.validate(current, target, role) → raises ValidationError
+    workflow.next_statuses(role)            → {status: (targets...)}
+    workflow.terminal                       → frozenset of statuses
+"""
+
+from collections import namedtuple
+
+from django.core.exceptions import ValidationError
+
+from core.models import Request, User
+
+Status = Request.Status
+ADMIN = frozenset({User.Role.ADMIN})
+ADMIN_OR_OWNER = frozenset({User.Role.ADMIN, User.Role.USER})
+
+Rule = namedtuple("Rule", ["source", "target", "roles"])
+
+# Order matters: allowed transitions are listed (and shown to clients) in
+# the order they are declared here
+RULES = (
+    Rule(Status.PENDING, Status.REVIEWING, ADMIN),
+    Rule(Status.PENDING, Status.REJECTED, ADMIN),
+    Rule(Status.PENDING, Status.CANCELLED, ADMIN_OR_OWNER),
+    Rule(Status.REVIEWING, Status.IN_PROGRESS, ADMIN),
+    Rule(Status.REVIEWING, Status.REJECTED, ADMIN),
+    Rule(Status.REVIEWING, Status.CANCELLED, ADMIN_OR_OWNER),
+    Rule(Status.IN_PROGRESS, Status.COMPLETED, ADMIN),
+    Rule(Status.IN_PROGRESS, Status.CANCELLED, ADMIN),
+    Rule(Status.COMPLETED, Status.DELIVERED, ADMIN),
+    Rule(Status.DELIVERED, Status.CLOSED, ADMIN),
+)
+
+
+class Workflow:
+    """
+    A state machine compiled from (source, target, roles) rules.
+
+    Args:
+        statuses: every status, including terminal ones
+        rules:    iterable of Rule
+        roles:    every role that may act on a request
+    """
+
+    def __init__(self, statuses, rules, roles):
+        statuses = tuple(statuses)
+        rules = tuple(rules)
+        for rule in rules:
+            if rule.source not in statuses or rule.target not in statuses:
+                raise ValueError(f"Unknown status in workflow rule {rule}.")
+
+        # status → targets in declaration order, for any role / per role
+        self._targets = {
+            status: tuple(rule.target for rule in rules if rule.source == status)
+            for status in statuses
+        }
+        self._next = {
+            role: {
+                status: tuple(
+                    rule.target for rule in rules if rule.source == status and role in rule.roles
+                )
+                for status in statuses
+            }
+            for role in roles
+        }
+        self._allowed = {
+            role: {status: frozenset(targets) for status, targets in by_status.items()}
+            for role, by_status in self._next.items()
+        }
+        self._no_targets = {status: () for status in statuses}
+
+        self.statuses = statuses
+        self.transitions = {
+            status: frozenset(targets) for status, targets in self._targets.items()
+        }
+        self.terminal = frozenset(
+            status for status, targets in self._targets.items() if not targets
+        )
+
+    def is_terminal(self, status):
+        return status in self.terminal
+
+    def can(self, current, target, role):
+        allowed = self._allowed.get(role)
+        return allowed is not None and target in allowed.get(current, ())
+
+    def check(self, current, target, role):
+        """Return why `role` may not move `current` to `target`, or None if it may."""
+        if self.can(current, target, role):
+            return None
+        allowed = self._next.get(role, self._no_targets).get(current, ())
+        if target in self.transitions.get(current, ()):
+            return f"Your role cannot transition a request from {current} to {target}."
+        allowed_display = ", ".join(allowed) if allowed else "none (terminal state)"
+        return (
+            f"Cannot transition from {current} to {target}. "
+            f"Allowed transitions: {allowed_display}"
+        )
+
+    def validate(self, current, target, role):
+        """
+        Raises:
+            ValidationError if `role` may not move `current` to `target`.
+        """
+        error = self.check(current, target, role)
+        if error:
+            raise ValidationError(error)
+
+    def next_statuses(self, role):
+        """{status: (targets...)} for `role`; every tuple is empty for unknown roles."""
+        return self._next.get(role, self._no_targets)
+
+    def actor_role(self, user, request_obj):
+        """The role `user` acts with on `request_obj` (None: not theirs to change)."""
+        if user.is_admin():
+            return User.Role.ADMIN
+        if request_obj.user_id == user.pk:
+            return user.role
+        return None
+
+
+workflow = Workflow(Status.values, RULES, User.Role.values)
@@ -1,3 +0,0 @@
-from core.firebase import initialize_firebase
-
-initialize_firebase()
@@ -66,14 +66,108 @@ TEMPLATES = [
 
 WSGI_APPLICATION = 'helix_backend.wsgi.application'
 
-# Database Configuration
+# ═══════════════════════════════════════════════════════════════════
+#  Database
+# ═══════════════════════════════════════════════════════════════════
+
+DATABASE_ENGINE = config('DATABASE_ENGINE', default='django.db.backends.sqlite3')
+
+# Connection pool (core.db.pool): the Postgres and SQLite backends are
+# swapped for pooled ones that keep up to DATABASE_POOL_MAX_SIZE
+# connections per process. Leave DATABASE_CONN_MAX_AGE at 0 with a pool:
+# each request then returns its connection to the pool when it finishes.
+# Without a pool, DATABASE_CONN_MAX_AGE > 0 keeps one persistent
+# connection per thread instead.
+DATABASE_POOL = config('DATABASE_POOL', default=False, cast=bool)
+POOLED_ENGINES = {
+    'django.db.backends.postgresql': 'core.db.backends.postgresql',
+    'django.db.backends.sqlite3': 'core.db.backends.sqlite3',
+}
+if DATABASE_POOL:
+    DATABASE_ENGINE = POOLED_ENGINES.get(DATABASE_ENGINE, DATABASE_ENGINE)
+
 DATABASES = {
     'default': {
-        'ENGINE': config('DATABASE_ENGINE', default='django.db.backends.sqlite3'),
+        'ENGINE': DATABASE_ENGINE,
         'NAME': config('DATABASE_NAME', default=str(BASE_DIR / 'db.sqlite3')),
+        'USER': config('DATABASE_USER', default=''),
+        'PASSWORD': config('DATABASE_PASSWORD', default=''),
+        'HOST': config('DATABASE_HOST', default=''),
+        'PORT': config('DATABASE_PORT', default=''),
+        'CONN_MAX_AGE': config('DATABASE_CONN_MAX_AGE', default=0, cast=int),
+        # Ping a persistent connection before reusing it for a new request
+        'CONN_HEALTH_CHECKS': config('DATABASE_CONN_HEALTH_CHECKS', default=False, cast=bool),
+        'POOL': {
+            'MAX_SIZE': config('DATABASE_POOL_MAX_SIZE', default=10, cast=int),
+            # Seconds to wait for a free connection before PoolTimeout
+            'TIMEOUT': config('DATABASE_POOL_TIMEOUT', default=5.0, cast=float),
+            # Free connections are closed after this many idle seconds ...
+            'MAX_IDLE': config('DATABASE_POOL_MAX_IDLE', default=300.0, cast=float),
+            # ... and any connection after this many seconds in total
+            'MAX_LIFETIME': config('DATABASE_POOL_MAX_LIFETIME', default=1800.0, cast=float),
+            # Free connections idle longer than this are pinged before reuse
+            'HEALTH_CHECK_AFTER': config('DATABASE_POOL_HEALTH_CHECK_AFTER', default=30.0, cast=float),
+        },
+    }
+}
+
+# SQLite tests use a database file rather than the default in-memory one:
+# the concurrency tests (core.tests) run threads, and a shared-cache
+# memory database fails their reads with "database table is locked"
+if DATABASE_ENGINE.endswith('sqlite3'):
+    DATABASES['default']['TEST'] = {'NAME': str(BASE_DIR / 'test_db.sqlite3')}
+
+# ═══════════════════════════════════════════════════════════════════
+#  Read replica
+# ═══════════════════════════════════════════════════════════════════
+
+# Setting DATABASE_REPLICA_HOST (or DATABASE_REPLICA_NAME, e.g. a copy of
+# the SQLite file for local testing) adds a "replica" alias; its other
+# connection settings default to the primary's. core.db.routers then
+# sends the GET handlers of the list, activity and auth/me views to it.
+DATABASE_REPLICA_HOST = config('DATABASE_REPLICA_HOST', default='')
+DATABASE_REPLICA_NAME = config('DATABASE_REPLICA_NAME', default='')
+if DATABASE_REPLICA_HOST or DATABASE_REPLICA_NAME:
+    DATABASES['replica'] = {
+        **DATABASES['default'],
+        'NAME': DATABASE_REPLICA_NAME or DATABASES['default']['NAME'],
+        'HOST': DATABASE_REPLICA_HOST or DATABASES['default']['HOST'],
+        'PORT': config('DATABASE_REPLICA_PORT', default=DATABASES['default']['PORT']),
+        'USER': config('DATABASE_REPLICA_USER', default=DATABASES['default']['USER']),
+        'PASSWORD': config('DATABASE_REPLICA_PASSWORD', default=DATABASES['default']['PASSWORD']),
+        'TEST': {'MIRROR': 'default'},
     }
+    DATABASE_ROUTERS = ['core.db.routers.ReplicaRouter']
+
+# After a user writes, their reads stay on the primary this long so they
+# see their own changes; keep it above the usual replication lag
+READ_REPLICA_STICKY_SECONDS = config('READ_REPLICA_STICKY_SECONDS', default=5.0, cast=float)
+
+# ═══════════════════════════════════════════════════════════════════
+#  SQLite
+# ═══════════════════════════════════════════════════════════════════
+
+# Opt-in profile for single-node deployments on SQLite, applied to every
+# connection (core.db.sqlite). WAL lets readers run alongside the single
+# writer; synchronous=NORMAL is safe in WAL mode (a power loss can only
+# drop the last commits, not corrupt the file); writers wait up to
+# busy_timeout ms for the write lock instead of failing at once.
+SQLITE_TUNED = config('SQLITE_TUNED', default=False, cast=bool)
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': config('SQLITE_BUSY_TIMEOUT', default=5000, cast=int),
+    'mmap_size': config('SQLITE_MMAP_SIZE', default=256 * 1024 * 1024, cast=int),
+    # Negative: in KiB rather than pages
+    'cache_size': config('SQLITE_CACHE_SIZE', default=-64 * 1024, cast=int),
 }
 
+# Service-layer writes that still fail with "database is locked" are
+# retried this many times, with or without the profile. The first retry
+# waits about SQLITE_LOCK_BACKOFF seconds, doubling each time.
+SQLITE_LOCK_RETRIES = config('SQLITE_LOCK_RETRIES', default=6, cast=int)
+SQLITE_LOCK_BACKOFF = config('SQLITE_LOCK_BACKOFF', default=0.02, cast=float)
+
 # Password validation
 AUTH_PASSWORD_VALIDATORS = [
     {'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator'},
@@ -95,6 +189,36 @@ STATIC_ROOT = BASE_DIR / 'staticfiles'
 # Default primary key
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
+# ═══════════════════════════════════════════════════════════════════
+#  Cache
+# ═══════════════════════════════════════════════════════════════════
+
+# locmem is per process: the response cache and the replica stickiness
+# keys need the file backend, shared by all worker processes (system
+# checks core.E001 / core.E002)
+CACHE_BACKEND = config('CACHE_BACKEND', default='locmem')
+CACHE_LOCATION = config('CACHE_LOCATION', default=str(BASE_DIR / '.cache'))
+
+CACHES = {
+    'default': {
+        'BACKEND': {
+            'locmem': 'django.core.cache.backends.locmem.LocMemCache',
+            'file': 'django.core.cache.backends.filebased.FileBasedCache',
+        }[CACHE_BACKEND],
+        'LOCATION': CACHE_LOCATION if CACHE_BACKEND == 'file' else 'helix',
+        'OPTIONS': {
+            'MAX_ENTRIES': config('CACHE_MAX_ENTRIES', default=5000, cast=int),
+        },
+    }
+}
+
+# Seconds a rendered list page stays cached (0 disables the response
+# cache); entries are invalidated on every write regardless. Off unless
+# the cache is shared
+RESPONSE_CACHE_TTL = config(
+    'RESPONSE_CACHE_TTL', default=0 if CACHE_BACKEND == 'locmem' else 60, cast=int
+)
+
 # ═══════════════════════════════════════════════════════════════════
 #  Django REST Framework
 # ═══════════════════════════════════════════════════════════════════
@@ -106,13 +230,15 @@ REST_FRAMEWORK = {
     'DEFAULT_PERMISSION_CLASSES': [
         'rest_framework.permissions.IsAuthenticated',
     ],
+    # orjson-backed when installed (see JSON_BACKEND), stdlib json otherwise
     'DEFAULT_RENDERER_CLASSES': [
-        'rest_framework.renderers.JSONRenderer',
+        'core.renderers.FastJSONRenderer',
     ],
     'DEFAULT_PARSER_CLASSES': [
-        'rest_framework.parsers.JSONParser',
+        'core.parsers.FastJSONParser',
     ],
-    'DEFAULT_PAGINATION_CLASS': 'rest_framework.pagination.PageNumberPagination',
+    # Cursor (keyset) pagination; send ?page=N for page numbers + count
+    'DEFAULT_PAGINATION_CLASS': 'core.pagination.KeysetPagination',
     'PAGE_SIZE': 20,
     'DEFAULT_FILTER_BACKENDS': [
         'django_filters.rest_framework.DjangoFilterBackend',
@@ -120,6 +246,109 @@ REST_FRAMEWORK = {
     ],
 }
 
+# JSON backend for the API renderer/parser: auto (orjson if installed),
+# orjson, or stdlib
+JSON_BACKEND = config('JSON_BACKEND', default='auto')
+
+# Page-number mode of the admin request list: counts up to this many rows
+# exactly; larger totals are served from a cache refreshed in the background
+# every TTL seconds (a lower bound is reported until the first refresh)
+LIST_EXACT_COUNT_THRESHOLD = config('LIST_EXACT_COUNT_THRESHOLD', default=10000, cast=int)
+LIST_COUNT_CACHE_TTL = config('LIST_COUNT_CACHE_TTL', default=60, cast=int)
+# Background refreshes: worker threads per process, distinct queries
+# queued or running at most (further misses skip the refresh), and the
+# statement timeout of each count in seconds
+LIST_COUNT_WORKERS = config('LIST_COUNT_WORKERS', default=1, cast=int)
+LIST_COUNT_MAX_QUEUED = config('LIST_COUNT_MAX_QUEUED', default=16, cast=int)
+LIST_COUNT_TIMEOUT = config('LIST_COUNT_TIMEOUT', default=10.0, cast=float)
+
+# Change feed (/api/requests/changes/): rows per stream per call and how
+# long deletions are remembered (older cursors must resync)
+CHANGE_FEED_LIMIT = config('CHANGE_FEED_LIMIT', default=500, cast=int)
+CHANGE_FEED_TOMBSTONE_DAYS = config('CHANGE_FEED_TOMBSTONE_DAYS', default=30, cast=int)
+
+# Serve /api/auth/me/, the request lists and the activity lists with the
+# async views in core.async_views. Only useful under an ASGI server
+ASYNC_VIEWS = config('ASYNC_VIEWS', default=False, cast=bool)
+
+# Live event stream (/api/events/, ASGI only). memory: the service layer
+# publishes to an in-process bus (single worker process); poll: each
+# process polls the change feed every EVENT_STREAM_POLL_INTERVAL seconds,
+# so events reach clients connected to any worker
+EVENT_STREAM_BACKEND = config('EVENT_STREAM_BACKEND', default='memory')
+EVENT_STREAM_POLL_INTERVAL = config('EVENT_STREAM_POLL_INTERVAL', default=2.0, cast=float)
+EVENT_STREAM_HEARTBEAT_SECONDS = config('EVENT_STREAM_HEARTBEAT_SECONDS', default=15, cast=float)
+# Connections are closed after this long; EventSource reconnects with Last-Event-ID
+EVENT_STREAM_MAX_SECONDS = config('EVENT_STREAM_MAX_SECONDS', default=300, cast=float)
+EVENT_STREAM_REPLAY_SIZE = config('EVENT_STREAM_REPLAY_SIZE', default=1000, cast=int)
+EVENT_STREAM_QUEUE_SIZE = config('EVENT_STREAM_QUEUE_SIZE', default=256, cast=int)
+
+# Rows fetched from the database per round trip by the streaming exports
+EXPORT_CHUNK_SIZE = config('EXPORT_CHUNK_SIZE', default=2000, cast=int)
+
+# Activity log writes (core.activity_log): sync inserts in the mutation's
+# transaction; buffered queues entries after commit and bulk-inserts them
+# every ACTIVITY_LOG_FLUSH_INTERVAL seconds, at ACTIVITY_LOG_BATCH_SIZE
+# entries, when a request finishes and at exit. Queued entries are spooled
+# to ACTIVITY_LOG_SPOOL_DIR (replayed after a crash); while inserts fail or
+# ACTIVITY_LOG_MAX_PENDING entries are queued, entries are inserted in the
+# mutation's transaction instead
+ACTIVITY_LOG_MODE = config('ACTIVITY_LOG_MODE', default='sync')
+ACTIVITY_LOG_BATCH_SIZE = config('ACTIVITY_LOG_BATCH_SIZE', default=100, cast=int)
+ACTIVITY_LOG_FLUSH_INTERVAL = config('ACTIVITY_LOG_FLUSH_INTERVAL', default=1.0, cast=float)
+ACTIVITY_LOG_MAX_PENDING = config('ACTIVITY_LOG_MAX_PENDING', default=10000, cast=int)
+ACTIVITY_LOG_SPOOL_DIR = config('ACTIVITY_LOG_SPOOL_DIR', default=str(BASE_DIR / 'activity_spool'))
+
+# ═══════════════════════════════════════════════════════════════════
+#  Authentication
+# ═══════════════════════════════════════════════════════════════════
+
+# Max number of verified ID tokens kept in the in-process cache (0 disables it)
+AUTH_TOKEN_CACHE_SIZE = config('AUTH_TOKEN_CACHE_SIZE', default=4096, cast=int)
+
+# uid → User cache used by the authentication fast path (size 0 disables it).
+# Entries are invalidated on User save/delete; the TTL bounds staleness for
+# changes made by other worker processes.
+AUTH_USER_CACHE_SIZE = config('AUTH_USER_CACHE_SIZE', default=4096, cast=int)
+AUTH_USER_CACHE_TTL = config('AUTH_USER_CACHE_TTL', default=60, cast=int)
+
+# Identity backend: "firebase" (production default) or "local", a stand-in
+# that mints/verifies tokens with a local key for load tests and benchmarks
+# (see core/identity.py). "local" is refused when DEBUG=False.
+IDENTITY_BACKEND = config('IDENTITY_BACKEND', default='firebase')
+IDENTITY_LOCAL_ALGORITHM = config('IDENTITY_LOCAL_ALGORITHM', default='HS256')
+# HS256 secret (required with the local backend; never SECRET_KEY)
+IDENTITY_LOCAL_SECRET = config('IDENTITY_LOCAL_SECRET', default='')
+# RS256 keys; the public key is derived from the private key when not given
+IDENTITY_LOCAL_PRIVATE_KEY_FILE = config('IDENTITY_LOCAL_PRIVATE_KEY_FILE', default='')
+IDENTITY_LOCAL_PUBLIC_KEY_FILE = config('IDENTITY_LOCAL_PUBLIC_KEY_FILE', default='')
+IDENTITY_LOCAL_ISSUER = config('IDENTITY_LOCAL_ISSUER', default='helix-local')
+IDENTITY_LOCAL_AUDIENCE = config('IDENTITY_LOCAL_AUDIENCE', default='helix-local')
+IDENTITY_LOCAL_TOKEN_TTL = config('IDENTITY_LOCAL_TOKEN_TTL', default=3600, cast=int)
+
+# Load the token verifier (Firebase SDK / signing keys) when a WSGI/ASGI
+# worker boots instead of on the first authenticated request
+AUTH_WARM_UP = config('AUTH_WARM_UP', default=False, cast=bool)
+
+# Firebase ID token verifier: "firebase_sdk" (firebase_admin) or "local" (RS256
+# against the signing key store below, see core/keystore.py)
+AUTH_TOKEN_VERIFIER = config('AUTH_TOKEN_VERIFIER', default='firebase_sdk')
+AUTH_TOKEN_LEEWAY = config('AUTH_TOKEN_LEEWAY', default=0, cast=int)
+FIREBASE_PROJECT_ID = config('FIREBASE_PROJECT_ID', default='')
+
+# Signing key source for the local verifier: url | file | env | fixtures
+AUTH_SIGNING_KEYS_SOURCE = config('AUTH_SIGNING_KEYS_SOURCE', default='url')
+AUTH_SIGNING_KEYS_URL = config(
+    'AUTH_SIGNING_KEYS_URL',
+    default='https://www.googleapis.com/robot/v1/metadata/x509/securetoken@system.gserviceaccount.com',
+)
+# Key file for the "file" source; also where the "url" source mirrors fetched keys
+AUTH_SIGNING_KEYS_FILE = config('AUTH_SIGNING_KEYS_FILE', default=str(BASE_DIR / 'signing_keys.json'))
+# JSON {kid: pem} bundle for the "env" source
+AUTH_SIGNING_KEYS_BUNDLE = config('AUTH_SIGNING_KEYS_BUNDLE', default='')
+# Directory of <kid>.pem files for the "fixtures" source (tests / load tests)
+AUTH_SIGNING_KEYS_FIXTURE_DIR = config('AUTH_SIGNING_KEYS_FIXTURE_DIR', default='')
+
 # ═══════════════════════════════════════════════════════════════════
 #  CORS
 # ═══════════════════════════════════════════════════════════════════
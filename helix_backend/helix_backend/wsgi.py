@@ -1,11 +1,20 @@
 """
 WSGI config for helix_backend project.
+
+Set AUTH_WARM_UP=True to load the token verifier when the worker boots
+rather than on the first authenticated request.
 """
 
 import os
 
+from django.conf import settings
 from django.core.wsgi import get_wsgi_application
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'helix_backend.settings')
 
 application = get_wsgi_application()
+
+if settings.AUTH_WARM_UP:
+    from core.authentication import warm_up
+
+    warm_up()